@@ -9,6 +9,10 @@ Requires code-rag to be installed:
     pip install -e /path/to/code-rag
 """
 
+import gc
+import shutil
+from pathlib import Path
+
 from code_rag.chunker import walk_codebase
 from code_rag.embedder import Embedder
 from code_rag.store import VectorStore
@@ -35,11 +39,20 @@ class CodeRAGAdapter(RAGSystem):
         self.collection_name = collection_name
         self.data_dir = data_dir
         self.embedder = Embedder()
-        self.store = VectorStore(
-            collection_name=collection_name,
-            data_dir=data_dir,
+        self.store = self._open_store()
+
+    def _open_store(self) -> VectorStore:
+        return VectorStore(
+            collection_name=self.collection_name,
+            data_dir=self.data_dir,
         )
 
+    def _release_store(self) -> None:
+        # ChromaDB has no public close; drop the store before its files are copied or
+        # replaced so this adapter does not write to them mid-copy.
+        self.store = None
+        gc.collect()
+
     def ingest(self, repo_path: str) -> None:
         """Ingest a repository by chunking, embedding, and storing."""
         # Clear any existing data for a clean evaluation
@@ -63,6 +76,16 @@ class CodeRAGAdapter(RAGSystem):
         query_embedding = self.embedder.embed_text(query)
 
         # Search for similar chunks
+        return self._search(query_embedding, top_k)
+
+    def query_batch(self, queries: list[str], top_k: int = 10) -> list[list[CodeChunk]]:
+        """Embed all queries in one call, then search the store for each embedding."""
+        if not queries:
+            return []
+        query_embeddings = self.embedder.embed_batch(queries)
+        return [self._search(embedding, top_k) for embedding in query_embeddings]
+
+    def _search(self, query_embedding, top_k: int) -> list[CodeChunk]:
         results = self.store.search(query_embedding, top_k=top_k)
 
         # Convert SearchResult objects to CodeChunk objects
@@ -78,6 +101,21 @@ class CodeRAGAdapter(RAGSystem):
             for result in results
         ]
 
+    def save_index(self, path: str) -> None:
+        """Snapshot the persisted ChromaDB directory with the store closed."""
+        self._release_store()
+        try:
+            shutil.copytree(self.data_dir, Path(path) / "chroma")
+        finally:
+            self.store = self._open_store()
+
+    def load_index(self, path: str) -> None:
+        """Replace the ChromaDB directory with a snapshot and reopen the store."""
+        self._release_store()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        shutil.copytree(Path(path) / "chroma", self.data_dir)
+        self.store = self._open_store()
+
     def clear(self) -> None:
         """Clear the vector store."""
         self.store.clear()
@@ -1,57 +1,216 @@
+import json
+import math
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+
 from rag_eval.interfaces import RAGSystem
 from rag_eval.models import CodeChunk
+from rag_eval.walker import DEFAULT_MAX_BYTES, walk_repo
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|[0-9]+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+@lru_cache(maxsize=1 << 16)
+def _word_tokens(word: str) -> tuple[str, ...]:
+    lowered = word.lower()
+    parts = [part.lower() for piece in word.split("_") for part in _CAMEL_PART.findall(piece)]
+    return (lowered,) if parts == [lowered] else (lowered, *parts)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased identifiers plus their snake_case and camelCase parts."""
+    return [token for word in _IDENTIFIER.findall(text) for token in _word_tokens(word)]
 
 
 class SimpleGrepRAG(RAGSystem):
-    """A naive keyword search adapter for demonstration purposes."""
+    """A small BM25 keyword search adapter, useful as a fast local baseline.
 
-    def __init__(self) -> None:
+    `ingest` splits every file into overlapping windows of `window` lines, `stride` lines
+    apart, and builds an inverted index from token to the windows containing it. A query
+    only touches the postings of its own tokens, so its cost depends on how common those
+    tokens are rather than on the size of the repo. `update` re-indexes only the files that
+    changed; windows of the old content leave unused ids behind until the next `ingest`.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        stride: int = 10,
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_file_bytes: int | None = DEFAULT_MAX_BYTES,
+    ) -> None:
+        if window < 1 or not 1 <= stride <= window:
+            raise ValueError("window must be >= 1 and stride must be between 1 and window")
+        self.window = window
+        self.stride = stride
+        self.k1 = k1
+        self.b = b
+        # Larger files are not indexed; None indexes every text file.
+        self.max_file_bytes = max_file_bytes
         self.repo_path: Path | None = None
-        self._files: list[tuple[Path, list[str]]] = []
+        # A deleted file keeps its slot with no lines, so file indexes stay stable.
+        self._files: list[tuple[str, list[str]]] = []
+        # Window id -> (file index, first line index, end line index exclusive), or None for
+        # a window whose file changed since ingest.
+        self._windows: list[tuple[int, int, int] | None] = []
+        self._lengths: list[int] = []
+        # Token -> flat [window id, term frequency, window id, term frequency, ...].
+        self._postings: dict[str, list[int]] = {}
+        # Live window count and mean token count, for BM25 length normalization.
+        self._live_windows = 0
+        self._avg_length = 0.0
 
     def ingest(self, repo_path: str) -> None:
         self.repo_path = Path(repo_path)
-        self._files.clear()
+        files = walk_repo(self.repo_path, max_bytes=self.max_file_bytes)
+        self._files = [(f.path, f.text.splitlines()) for f in files]
+        self._build_index()
 
-        for path in self.repo_path.rglob("*"):
-            if not path.is_file():
-                continue
-            try:
-                text = path.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, OSError):
+    def _build_index(self) -> None:
+        self._windows, self._lengths = [], []
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for file_index in range(len(self._files)):
+            self._index_file(file_index, postings)
+        self._postings = dict(postings)
+        self._refresh_stats()
+
+    def _index_file(self, file_index: int, postings: defaultdict[str, list[int]]) -> None:
+        lines = self._files[file_index][1]
+        line_tokens = [tokenize(line) for line in lines]
+        last_start = max(len(lines) - self.window, 0)
+        starts = list(range(0, last_start + 1, self.stride))
+        if starts[-1] != last_start:
+            # Make sure the tail of the file gets a window of its own.
+            starts.append(last_start)
+        for start in starts:
+            end = min(start + self.window, len(lines))
+            counts = Counter(chain.from_iterable(line_tokens[start:end]))
+            if not counts:
                 continue
-            self._files.append((path, text.splitlines()))
+            window_id = len(self._windows)
+            self._windows.append((file_index, start, end))
+            self._lengths.append(sum(counts.values()))
+            for token, count in counts.items():
+                postings[token].extend((window_id, count))
+
+    def _refresh_stats(self) -> None:
+        self._live_windows = len(self._windows) - self._windows.count(None)
+        self._avg_length = sum(self._lengths) / self._live_windows if self._live_windows else 0.0
+
+    def update(self, changed: list[str], deleted: list[str], repo_path: str) -> None:
+        if self.repo_path is None:
+            raise RuntimeError("ingest() must be called before update().")
+        self.repo_path = Path(repo_path)
+        positions = {rel_path: index for index, (rel_path, _) in enumerate(self._files)}
+        stale = {positions[path] for path in (*changed, *deleted) if path in positions}
+
+        # Only the posting lists of tokens in the old text of stale files can point at their
+        # windows, so those are the only lists that need filtering.
+        dropped = {
+            window_id
+            for window_id, window in enumerate(self._windows)
+            if window is not None and window[0] in stale
+        }
+        tokens = {
+            token for index in stale for line in self._files[index][1] for token in tokenize(line)
+        }
+        for token in tokens:
+            old = self._postings.get(token, [])
+            kept = [
+                value
+                for i in range(0, len(old), 2)
+                if old[i] not in dropped
+                for value in old[i : i + 2]
+            ]
+            if kept:
+                self._postings[token] = kept
+            else:
+                self._postings.pop(token, None)
+        for window_id in dropped:
+            self._windows[window_id] = None
+            self._lengths[window_id] = 0
+        for index in stale:
+            self._files[index] = (self._files[index][0], [])
+
+        postings: defaultdict[str, list[int]] = defaultdict(list, self._postings)
+        for repo_file in walk_repo(self.repo_path, max_bytes=self.max_file_bytes, paths=changed):
+            index = positions.get(repo_file.path)
+            if index is None:
+                index = positions[repo_file.path] = len(self._files)
+                self._files.append((repo_file.path, []))
+            self._files[index] = (repo_file.path, repo_file.text.splitlines())
+            self._index_file(index, postings)
+        self._postings = dict(postings)
+        self._refresh_stats()
+
+    def save_index(self, path: str) -> None:
+        if self.repo_path is None:
+            raise RuntimeError("ingest() must be called before save_index().")
+        payload = {
+            "repo_path": str(self.repo_path),
+            "files": self._files,
+            "windows": self._windows,
+            "lengths": self._lengths,
+            "postings": self._postings,
+        }
+        (Path(path) / "index.json").write_text(json.dumps(payload))
+
+    def load_index(self, path: str) -> None:
+        payload = json.loads((Path(path) / "index.json").read_text())
+        self.repo_path = Path(payload["repo_path"])
+        self._files = [(rel_path, lines) for rel_path, lines in payload["files"]]
+        self._windows = [tuple(window) if window else None for window in payload["windows"]]
+        self._lengths = payload["lengths"]
+        self._postings = payload["postings"]
+        self._refresh_stats()
 
     def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
         if self.repo_path is None:
             raise RuntimeError("ingest() must be called before query().")
 
-        terms = [t.lower() for t in query.split() if t.strip()]
-        if not terms:
+        terms = set(tokenize(query))
+        if not terms or not self._live_windows:
             return []
 
-        scored: list[tuple[float, CodeChunk]] = []
-        for path, lines in self._files:
-            lowered = [line.lower() for line in lines]
-            score = sum(line.count(term) for term in terms for line in lowered)
-            if score <= 0:
+        total = self._live_windows
+        avg_length = self._avg_length
+        scores: dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
                 continue
+            frequency = len(postings) // 2
+            idf = math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for i in range(0, len(postings), 2):
+                window_id, count = postings[i], postings[i + 1]
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[window_id] / avg_length)
+                gain = idf * count * (self.k1 + 1) / (count + norm)
+                scores[window_id] = scores.get(window_id, 0.0) + gain
 
-            start_idx = next(
-                (idx for idx, line in enumerate(lowered) if any(term in line for term in terms)),
-                0,
-            )
-            end_idx = min(start_idx + 20, len(lines))
-            chunk = CodeChunk(
-                file_path=str(path.relative_to(self.repo_path)),
-                start_line=start_idx + 1,
-                end_line=end_idx,
-                content="\n".join(lines[start_idx:end_idx]),
-                score=float(score),
+        chunks: list[CodeChunk] = []
+        taken: dict[int, list[tuple[int, int]]] = {}
+        for window_id in sorted(scores, key=scores.__getitem__, reverse=True):
+            file_index, start, end = self._windows[window_id]
+            # Overlapping windows share lines; keep only the best-scoring one of each cluster.
+            spans = taken.setdefault(file_index, [])
+            if any(start < other_end and other_start < end for other_start, other_end in spans):
+                continue
+            spans.append((start, end))
+            rel_path, lines = self._files[file_index]
+            chunks.append(
+                CodeChunk(
+                    file_path=rel_path,
+                    start_line=start + 1,
+                    end_line=end,
+                    content="\n".join(lines[start:end]),
+                    score=scores[window_id],
+                )
             )
-            scored.append((score, chunk))
-
-        scored.sort(key=lambda pair: pair[0], reverse=True)
-        return [chunk for _, chunk in scored[:top_k]]
-
+            if len(chunks) == top_k:
+                break
+        return chunks
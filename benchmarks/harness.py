@@ -0,0 +1,172 @@
+"""Harness performance suite.
+
+Times each stage of the harness itself on synthetic datasets of increasing size and compares
+the results with a stored baseline. It exits non-zero when a stage is slower than
+`baseline * --tolerance + --slack-ms`.
+
+Stages per scale:
+    load_yaml, load_jsonl    load_dataset on the YAML and JSONL copies (no parse cache)
+    run                      BenchmarkRunner.run end to end with the stand-in adapter
+    compute_metrics          score_query for every query
+    sweep                    sweep_metrics over a 4 x 3 (k, threshold) grid for every query
+    aggregate                aggregate_metrics over all query results
+    render_json, render_markdown
+
+    python benchmarks/harness.py                       # small and medium, check baseline
+    python benchmarks/harness.py --scales large        # one scale
+    python benchmarks/harness.py --update-baseline     # record new baseline timings
+
+Fixtures are generated once per scale under `--work-dir` and reused afterwards. Baseline
+timings depend on the machine, so record them on the machine that runs the comparison.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from synthetic import Scale, SyntheticRAG, generate
+
+from rag_eval.metrics import sweep_metrics
+from rag_eval.reporting import render_json, render_markdown
+from rag_eval.runner import BenchmarkRunner, load_dataset
+from rag_eval.runner.benchmark_runner import aggregate_metrics, score_query
+
+SCALES = {
+    "small": Scale(queries=200, gt_spans=2, top_k=10, files=50),
+    "medium": Scale(queries=2_000, gt_spans=4, top_k=20, files=500),
+    "large": Scale(queries=20_000, gt_spans=5, top_k=50, files=2_000),
+}
+SWEEP_KS = [1, 5, 10, 20]
+SWEEP_THRESHOLDS = [0.25, 0.5, 0.75]
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def _best_of(repeat: int, stage: Callable[[], Any]) -> tuple[float, Any]:
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = stage()
+        best = min(best, time.perf_counter() - started)
+    return best, value
+
+
+def _fixture_dir(work_dir: Path, name: str, scale: Scale) -> Path:
+    # Keyed by the parameters too, so editing a scale regenerates its fixture.
+    digest = hashlib.sha256(json.dumps(asdict(scale), sort_keys=True).encode()).hexdigest()
+    return work_dir / f"{name}-{digest[:12]}"
+
+
+def run_scale(
+    name: str, scale: Scale, work_dir: Path, repeat: int, latency_ms: float, concurrency: int
+) -> dict[str, float]:
+    fixture = generate(_fixture_dir(work_dir, name, scale), scale)
+    timings: dict[str, float] = {}
+
+    timings["load_yaml"], _ = _best_of(repeat, lambda: load_dataset(fixture.yaml_dataset))
+    timings["load_jsonl"], dataset = _best_of(repeat, lambda: load_dataset(fixture.jsonl_dataset))
+
+    runner = BenchmarkRunner(SyntheticRAG(latency_ms), cache_dir=work_dir / "cache")
+    timings["run"], report = _best_of(
+        repeat, lambda: runner.run(fixture.jsonl_dataset, concurrency=concurrency)
+    )
+    retrieved = [(result.query, result.retrieved) for result in report.query_results]
+    k = dataset.top_k
+
+    timings["compute_metrics"], results = _best_of(
+        repeat, lambda: [score_query(query, chunks, k, 0.5) for query, chunks in retrieved]
+    )
+    timings["sweep"], _ = _best_of(
+        repeat,
+        lambda: [
+            sweep_metrics(chunks, query.ground_truth, SWEEP_KS, SWEEP_THRESHOLDS)
+            for query, chunks in retrieved
+        ],
+    )
+    timings["aggregate"], _ = _best_of(repeat, lambda: aggregate_metrics(results))
+    timings["render_json"], _ = _best_of(repeat, lambda: render_json(report))
+    timings["render_markdown"], _ = _best_of(repeat, lambda: render_markdown(report))
+    return timings
+
+
+def compare(
+    measured: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+    slack_s: float,
+) -> list[str]:
+    """Print a table of timings against the baseline and return the regressions."""
+    failures = []
+    print(f"{'scale':<8} {'stage':<16} {'seconds':>9} {'baseline':>9} {'ratio':>6}")
+    for scale, stages in measured.items():
+        for stage, seconds in stages.items():
+            expected = baseline.get(scale, {}).get(stage)
+            if expected is None:
+                print(f"{scale:<8} {stage:<16} {seconds:9.4f} {'-':>9} {'-':>6}")
+                continue
+            ratio = seconds / expected if expected else float("inf")
+            flag = ""
+            if seconds > expected * tolerance + slack_s:
+                flag = "  SLOW"
+                failures.append(f"{scale}/{stage}: {seconds:.4f}s vs baseline {expected:.4f}s")
+            print(f"{scale:<8} {stage:<16} {seconds:9.4f} {expected:9.4f} {ratio:6.2f}{flag}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="small,medium", help=f"Any of {', '.join(SCALES)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of runs per stage")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated query latency")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--slack-ms", type=float, default=5.0)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "rag-eval-bench",
+        help="Where fixtures and the repo cache are kept between runs",
+    )
+    options = parser.parse_args()
+
+    names = [name.strip() for name in options.scales.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCALES]
+    if unknown:
+        parser.error(f"unknown scales: {', '.join(unknown)}")
+
+    measured = {
+        name: run_scale(
+            name,
+            SCALES[name],
+            options.work_dir,
+            options.repeat,
+            options.latency_ms,
+            options.concurrency,
+        )
+        for name in names
+    }
+    baseline = json.loads(options.baseline.read_text()) if options.baseline.exists() else {}
+    failures = compare(measured, baseline, options.tolerance, options.slack_ms / 1000)
+
+    if options.update_baseline:
+        baseline.update(
+            {name: {k: round(v, 6) for k, v in stages.items()} for name, stages in measured.items()}
+        )
+        options.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Updated {options.baseline}")
+        return 0
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
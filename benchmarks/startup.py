@@ -0,0 +1,75 @@
+"""CLI startup time budget.
+
+Runs every `rag-eval` subcommand's `--help` (and `datasets list`) in a fresh interpreter and
+fails when one of them takes longer than the budget. Times are the best of `--repeat` runs
+minus a bare `python -c pass`, so they measure what the harness adds on top of interpreter
+startup.
+
+    python benchmarks/startup.py [--budget-ms 500] [--repeat 5]
+
+Most of what remains is typer and rich rendering help, so the budget is loose; the precise
+guard against a heavy import creeping back into startup is `tests/test_startup.py`.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+COMMANDS = [
+    ["--help"],
+    ["run", "--help"],
+    ["rescore", "--help"],
+    ["loadtest", "--help"],
+    ["matrix", "--help"],
+    ["history", "--help"],
+    ["compare", "--help"],
+    ["datasets", "--help"],
+    ["datasets", "list"],
+    ["datasets", "validate", "--help"],
+]
+
+
+def _env() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    return env
+
+
+def _best_time(args: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(args, env=_env(), capture_output=True, check=True)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=500.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    baseline = _best_time([sys.executable, "-c", "pass"], options.repeat)
+    failures = []
+    print(f"{'command':<28} {'ms':>8}")
+    for argv in COMMANDS:
+        label = " ".join(argv)
+        elapsed = _best_time([sys.executable, "-m", "rag_eval", *argv], options.repeat)
+        added_ms = (elapsed - baseline) * 1000
+        print(f"{label:<28} {added_ms:8.1f}")
+        if added_ms > options.budget_ms:
+            failures.append(f"{label}: {added_ms:.1f} ms exceeds {options.budget_ms:.0f} ms")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
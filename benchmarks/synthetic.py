@@ -0,0 +1,205 @@
+"""Synthetic benchmark fixtures: a generated repo, matching datasets and a stand-in adapter.
+
+`generate` writes a git repository of `files` Python modules, each defining functions named
+`fn_<file>_<n>`. It also writes a YAML and a JSONL dataset whose queries name
+`gt_spans` of those functions and use their line ranges as ground truth. `SyntheticRAG`
+retrieves by looking up the function names in the query text, pads the result with
+deterministic distractor spans up to `top_k`, and can sleep to simulate adapter latency.
+Everything is seeded, so the same arguments always produce the same repo, dataset and
+results.
+"""
+
+import json
+import os
+import random
+import re
+import subprocess
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models import CodeChunk
+from rag_eval.walker import walk_repo
+
+_SYMBOL = re.compile(r"\bfn_\d+_\d+\b")
+_DEFINITION = re.compile(r"^def (fn_\d+_\d+)\(", re.MULTILINE)
+
+# Fixed identity and timestamps so the fixture commit hash is the same on every machine.
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "rag-eval",
+    "GIT_AUTHOR_EMAIL": "rag-eval@example.invalid",
+    "GIT_AUTHOR_DATE": "2024-01-01T00:00:00Z",
+    "GIT_COMMITTER_NAME": "rag-eval",
+    "GIT_COMMITTER_EMAIL": "rag-eval@example.invalid",
+    "GIT_COMMITTER_DATE": "2024-01-01T00:00:00Z",
+}
+
+
+@dataclass
+class Scale:
+    queries: int
+    gt_spans: int
+    top_k: int
+    files: int
+    functions_per_file: int = 8
+    lines_per_function: int = 12
+    # Share of ground-truth functions a query names correctly; the rest name a random one.
+    hit_rate: float = 0.7
+
+
+@dataclass
+class Fixture:
+    repo: Path
+    commit: str
+    yaml_dataset: Path
+    jsonl_dataset: Path
+
+
+def _module_source(file_index: int, scale: Scale) -> str:
+    lines = [f'"""Synthetic module {file_index}."""', ""]
+    for n in range(scale.functions_per_file):
+        lines.append(f"def fn_{file_index}_{n}(value):")
+        lines.append(f'    """Step {n} of module {file_index}."""')
+        for step in range(scale.lines_per_function - 3):
+            lines.append(f"    value = value * {step + 2} + {file_index + n}")
+        lines.append("    return value")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _function_span(scale: Scale, n: int) -> tuple[int, int]:
+    # Two header lines, then functions of `lines_per_function` lines, each plus a blank line.
+    start = 3 + n * (scale.lines_per_function + 1)
+    return start, start + scale.lines_per_function - 1
+
+
+def _write_repo(root: Path, scale: Scale) -> str:
+    package = root / "pkg"
+    package.mkdir(parents=True, exist_ok=True)
+    for file_index in range(scale.files):
+        (package / f"mod_{file_index:04d}.py").write_text(_module_source(file_index, scale))
+
+    def git(*args: str) -> str:
+        completed = subprocess.run(
+            ["git", "-C", str(root), *args],
+            env={**os.environ, **_GIT_ENV},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return completed.stdout.strip()
+
+    git("init", "--quiet")
+    git("add", "--all")
+    git("commit", "--quiet", "--allow-empty", "-m", "Synthetic fixture")
+    return git("rev-parse", "HEAD")
+
+
+def _queries(scale: Scale, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    queries = []
+    for i in range(scale.queries):
+        named, ground_truth = [], []
+        for _ in range(scale.gt_spans):
+            file_index = rng.randrange(scale.files)
+            n = rng.randrange(scale.functions_per_file)
+            start, end = _function_span(scale, n)
+            ground_truth.append(
+                {"file_path": f"pkg/mod_{file_index:04d}.py", "start_line": start, "end_line": end}
+            )
+            if rng.random() >= scale.hit_rate:
+                file_index = rng.randrange(scale.files)
+                n = rng.randrange(scale.functions_per_file)
+            named.append(f"fn_{file_index}_{n}")
+        queries.append(
+            {
+                "id": f"q{i}",
+                "text": f"Where are {', '.join(named)} implemented?",
+                "ground_truth": ground_truth,
+            }
+        )
+    return queries
+
+
+def generate(root: str | Path, scale: Scale, seed: int = 0) -> Fixture:
+    """Write the repo fixture and both dataset files under `root` (reused if present)."""
+    root = Path(root)
+    repo = root / "repo"
+    yaml_dataset = root / "dataset.yaml"
+    jsonl_dataset = root / "dataset.jsonl"
+    commit_file = root / "commit"
+    if commit_file.exists() and yaml_dataset.exists() and jsonl_dataset.exists():
+        commit = commit_file.read_text().strip()
+        return Fixture(repo, commit, yaml_dataset, jsonl_dataset)
+
+    commit = _write_repo(repo, scale)
+    header = {
+        "name": f"synthetic-{scale.queries}q",
+        "repo": {"url": str(repo.resolve()), "commit": commit},
+        "top_k": scale.top_k,
+    }
+    queries = _queries(scale, seed)
+    yaml_dataset.write_text(yaml.safe_dump({**header, "queries": queries}, sort_keys=False))
+    with jsonl_dataset.open("w") as handle:
+        for record in [header, *queries]:
+            handle.write(json.dumps(record) + "\n")
+    commit_file.write_text(commit)
+    return Fixture(repo, commit, yaml_dataset, jsonl_dataset)
+
+
+class SyntheticRAG(RAGSystem):
+    """Deterministic stand-in adapter for the synthetic repo.
+
+    Functions named in the query come first, then distractor functions picked by a PRNG
+    seeded from the query text. `latency_ms` is slept on every query call.
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self._spans: dict[str, CodeChunk] = {}
+        self._names: list[str] = []
+
+    def ingest(self, repo_path: str) -> None:
+        self._spans = {}
+        for repo_file in walk_repo(repo_path):
+            lines = repo_file.text.splitlines()
+            starts = [
+                (match.group(1), repo_file.text.count("\n", 0, match.start()) + 1)
+                for match in _DEFINITION.finditer(repo_file.text)
+            ]
+            for index, (name, start) in enumerate(starts):
+                end = starts[index + 1][1] - 2 if index + 1 < len(starts) else len(lines)
+                self._spans[name] = CodeChunk(
+                    file_path=repo_file.path,
+                    start_line=start,
+                    end_line=end,
+                    content="\n".join(lines[start - 1 : end]),
+                )
+        self._names = sorted(self._spans)
+
+    def clear(self) -> None:
+        self._spans, self._names = {}, []
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        names = list(dict.fromkeys(n for n in _SYMBOL.findall(query) if n in self._spans))
+        rng = random.Random(zlib.crc32(query.encode()))
+        while len(names) < min(top_k, len(self._names)):
+            candidate = rng.choice(self._names)
+            if candidate not in names:
+                names.append(candidate)
+        return [
+            CodeChunk(
+                file_path=chunk.file_path,
+                start_line=chunk.start_line,
+                end_line=chunk.end_line,
+                content=chunk.content,
+                score=1.0 / (rank + 1),
+            )
+            for rank, chunk in enumerate(self._spans[name] for name in names[:top_k])
+        ]
@@ -1,7 +1,16 @@
 """Public exports for the RAG evaluation harness."""
 
-from .interfaces.rag_system import RAGSystem
-from .models.chunk import CodeChunk
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+
+if TYPE_CHECKING:
+    from .interfaces.rag_system import RAGSystem
+    from .models.chunk import CodeChunk
+
+# Resolved on first access so that importing a submodule (e.g. the CLI) stays cheap.
+_EXPORTS = {"RAGSystem": ".interfaces.rag_system", "CodeChunk": ".models.chunk"}
 
 __all__ = ["RAGSystem", "CodeChunk"]
 
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
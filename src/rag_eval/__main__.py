@@ -2,4 +2,3 @@ from rag_eval.cli import app
 
 if __name__ == "__main__":
     app()
-
@@ -0,0 +1,28 @@
+"""Lazy attribute exports for the package `__init__` modules."""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def attach(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return `__getattr__` and `__dir__` for `package` that import `exports` on first use.
+
+    `exports` maps each public name to the submodule (relative to `package`) defining it, so
+    importing the package costs nothing until one of those names is accessed.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted([*vars(sys.modules[package]), *exports])
+
+    return __getattr__, __dir__
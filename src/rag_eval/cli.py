@@ -1,12 +1,19 @@
-import importlib
+import math
+from contextlib import nullcontext
+from dataclasses import replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 
-from rag_eval.interfaces import RAGSystem
-from rag_eval.reporting import render_json, render_markdown
-from rag_eval.runner import BenchmarkRunner, load_dataset
+# Commands import the runner, reporters and their dependencies (GitPython, PyYAML, asyncio)
+# in their own bodies, so each command pays only for what it uses and `--help` or
+# `datasets list` start without them.
+if TYPE_CHECKING:
+    from rag_eval.interfaces import RAGSystem
+    from rag_eval.models.results import EvaluationReport
+    from rag_eval.runner import PhaseProfiler
 
 console = Console()
 app = typer.Typer(add_completion=False, no_args_is_help=True)
@@ -14,77 +21,569 @@ datasets_app = typer.Typer(help="Dataset helpers")
 app.add_typer(datasets_app, name="datasets")
 
 
-def _load_adapter(adapter_spec: str) -> RAGSystem:
-    if ":" not in adapter_spec:
-        raise typer.BadParameter("Adapter must be in 'module_path:ClassName' format.")
-    module_name, class_name = adapter_spec.split(":", 1)
+def _load_adapter(
+    adapter_spec: str, workers: int = 0, max_memory_mb: int | None = None
+) -> "RAGSystem":
+    """Load the adapter in-process, or behind `workers` worker processes when > 0."""
+    from rag_eval.runner import AdapterWorkerPool, load_adapter
+
+    try:
+        if workers:
+            return AdapterWorkerPool(adapter_spec, workers=workers, max_memory_mb=max_memory_mb)
+        return load_adapter(adapter_spec)
+    except (ValueError, TypeError, RuntimeError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+
+def _close_adapter(rag_system: "RAGSystem") -> None:
+    from rag_eval.runner import AdapterWorkerPool
+
+    if isinstance(rag_system, AdapterWorkerPool):
+        rag_system.close()
+
+
+def _parse_ks(spec: str | None) -> list[int] | None:
+    if not spec:
+        return None
     try:
-        module = importlib.import_module(module_name)
-    except ModuleNotFoundError as exc:
-        raise typer.BadParameter(f"Module not found: {module_name}") from exc
+        ks = [int(part) for part in spec.split(",") if part.strip()]
+    except ValueError as exc:
+        raise typer.BadParameter(f"--k must be a comma-separated list of integers: {spec}") from exc
+    if not ks or min(ks) < 1:
+        raise typer.BadParameter("--k values must be >= 1")
+    return ks
+
+
+def _parse_thresholds(spec: str | None) -> list[float] | None:
+    """Parse 'a,b,c' or an inclusive 'start:stop:step' range of overlap thresholds."""
+    if not spec:
+        return None
     try:
-        adapter_cls: type[RAGSystem] = getattr(module, class_name)
-    except AttributeError as exc:
-        raise typer.BadParameter(f"Class '{class_name}' not found in '{module_name}'") from exc
-    if not issubclass(adapter_cls, RAGSystem):
-        raise typer.BadParameter(f"{class_name} must subclass rag_eval.interfaces.RAGSystem")
-    return adapter_cls()
+        if ":" in spec:
+            start, stop, step = (float(part) for part in spec.split(":"))
+            if step <= 0:
+                raise ValueError("step must be > 0")
+            count = math.floor((stop - start) / step + 1e-9) + 1
+            # Rounding keeps e.g. 0.1 + 2 * 0.1 from surfacing as 0.30000000000000004.
+            return [round(start + i * step, 10) for i in range(max(count, 0))]
+        return [float(part) for part in spec.split(",") if part.strip()]
+    except ValueError as exc:
+        raise typer.BadParameter(
+            f"--overlap-thresholds must be 'a,b,c' or 'start:stop:step': {spec}"
+        ) from exc
+
+
+def _check_format(fmt: str, streaming: bool = False) -> str:
+    report_format = fmt.lower()
+    allowed = ["json", "md", "markdown", *(["jsonl"] if streaming else [])]
+    if report_format not in allowed:
+        raise typer.BadParameter(f"fmt must be one of: {', '.join(allowed)}")
+    return report_format
+
+
+def _check_content(content: str) -> str:
+    from rag_eval.reporting import CONTENT_MODES
+
+    if content not in CONTENT_MODES:
+        raise typer.BadParameter(f"content must be one of: {', '.join(CONTENT_MODES)}")
+    return content
+
+
+def _history_db(history_db: Path | None, cache_dir: Path) -> Path:
+    return history_db or cache_dir / "history.db"
+
+
+def _emit_report(
+    report: "EvaluationReport", report_format: str, output: Path | None, content: str = "full"
+) -> None:
+    from rag_eval.reporting import render_json, render_markdown
+
+    failed = sum(1 for result in report.query_results if result.error)
+    timed_out = report.outcomes.get("timeout", 0)
+    if report_format == "jsonl":
+        # Per-query results were already streamed to ``output`` while the run progressed.
+        console.print(render_json(replace(report, query_results=[])))
+        console.print(f"[green]Streamed {len(report.query_results)} results to {output}")
+    else:
+        if report_format == "json":
+            rendered = render_json(report, content=content)
+        else:
+            rendered = render_markdown(report)
+        console.print(rendered)
+        if output:
+            output.write_text(rendered)
+            console.print(f"[green]Wrote report to {output}")
+    if failed:
+        detail = f" ({timed_out} timed out)" if timed_out else ""
+        console.print(f"[yellow]{failed} of {len(report.query_results)} queries failed{detail}")
+
+
+def _write_profile(profiler: "PhaseProfiler", directory: Path, top: int) -> None:
+    profiler.stop()
+    profiler.write(directory, top=top)
+    console.print(f"[green]Wrote profile for {len(profiler.samples)} phases to {directory}")
 
 
 @app.command()
 def run(  # type: ignore[override]
-    dataset: Path = typer.Option(..., exists=True, dir_okay=False, help="Path to dataset YAML"),
+    dataset: Path = typer.Option(
+        ..., exists=True, dir_okay=False, help="Path to dataset (YAML or JSONL)"
+    ),
     adapter: str = typer.Option(..., help="Adapter spec in 'module:ClassName' form"),
     top_k: int = typer.Option(10, help="Top-K to request from the adapter"),
     overlap_threshold: float = typer.Option(0.5, help="Line overlap threshold for matches"),
+    sweep_k: str | None = typer.Option(
+        None, "--k", help="Comma-separated k values to sweep, e.g. 1,3,5,10"
+    ),
+    sweep_thresholds: str | None = typer.Option(
+        None,
+        "--overlap-thresholds",
+        help="Overlap thresholds to sweep: 'a,b,c' or inclusive 'start:stop:step'",
+    ),
     cache_dir: Path = typer.Option(Path(".rag_eval_cache"), help="Where to cache cloned repos"),
     output: Path | None = typer.Option(None, help="Optional path to write report"),
-    fmt: str = typer.Option("json", help="Report format: json|md"),
+    fmt: str = typer.Option(
+        "json", help="Report format: json|md|jsonl (jsonl streams results to --output)"
+    ),
+    content: str = typer.Option("full", help="Chunk content in json/jsonl output: full|hash|none"),
+    concurrency: int = typer.Option(
+        1, min=1, help="Number of queries to run in parallel (in-flight limit with --async)"
+    ),
+    batch_size: int = typer.Option(
+        1, min=1, help="Queries sent per query_batch call (ignored with --async)"
+    ),
+    async_mode: bool = typer.Option(
+        False, "--async", help="Drive the adapter through its aingest/aquery hooks"
+    ),
+    rate_limit: float | None = typer.Option(
+        None, min=0.0, help="Maximum queries started per second (only with --async)"
+    ),
+    query_timeout: float | None = typer.Option(
+        None, help="Seconds before a query (retries included) is abandoned and marked timed out"
+    ),
+    retries: int = typer.Option(0, min=0, help="Retries per failed query, with backoff"),
+    retry_backoff: float = typer.Option(
+        0.1, min=0.0, help="Base backoff in seconds; doubles per retry, with full jitter"
+    ),
+    hedge_percentile: float | None = typer.Option(
+        None,
+        help="Send a duplicate request when a query runs past this latency percentile, e.g. 95",
+    ),
+    retrieval_cache: bool = typer.Option(
+        False,
+        "--retrieval-cache/--no-retrieval-cache",
+        help="Reuse and store retrieved chunks under <cache-dir>/retrievals (pinned commits only)",
+    ),
+    snapshots: bool = typer.Option(
+        False,
+        "--snapshots/--no-snapshots",
+        help="Restore/save adapter index snapshots under <cache-dir>/snapshots (pinned commits)",
+    ),
+    checkpoint: bool = typer.Option(
+        True,
+        "--checkpoint/--no-checkpoint",
+        help="Checkpoint completed queries under <cache-dir>/checkpoints until the run succeeds",
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Skip queries a previous run with the same settings completed"
+    ),
+    compact: bool = typer.Option(
+        False,
+        "--compact",
+        help="Hold retrieved chunks in compact columns; reports re-read chunk content from the "
+        "checkout instead of keeping the adapter's",
+    ),
+    history: bool = typer.Option(
+        True, "--history/--no-history", help="Record the run in the history database"
+    ),
+    history_db: Path | None = typer.Option(
+        None, help="History database path (default: <cache-dir>/history.db)"
+    ),
+    label: str | None = typer.Option(None, help="Free-form label stored with the run history"),
+    adapter_workers: int = typer.Option(
+        0, min=0, help="Run the adapter in this many worker processes (0: in-process)"
+    ),
+    worker_memory_mb: int | None = typer.Option(
+        None, min=1, help="Address-space limit per adapter worker process, in MB"
+    ),
+    profile: Path | None = typer.Option(
+        None,
+        file_okay=False,
+        help="Sample stacks per phase; write collapsed stacks and a summary to this directory",
+    ),
+    profile_top: int = typer.Option(
+        20, min=1, help="Functions listed per phase in the profile summary"
+    ),
 ) -> None:
     """Run a benchmark for the given dataset and adapter."""
-    report_format = fmt.lower()
-    if report_format not in {"json", "md", "markdown"}:
-        raise typer.BadParameter("fmt must be one of: json, md, markdown")
+    report_format = _check_format(fmt, streaming=True)
+    content = _check_content(content)
+    if report_format == "jsonl" and output is None:
+        raise typer.BadParameter("--fmt jsonl requires --output")
+    if rate_limit is not None and not async_mode:
+        raise typer.BadParameter("--rate-limit requires --async")
+    if resume and not checkpoint:
+        raise typer.BadParameter("--resume requires --checkpoint")
+    ks = _parse_ks(sweep_k)
+    thresholds = _parse_thresholds(sweep_thresholds)
+    if adapter_workers and concurrency == 1:
+        # Queries only fan out across worker processes when several are in flight.
+        concurrency = adapter_workers
+
+    from rag_eval.reporting import JsonlResultWriter
+    from rag_eval.runner import (
+        BenchmarkRunner,
+        CheckpointStore,
+        HistoryStore,
+        PhaseProfiler,
+        QueryPolicy,
+        RetrievalCache,
+        SnapshotStore,
+    )
+
+    try:
+        query_policy = QueryPolicy(
+            timeout_s=query_timeout,
+            retries=retries,
+            backoff_s=retry_backoff,
+            hedge_percentile=hedge_percentile,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    rag_system = _load_adapter(adapter, adapter_workers, worker_memory_mb)
+    profiler = PhaseProfiler() if profile else None
+    runner = BenchmarkRunner(
+        rag_system,
+        cache_dir=cache_dir,
+        retrieval_cache=RetrievalCache(cache_dir / "retrievals") if retrieval_cache else None,
+        snapshots=SnapshotStore(cache_dir / "snapshots") if snapshots else None,
+        checkpoints=CheckpointStore(cache_dir / "checkpoints") if checkpoint else None,
+        compact=compact,
+        profiler=profiler,
+        query_policy=query_policy,
+    )
+    if profiler:
+        profiler.start()
+    try:
+        writer = (
+            JsonlResultWriter(output, content=content, release_content=True)
+            if report_format == "jsonl"
+            else None
+        )
+        on_result = writer.write_result if writer else None
+        try:
+            if async_mode:
+                import asyncio
+
+                report = asyncio.run(
+                    runner.arun(
+                        dataset_path=dataset,
+                        top_k=top_k,
+                        overlap_threshold=overlap_threshold,
+                        max_in_flight=concurrency,
+                        rate_limit=rate_limit,
+                        sweep_ks=ks,
+                        sweep_thresholds=thresholds,
+                        on_result=on_result,
+                        resume=resume,
+                    )
+                )
+            else:
+                report = runner.run(
+                    dataset_path=dataset,
+                    top_k=top_k,
+                    overlap_threshold=overlap_threshold,
+                    concurrency=concurrency,
+                    batch_size=batch_size,
+                    sweep_ks=ks,
+                    sweep_thresholds=thresholds,
+                    on_result=on_result,
+                    resume=resume,
+                )
+            if writer:
+                writer.write_summary(report)
+        finally:
+            if writer:
+                writer.close()
+            _close_adapter(rag_system)
+        with profiler.phase("report") if profiler else nullcontext():
+            _emit_report(report, report_format, output, content)
+    finally:
+        if profiler:
+            _write_profile(profiler, profile, profile_top)
+    if history:
+        db_path = _history_db(history_db, cache_dir)
+        run_id = HistoryStore(db_path).record(
+            report,
+            adapter=adapter,
+            adapter_fingerprint=rag_system.fingerprint(),
+            top_k=top_k,
+            overlap_threshold=overlap_threshold,
+            label=label,
+        )
+        console.print(f"[green]Recorded run {run_id} in {db_path}")
+
 
-    rag_system = _load_adapter(adapter)
-    runner = BenchmarkRunner(rag_system, cache_dir=cache_dir)
-    report = runner.run(dataset_path=dataset, top_k=top_k, overlap_threshold=overlap_threshold)
+@app.command("rescore")
+def rescore_cmd(
+    dataset: Path = typer.Option(
+        ..., exists=True, dir_okay=False, help="Path to dataset (YAML or JSONL)"
+    ),
+    adapter_id: str | None = typer.Option(
+        None, help="Substring of the cached adapter fingerprint to rescore"
+    ),
+    top_k: int = typer.Option(10, help="Top-K the retrievals were cached with (the lookup key)"),
+    score_k: int | None = typer.Option(
+        None, min=1, help="k to score at, truncating cached retrievals (default: --top-k)"
+    ),
+    overlap_threshold: float = typer.Option(0.5, help="Line overlap threshold for matches"),
+    sweep_k: str | None = typer.Option(
+        None, "--k", help="Comma-separated k values to sweep, e.g. 1,3,5,10"
+    ),
+    sweep_thresholds: str | None = typer.Option(
+        None,
+        "--overlap-thresholds",
+        help="Overlap thresholds to sweep: 'a,b,c' or inclusive 'start:stop:step'",
+    ),
+    cache_dir: Path = typer.Option(
+        Path(".rag_eval_cache"), help="Where repos and retrievals are cached"
+    ),
+    output: Path | None = typer.Option(None, help="Optional path to write report"),
+    fmt: str = typer.Option("json", help="Report format: json|md"),
+    content: str = typer.Option("full", help="Chunk content in json output: full|hash|none"),
+) -> None:
+    """Recompute metrics from cached retrievals without running the adapter."""
+    report_format = _check_format(fmt)
+    content = _check_content(content)
+    sweep_ks = _parse_ks(sweep_k)
+    k = score_k or top_k
+    if max([k, *(sweep_ks or [])]) > top_k:
+        raise typer.BadParameter(
+            f"--score-k and --k cannot exceed the top_k={top_k} retrievals were cached with"
+        )
+    from rag_eval.runner import RetrievalCache, load_dataset, rescore
+
+    ds = load_dataset(dataset, cache_dir=cache_dir)
+    if not ds.repo.commit:
+        raise typer.BadParameter("Retrievals are only cached for datasets pinned to a commit.")
+
+    found = RetrievalCache(cache_dir / "retrievals").find(ds.repo, top_k, adapter_id)
+    if not found:
+        raise typer.BadParameter(
+            f"No cached retrievals for {ds.repo.url}@{ds.repo.commit} with top_k={top_k}; "
+            "run with --retrieval-cache first."
+        )
+    if len(found) > 1:
+        candidates = "\n".join(f"  {fingerprint}" for fingerprint in found)
+        raise typer.BadParameter(
+            f"Multiple adapters have cached retrievals; narrow with --adapter-id:\n{candidates}"
+        )
 
+    (retrievals,) = found.values()
+    report = rescore(
+        ds,
+        retrievals,
+        top_k=k,
+        overlap_threshold=overlap_threshold,
+        sweep_ks=sweep_ks,
+        sweep_thresholds=_parse_thresholds(sweep_thresholds),
+    )
+    _emit_report(report, report_format, output, content)
+
+
+@app.command()
+def loadtest(
+    dataset: Path = typer.Option(
+        ..., exists=True, dir_okay=False, help="Path to dataset (YAML or JSONL)"
+    ),
+    adapter: str = typer.Option(..., help="Adapter spec in 'module:ClassName' form"),
+    qps: float = typer.Option(..., min=0.0, help="Target arrival rate in queries per second"),
+    duration: float = typer.Option(60.0, min=0.0, help="How long to send queries, in seconds"),
+    arrival: str = typer.Option("constant", help="Arrival process: constant|poisson"),
+    top_k: int = typer.Option(10, help="Top-K to request from the adapter"),
+    timeout: float | None = typer.Option(
+        None, min=0.0, help="Count requests slower than this many seconds as timeouts"
+    ),
+    max_workers: int = typer.Option(64, min=1, help="Maximum concurrent in-flight requests"),
+    seed: int | None = typer.Option(None, help="Seed for Poisson arrivals"),
+    cache_dir: Path = typer.Option(Path(".rag_eval_cache"), help="Where to cache cloned repos"),
+    output: Path | None = typer.Option(None, help="Optional path to write report"),
+    fmt: str = typer.Option("json", help="Report format: json|md"),
+    adapter_workers: int = typer.Option(
+        0, min=0, help="Run the adapter in this many worker processes (0: in-process)"
+    ),
+    worker_memory_mb: int | None = typer.Option(
+        None, min=1, help="Address-space limit per adapter worker process, in MB"
+    ),
+) -> None:
+    """Replay dataset queries at a target rate and report latency and throughput."""
+    report_format = _check_format(fmt)
+    if arrival not in {"constant", "poisson"}:
+        raise typer.BadParameter("arrival must be one of: constant, poisson")
+    if qps <= 0:
+        raise typer.BadParameter("qps must be > 0")
+    from rag_eval.reporting import render_load_test_json, render_load_test_markdown
+    from rag_eval.runner import load_dataset, prepare_repo, run_load_test
+
+    ds = load_dataset(dataset, cache_dir=cache_dir)
+    rag_system = _load_adapter(adapter, adapter_workers, worker_memory_mb)
+    try:
+        repo_path = prepare_repo(ds.repo, cache_dir)
+        try:
+            rag_system.clear()
+        except NotImplementedError:
+            pass
+        rag_system.ingest(str(repo_path))
+
+        report = run_load_test(
+            rag_system,
+            [q.text for q in ds.queries],
+            rate=qps,
+            duration_s=duration,
+            arrival=arrival,
+            top_k=top_k,
+            timeout_s=timeout,
+            max_workers=max_workers,
+            seed=seed,
+            dataset_name=ds.name,
+        )
+    finally:
+        _close_adapter(rag_system)
+    if report_format == "json":
+        content = render_load_test_json(report)
+    else:
+        content = render_load_test_markdown(report)
+
+    console.print(content)
+    if output:
+        output.write_text(content)
+        console.print(f"[green]Wrote report to {output}")
+
+
+@app.command()
+def matrix(
+    config: Path = typer.Option(..., exists=True, dir_okay=False, help="Matrix config YAML"),
+    workers: int = typer.Option(1, min=1, help="Number of cells to run in parallel processes"),
+    cache_dir: Path = typer.Option(Path(".rag_eval_cache"), help="Where to cache cloned repos"),
+    output: Path | None = typer.Option(None, help="Optional path to write report"),
+    fmt: str = typer.Option("json", help="Report format: json|md"),
+) -> None:
+    """Run every dataset against every adapter in a config and merge the results."""
+    report_format = _check_format(fmt)
+    from rag_eval.reporting import render_matrix_json, render_matrix_markdown
+    from rag_eval.runner import load_matrix_config, run_matrix
+
+    try:
+        matrix_config = load_matrix_config(config)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    report = run_matrix(matrix_config, cache_dir=cache_dir, workers=workers)
     if report_format == "json":
-        content = render_json(report)
+        content = render_matrix_json(report)
     else:
-        content = render_markdown(report)
+        content = render_matrix_markdown(report)
 
     console.print(content)
+    failed = sum(1 for row in report.rows if row.error)
+    if failed:
+        console.print(f"[yellow]{failed} of {len(report.rows)} cells failed")
     if output:
         output.write_text(content)
         console.print(f"[green]Wrote report to {output}")
 
 
+@app.command("history")
+def history_cmd(
+    dataset: str | None = typer.Option(None, help="Only runs of this dataset name"),
+    adapter: str | None = typer.Option(None, help="Only runs of this adapter spec"),
+    commit: str | None = typer.Option(None, help="Only runs against this repo commit"),
+    limit: int = typer.Option(20, min=1, help="Maximum number of runs to list"),
+    cache_dir: Path = typer.Option(Path(".rag_eval_cache"), help="Where the history is kept"),
+    history_db: Path | None = typer.Option(
+        None, help="History database path (default: <cache-dir>/history.db)"
+    ),
+    fmt: str = typer.Option("md", help="Output format: json|md"),
+) -> None:
+    """List recorded runs, newest first."""
+    report_format = _check_format(fmt)
+    from rag_eval.reporting import render_history_json, render_history_markdown
+    from rag_eval.runner import HistoryStore
+
+    store = HistoryStore(_history_db(history_db, cache_dir))
+    runs = store.runs(dataset=dataset, adapter=adapter, commit=commit, limit=limit)
+    if report_format == "json":
+        console.print(render_history_json(runs))
+    else:
+        console.print(render_history_markdown(runs))
+
+
+@app.command()
+def compare(
+    base: int = typer.Argument(..., help="Id of the baseline run"),
+    head: int = typer.Argument(..., help="Id of the run to compare against the baseline"),
+    metric: str = typer.Option("recall@k", help="Per-query metric to compare"),
+    limit: int | None = typer.Option(None, min=1, help="Show only the N biggest drops"),
+    regressions_only: bool = typer.Option(
+        False, "--regressions-only", help="Only list queries whose metric dropped"
+    ),
+    cache_dir: Path = typer.Option(Path(".rag_eval_cache"), help="Where the history is kept"),
+    history_db: Path | None = typer.Option(
+        None, help="History database path (default: <cache-dir>/history.db)"
+    ),
+    output: Path | None = typer.Option(None, help="Optional path to write the comparison"),
+    fmt: str = typer.Option("md", help="Output format: json|md"),
+) -> None:
+    """Compare two recorded runs per query, biggest regressions first."""
+    report_format = _check_format(fmt)
+    from rag_eval.reporting import render_comparison_json, render_comparison_markdown
+    from rag_eval.runner import HistoryStore
+
+    store = HistoryStore(_history_db(history_db, cache_dir))
+    try:
+        comparison = store.compare(
+            base, head, metric=metric, limit=limit, regressions_only=regressions_only
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if report_format == "json":
+        content = render_comparison_json(comparison)
+    else:
+        content = render_comparison_markdown(comparison)
+    console.print(content)
+    if output:
+        output.write_text(content)
+        console.print(f"[green]Wrote comparison to {output}")
+
+
 @datasets_app.command("list")
 def list_datasets(
-    directory: Path = typer.Option(Path("datasets"), help="Directory containing dataset YAML files")
+    directory: Path = typer.Option(Path("datasets"), help="Directory containing dataset files"),
 ) -> None:
     """List datasets available locally."""
     if not directory.exists():
         console.print(f"[yellow]Dataset directory not found: {directory}")
         return
-    yaml_files = sorted(directory.glob("*.yaml"))
-    if not yaml_files:
+    dataset_files = sorted([*directory.glob("*.yaml"), *directory.glob("*.jsonl")])
+    if not dataset_files:
         console.print(f"[yellow]No datasets found in {directory}")
         return
     console.print("Datasets:")
-    for path in yaml_files:
+    for path in dataset_files:
         console.print(f"- {path}")
 
 
 @datasets_app.command("validate")
 def validate_dataset(
-    dataset: Path = typer.Option(..., exists=True, dir_okay=False, help="Dataset YAML to validate")
+    dataset: Path = typer.Option(
+        ..., exists=True, dir_okay=False, help="Dataset file (YAML or JSONL) to validate"
+    ),
 ) -> None:
     """Validate a dataset file."""
-    ds = load_dataset(dataset)
-    console.print(
-        f"[green]Dataset '{ds.name}' is valid with {len(ds.queries)} queries (top_k={ds.top_k})."
-    )
+    from rag_eval.runner import open_dataset
 
+    ds, queries = open_dataset(dataset)
+    # Stream the queries so huge JSONL datasets validate in constant memory.
+    count = sum(1 for _ in queries)
+    console.print(f"[green]Dataset '{ds.name}' is valid with {count} queries (top_k={ds.top_k}).")
@@ -1,4 +1,3 @@
 from .rag_system import RAGSystem
 
 __all__ = ["RAGSystem"]
-
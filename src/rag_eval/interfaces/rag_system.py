@@ -1,11 +1,30 @@
 from abc import ABC, abstractmethod
+from functools import wraps
+from typing import Any
 
 from rag_eval.models.chunk import CodeChunk
 
+_SIMPLE_TYPES = (str, int, float, bool)
+
 
 class RAGSystem(ABC):
     """Interface that target RAG systems must implement."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        init = cls.__dict__.get("__init__")
+        if init is None:
+            return
+
+        @wraps(init)
+        def __init__(self: RAGSystem, *args: Any, **kwargs: Any) -> None:
+            init(self, *args, **kwargs)
+            # The outermost constructor returns last, so this ends up holding the final
+            # configuration; state set later (e.g. by `ingest`) stays out of `fingerprint`.
+            self._rag_eval_config = _simple_attributes(self)
+
+        cls.__init__ = __init__
+
     @abstractmethod
     def ingest(self, repo_path: str) -> None:
         """Ingest a code repository for indexing."""
@@ -16,8 +35,68 @@ class RAGSystem(ABC):
         """Query the RAG system and return ranked code chunks."""
         raise NotImplementedError
 
+    def query_batch(self, queries: list[str], top_k: int = 10) -> list[list[CodeChunk]]:
+        """Optional: answer several queries at once, one ranked list per query, in order.
+
+        The default loops over `query`; adapters that can batch work such as embedding
+        should override it.
+        """
+        return [self.query(query, top_k=top_k) for query in queries]
+
     def clear(self) -> None:
         """Optional: clear any existing index."""
         # Implementations can override; noop by default
         return None
 
+    def update(self, changed: list[str], deleted: list[str], repo_path: str) -> None:
+        """Optional: bring an ingested index up to date with the checkout at `repo_path`.
+
+        `changed` lists files added or modified since the indexed commit and `deleted` the
+        files removed, both relative to the repo root. The runner calls this instead of
+        `ingest` when it already holds an index of an earlier commit of the same repo, and
+        falls back to a full `ingest` when it raises `NotImplementedError`.
+        """
+        raise NotImplementedError
+
+    def save_index(self, path: str) -> None:
+        """Optional: write the current index to the directory `path` so it can be restored."""
+        raise NotImplementedError
+
+    def load_index(self, path: str) -> None:
+        """Optional: restore an index previously written by `save_index`."""
+        raise NotImplementedError
+
+    def fingerprint(self) -> str:
+        """Identify this adapter and its configuration, e.g. for caching retrievals.
+
+        Defaults to the class path plus the public attributes holding simple values when
+        the constructor returned, so it stays the same across `ingest` and queries. Override
+        it when behaviour depends on configuration the default cannot see.
+        """
+        cls = type(self)
+        config = getattr(self, "_rag_eval_config", None)
+        if config is None:
+            config = _simple_attributes(self)
+        params = ", ".join(f"{key}={value!r}" for key, value in sorted(config.items()))
+        return f"{cls.__module__}.{cls.__qualname__}({params})"
+
+    async def aingest(self, repo_path: str) -> None:
+        """Optional: async ingest. Defaults to running `ingest` in a worker thread."""
+        # Imported here so that importing the interface does not pull in asyncio.
+        import asyncio
+
+        await asyncio.to_thread(self.ingest, repo_path)
+
+    async def aquery(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        """Optional: async query. Defaults to running `query` in a worker thread."""
+        import asyncio
+
+        return await asyncio.to_thread(self.query, query, top_k)
+
+
+def _simple_attributes(adapter: RAGSystem) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in vars(adapter).items()
+        if not key.startswith("_") and isinstance(value, _SIMPLE_TYPES)
+    }
@@ -1,16 +1,27 @@
 from .core import (
+    GroundTruthIndex,
     chunk_matches,
+    compute_metrics,
+    line_precision_at_k,
+    line_recall_at_k,
+    match_vector,
     mrr,
     ndcg_at_k,
     precision_at_k,
     recall_at_k,
+    sweep_metrics,
 )
 
 __all__ = [
+    "GroundTruthIndex",
     "chunk_matches",
+    "compute_metrics",
+    "match_vector",
     "precision_at_k",
     "recall_at_k",
     "mrr",
     "ndcg_at_k",
+    "line_recall_at_k",
+    "line_precision_at_k",
+    "sweep_metrics",
 ]
-
@@ -1,5 +1,7 @@
 import math
-from typing import Sequence
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, Iterator, Sequence
 
 from rag_eval.models.chunk import CodeChunk
 from rag_eval.models.dataset import GroundTruthChunk
@@ -27,13 +29,99 @@ def chunk_matches(
     return (overlap / shorter) >= overlap_threshold
 
 
-def _first_match_index(
-    chunk: CodeChunk, ground_truth: Sequence[GroundTruthChunk], overlap_threshold: float
-) -> int | None:
-    for idx, gt in enumerate(ground_truth):
-        if chunk_matches(gt, chunk, overlap_threshold):
-            return idx
-    return None
+class GroundTruthIndex:
+    """Ground-truth spans grouped by file and sorted by start line.
+
+    Each file keeps a running maximum of span end lines, so finding the spans that overlap
+    a retrieved chunk is a bisect plus a backwards walk that stops as soon as no earlier
+    span can reach the chunk.
+    """
+
+    def __init__(self, ground_truth: Sequence[GroundTruthChunk]) -> None:
+        self.size = len(ground_truth)
+        by_file: dict[str, list[tuple[int, int, int]]] = {}
+        for idx, gt in enumerate(ground_truth):
+            by_file.setdefault(gt.file_path, []).append((gt.start_line, gt.end_line, idx))
+
+        self._files: dict[str, tuple[list[int], list[int], list[tuple[int, int, int]]]] = {}
+        for file_path, spans in by_file.items():
+            spans.sort()
+            starts = [start for start, _, _ in spans]
+            max_ends = list(accumulate((end for _, end, _ in spans), max))
+            self._files[file_path] = (starts, max_ends, spans)
+
+    def overlapping(self, chunk: CodeChunk) -> Iterator[tuple[int, int]]:
+        """Yield `(ground_truth_index, overlap_ratio)` for every span overlapping `chunk`.
+
+        The ratio is overlap lines divided by the shorter of the two spans, as in
+        `chunk_matches`.
+        """
+        entry = self._files.get(chunk.file_path)
+        if entry is None:
+            return
+        starts, max_ends, spans = entry
+        retrieved_len = chunk.end_line - chunk.start_line + 1
+        pos = bisect_right(starts, chunk.end_line) - 1
+        while pos >= 0 and max_ends[pos] >= chunk.start_line:
+            start, end, idx = spans[pos]
+            pos -= 1
+            overlap = min(end, chunk.end_line) - max(start, chunk.start_line) + 1
+            if overlap <= 0:
+                continue
+            yield idx, overlap / min(end - start + 1, retrieved_len)
+
+    def first_match(self, chunk: CodeChunk, overlap_threshold: float) -> int | None:
+        """Lowest ground-truth index that `chunk` matches, mirroring `chunk_matches`."""
+        best = None
+        for idx, ratio in self.overlapping(chunk):
+            if ratio >= overlap_threshold and (best is None or idx < best):
+                best = idx
+        return best
+
+
+def match_vector(
+    retrieved: Sequence[CodeChunk],
+    ground_truth: Sequence[GroundTruthChunk] | GroundTruthIndex,
+    k: int = 10,
+    overlap_threshold: float = 0.5,
+) -> list[int | None]:
+    """Index of the ground-truth chunk matched by each of the top-k results, or None."""
+    if isinstance(ground_truth, GroundTruthIndex):
+        index = ground_truth
+    else:
+        index = GroundTruthIndex(ground_truth)
+    return [index.first_match(chunk, overlap_threshold) for chunk in retrieved[:k]]
+
+
+def _precision(matches: list[int | None]) -> float:
+    if not matches:
+        return 0.0
+    return sum(1 for match in matches if match is not None) / len(matches)
+
+
+def _recall(matches: list[int | None], ground_truth_size: int) -> float:
+    if not ground_truth_size:
+        return 1.0
+    return len({match for match in matches if match is not None}) / ground_truth_size
+
+
+def _mrr(matches: list[int | None]) -> float:
+    for rank, match in enumerate(matches, start=1):
+        if match is not None:
+            return 1.0 / rank
+    return 0.0
+
+
+def _ndcg(matches: list[int | None]) -> float:
+    relevance = [1 if match is not None else 0 for match in matches]
+    if not relevance:
+        return 0.0
+    dcg = sum((2**rel - 1) / math.log2(idx + 2) for idx, rel in enumerate(relevance))
+    ideal_relevance = sorted(relevance, reverse=True)
+    idcg = sum((2**rel - 1) / math.log2(idx + 2) for idx, rel in enumerate(ideal_relevance))
+    if idcg == 0:
+        return 0.0
+    return dcg / idcg
 
 
 def precision_at_k(
@@ -42,15 +130,7 @@ def precision_at_k(
     k: int = 10,
     overlap_threshold: float = 0.5,
 ) -> float:
-    if not retrieved:
-        return 0.0
-    considered = list(retrieved[:k])
-    hits = sum(
-        1
-        for chunk in considered
-        if _first_match_index(chunk, ground_truth, overlap_threshold) is not None
-    )
-    return hits / len(considered)
+    return _precision(match_vector(retrieved, ground_truth, k, overlap_threshold))
 
 
 def recall_at_k(
@@ -61,12 +141,7 @@ def recall_at_k(
 ) -> float:
     if not ground_truth:
         return 1.0
-    matched_gt = set()
-    for chunk in retrieved[:k]:
-        match_idx = _first_match_index(chunk, ground_truth, overlap_threshold)
-        if match_idx is not None:
-            matched_gt.add(match_idx)
-    return len(matched_gt) / len(ground_truth)
+    return _recall(match_vector(retrieved, ground_truth, k, overlap_threshold), len(ground_truth))
 
 
 def mrr(
@@ -75,10 +150,7 @@ def mrr(
     k: int = 10,
     overlap_threshold: float = 0.5,
 ) -> float:
-    for rank, chunk in enumerate(retrieved[:k], start=1):
-        if _first_match_index(chunk, ground_truth, overlap_threshold) is not None:
-            return 1.0 / rank
-    return 0.0
+    return _mrr(match_vector(retrieved, ground_truth, k, overlap_threshold))
 
 
 def ndcg_at_k(
@@ -87,18 +159,97 @@ def ndcg_at_k(
     k: int = 10,
     overlap_threshold: float = 0.5,
 ) -> float:
-    relevance = [
-        1 if _first_match_index(chunk, ground_truth, overlap_threshold) is not None else 0
-        for chunk in retrieved[:k]
-    ]
-    if not relevance:
-        return 0.0
-    dcg = sum((2**rel - 1) / math.log2(idx + 2) for idx, rel in enumerate(relevance))
-    ideal_relevance = sorted(relevance, reverse=True)
-    idcg = sum((2**rel - 1) / math.log2(idx + 2) for idx, rel in enumerate(ideal_relevance))
-    if idcg == 0:
+    return _ndcg(match_vector(retrieved, ground_truth, k, overlap_threshold))
+
+
+def _merged_intervals(spans: Iterable[tuple[str, int, int]]) -> dict[str, list[tuple[int, int]]]:
+    """Union of inclusive line spans per file, as sorted non-overlapping intervals."""
+    by_file: dict[str, list[tuple[int, int]]] = {}
+    for file_path, start, end in spans:
+        if end >= start:
+            by_file.setdefault(file_path, []).append((start, end))
+
+    merged: dict[str, list[tuple[int, int]]] = {}
+    for file_path, intervals in by_file.items():
+        intervals.sort()
+        out = [intervals[0]]
+        for start, end in intervals[1:]:
+            last_start, last_end = out[-1]
+            if start <= last_end + 1:
+                out[-1] = (last_start, max(last_end, end))
+            else:
+                out.append((start, end))
+        merged[file_path] = out
+    return merged
+
+
+def _covered_lines(intervals: list[tuple[int, int]]) -> int:
+    return sum(end - start + 1 for start, end in intervals)
+
+
+def _intersection_lines(a: list[tuple[int, int]], b: list[tuple[int, int]]) -> int:
+    """Lines shared by two sorted, merged interval lists, via a linear two-pointer walk."""
+    total = i = j = 0
+    while i < len(a) and j < len(b):
+        total += max(0, min(a[i][1], b[j][1]) - max(a[i][0], b[j][0]) + 1)
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return total
+
+
+def _line_coverage(
+    retrieved: Sequence[CodeChunk], ground_truth: Sequence[GroundTruthChunk], k: int
+) -> tuple[int, int, int]:
+    """Return (ground-truth lines, retrieved lines, lines in both) over the top-k results."""
+    gt_spans = _merged_intervals((gt.file_path, gt.start_line, gt.end_line) for gt in ground_truth)
+    retrieved_spans = _merged_intervals(
+        (chunk.file_path, chunk.start_line, chunk.end_line) for chunk in retrieved[:k]
+    )
+    shared = sum(
+        _intersection_lines(intervals, retrieved_spans[file_path])
+        for file_path, intervals in gt_spans.items()
+        if file_path in retrieved_spans
+    )
+    gt_lines = sum(_covered_lines(intervals) for intervals in gt_spans.values())
+    retrieved_lines = sum(_covered_lines(intervals) for intervals in retrieved_spans.values())
+    return gt_lines, retrieved_lines, shared
+
+
+def _line_metrics(
+    retrieved: Sequence[CodeChunk], ground_truth: Sequence[GroundTruthChunk], k: int
+) -> dict[str, float]:
+    """Line recall and precision at k from a single coverage computation."""
+    gt_lines, retrieved_lines, shared = _line_coverage(retrieved, ground_truth, k)
+    return {
+        "line_recall@k": shared / gt_lines if gt_lines else 1.0,
+        "line_precision@k": shared / retrieved_lines if retrieved_lines else 0.0,
+    }
+
+
+def line_recall_at_k(
+    retrieved: Sequence[CodeChunk],
+    ground_truth: Sequence[GroundTruthChunk],
+    k: int = 10,
+) -> float:
+    """Fraction of distinct ground-truth lines covered by the top-k results."""
+    gt_lines, _, shared = _line_coverage(retrieved, ground_truth, k)
+    if not gt_lines:
+        return 1.0
+    return shared / gt_lines
+
+
+def line_precision_at_k(
+    retrieved: Sequence[CodeChunk],
+    ground_truth: Sequence[GroundTruthChunk],
+    k: int = 10,
+) -> float:
+    """Fraction of distinct lines in the top-k results that fall inside ground truth."""
+    _, retrieved_lines, shared = _line_coverage(retrieved, ground_truth, k)
+    if not retrieved_lines:
         return 0.0
-    return dcg / idcg
+    return shared / retrieved_lines
 
 
 def compute_metrics(
@@ -107,10 +258,46 @@ def compute_metrics(
     k: int,
     overlap_threshold: float = 0.5,
 ) -> dict:
+    # One pass over the top-k results feeds every metric.
+    matches = match_vector(retrieved, ground_truth, k, overlap_threshold)
     return {
-        "precision@k": precision_at_k(retrieved, ground_truth, k, overlap_threshold),
-        "recall@k": recall_at_k(retrieved, ground_truth, k, overlap_threshold),
-        "mrr": mrr(retrieved, ground_truth, k, overlap_threshold),
-        "ndcg@k": ndcg_at_k(retrieved, ground_truth, k, overlap_threshold),
+        "precision@k": _precision(matches),
+        "recall@k": _recall(matches, len(ground_truth)),
+        "mrr": _mrr(matches),
+        "ndcg@k": _ndcg(matches),
+        **_line_metrics(retrieved, ground_truth, k),
     }
 
+
+def sweep_metrics(
+    retrieved: Sequence[CodeChunk],
+    ground_truth: Sequence[GroundTruthChunk],
+    ks: Sequence[int],
+    overlap_thresholds: Sequence[float],
+) -> dict[tuple[int, float], dict]:
+    """`compute_metrics` for every (k, overlap_threshold) pair from a single retrieval.
+
+    Overlap ratios against ground truth are computed once per chunk; each threshold only
+    re-filters them, and each k is a prefix of the resulting match vector.
+    """
+    index = GroundTruthIndex(ground_truth)
+    # Sorted by ground-truth index, so the first ratio passing a threshold is the first match.
+    ratios = [sorted(index.overlapping(chunk)) for chunk in retrieved[: max(ks, default=0)]]
+    # Line coverage ignores the threshold, so it is computed once per k.
+    line_metrics = {k: _line_metrics(retrieved, ground_truth, k) for k in ks}
+    grid: dict[tuple[int, float], dict] = {}
+    for threshold in overlap_thresholds:
+        matches = [
+            next((idx for idx, ratio in chunk_ratios if ratio >= threshold), None)
+            for chunk_ratios in ratios
+        ]
+        for k in ks:
+            prefix = matches[:k]
+            grid[(k, threshold)] = {
+                "precision@k": _precision(prefix),
+                "recall@k": _recall(prefix, index.size),
+                "mrr": _mrr(prefix),
+                "ndcg@k": _ndcg(prefix),
+                **line_metrics[k],
+            }
+    return grid
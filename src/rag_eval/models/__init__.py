@@ -1,14 +1,35 @@
 from .chunk import CodeChunk
+from .compact import ChunkStore, ChunkView, ContentResolver, without_content
 from .dataset import Dataset, GroundTruthChunk, Query, RepoSpec
-from .results import EvaluationReport, QueryResult
+from .results import (
+    EvaluationReport,
+    LoadTestReport,
+    MatrixReport,
+    MatrixRow,
+    QueryDelta,
+    QueryResult,
+    RunComparison,
+    RunRecord,
+    SweepResult,
+)
 
 __all__ = [
+    "ChunkStore",
+    "ChunkView",
     "CodeChunk",
+    "ContentResolver",
     "Dataset",
     "EvaluationReport",
     "GroundTruthChunk",
+    "LoadTestReport",
+    "MatrixReport",
+    "MatrixRow",
     "Query",
+    "QueryDelta",
     "QueryResult",
     "RepoSpec",
+    "RunComparison",
+    "RunRecord",
+    "SweepResult",
+    "without_content",
 ]
-
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 
 
@@ -16,4 +17,5 @@ class CodeChunk:
             raise ValueError("start_line must be >= 1")
         if self.end_line < self.start_line:
             raise ValueError("end_line must be >= start_line")
-
+        # Adapters return the same few paths over and over; share one string per path.
+        self.file_path = sys.intern(str(self.file_path))
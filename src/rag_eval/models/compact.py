@@ -0,0 +1,148 @@
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import overload
+
+from .chunk import CodeChunk
+
+
+class ContentResolver:
+    """Reads chunk content from a checked-out repo by line range.
+
+    `root` may be a path or a zero-argument callable returning one, so the checkout is only
+    located when content is first needed. The lines of the `max_files` most recently used
+    files are kept in memory; missing or unreadable files resolve to an empty string.
+    """
+
+    def __init__(self, root: str | Path | Callable[[], str | Path], max_files: int = 256) -> None:
+        self._root = root
+        self._root_path: Path | None = None
+        self._max_files = max_files
+        self._files: OrderedDict[str, list[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lines(self, file_path: str) -> list[str]:
+        with self._lock:
+            lines = self._files.get(file_path)
+            if lines is not None:
+                self._files.move_to_end(file_path)
+                return lines
+            if self._root_path is None:
+                root = self._root() if callable(self._root) else self._root
+                self._root_path = Path(root)
+            try:
+                text = (self._root_path / file_path).read_text(errors="ignore")
+            except OSError:
+                text = ""
+            lines = text.splitlines()
+            self._files[file_path] = lines
+            if len(self._files) > self._max_files:
+                self._files.popitem(last=False)
+            return lines
+
+    def __call__(self, file_path: str, start_line: int, end_line: int) -> str:
+        return "\n".join(self._lines(file_path)[start_line - 1 : end_line])
+
+
+class ChunkStore:
+    """Column storage for every chunk retrieved during a run.
+
+    Each chunk costs a file id, two line numbers and a score in flat arrays instead of a
+    `CodeChunk` object with its own content string. File paths are stored once. Content is
+    not kept; `ChunkView` asks the `resolver` for it when a chunk is materialized.
+    """
+
+    def __init__(self, resolver: Callable[[str, int, int], str] | None = None) -> None:
+        self.resolver = resolver
+        self.paths: list[str] = []
+        self._path_ids: dict[str, int] = {}
+        self.file_ids = array("I")
+        self.starts = array("I")
+        self.ends = array("I")
+        # NaN stands in for a missing score.
+        self.scores = array("d")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.file_ids)
+
+    def append(self, chunks: Iterable[CodeChunk]) -> "ChunkView":
+        """Store `chunks` and return a read-only view over them."""
+        with self._lock:
+            begin = len(self.file_ids)
+            for chunk in chunks:
+                file_id = self._path_ids.get(chunk.file_path)
+                if file_id is None:
+                    file_id = self._path_ids[chunk.file_path] = len(self.paths)
+                    self.paths.append(chunk.file_path)
+                self.file_ids.append(file_id)
+                self.starts.append(chunk.start_line)
+                self.ends.append(chunk.end_line)
+                self.scores.append(math.nan if chunk.score is None else chunk.score)
+            return ChunkView(self, begin, len(self.file_ids))
+
+    def chunk(self, index: int, content: bool = True) -> CodeChunk:
+        """Materialize one chunk; with `content=False` the resolver is not consulted."""
+        file_path = self.paths[self.file_ids[index]]
+        start, end = self.starts[index], self.ends[index]
+        score = self.scores[index]
+        return CodeChunk(
+            file_path=file_path,
+            start_line=start,
+            end_line=end,
+            content=self.resolver(file_path, start, end) if content and self.resolver else "",
+            score=None if math.isnan(score) else score,
+        )
+
+
+class ChunkView(Sequence[CodeChunk]):
+    """A query's retrieved chunks inside a `ChunkStore`, materialized on access."""
+
+    __slots__ = ("_begin", "_end", "_store")
+
+    def __init__(self, store: ChunkStore, begin: int, end: int) -> None:
+        self._store = store
+        self._begin = begin
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end - self._begin
+
+    @overload
+    def __getitem__(self, index: int) -> CodeChunk: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[CodeChunk]: ...
+
+    def __getitem__(self, index: int | slice) -> CodeChunk | list[CodeChunk]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+        return self._store.chunk(self._begin + index)
+
+    def without_content(self) -> list[CodeChunk]:
+        """The chunks with locations and scores only, read straight from the columns."""
+        return [self._store.chunk(i, content=False) for i in range(self._begin, self._end)]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"ChunkView({list(self)!r})"
+
+
+def without_content(chunks: Sequence[CodeChunk]) -> Sequence[CodeChunk]:
+    """`chunks` for code that reads only locations and scores.
+
+    A `ChunkView` is read without resolving content, so metrics and location-only reports
+    never touch the checkout; other sequences are returned unchanged.
+    """
+    return chunks.without_content() if isinstance(chunks, ChunkView) else chunks
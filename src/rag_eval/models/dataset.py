@@ -1,14 +1,15 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+# Large datasets hold many of these; slots keep them free of per-instance dicts.
+@dataclass(slots=True)
 class GroundTruthChunk:
     file_path: str
     start_line: int
     end_line: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Query:
     id: str
     text: str
@@ -27,4 +28,3 @@ class Dataset:
     repo: RepoSpec
     queries: list[Query]
     top_k: int = 10
-
@@ -1,14 +1,34 @@
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 from .chunk import CodeChunk
 from .dataset import Dataset, Query
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     query: Query
-    retrieved: list[CodeChunk]
+    # A list from the adapter, or a `ChunkView` once compacted into a `ChunkStore`.
+    retrieved: Sequence[CodeChunk]
     metrics: dict[str, float]
+    error: str | None = None
+    # Wall time of the adapter call; None when the retrieval came from a cache.
+    latency_s: float | None = None
+    # "ok", "error" (the adapter raised; see `error`) or "timeout" (deadline exceeded).
+    status: str = "ok"
+    # Adapter calls made for this query, retries included; 0 when served from a cache.
+    attempts: int = 1
+    # Whether a duplicate (hedged) request was sent because the first one was slow.
+    hedged: bool = False
+
+
+@dataclass
+class SweepResult:
+    """Aggregate metrics for every (k, overlap threshold) pair of a sweep."""
+
+    ks: list[int]
+    overlap_thresholds: list[float]
+    metrics: dict[tuple[int, float], dict[str, float]]
 
 
 @dataclass
@@ -16,4 +36,94 @@ class EvaluationReport:
     dataset: Dataset
     aggregate_metrics: dict[str, float]
     query_results: list[QueryResult]
+    # How the adapter's index was obtained: "ingest", "snapshot", "update" (incremental from
+    # an earlier commit), or "skipped" when every query was answered from the retrieval cache.
+    index_source: str | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    peak_memory_mb: dict[str, float] = field(default_factory=dict)
+    sweep: SweepResult | None = None
+    # Query counts by status ("ok", "error", "timeout") plus "retried" and "hedged".
+    outcomes: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class LoadTestReport:
+    """Outcome of an open-loop load test against an adapter."""
+
+    dataset_name: str
+    arrival: str
+    target_qps: float
+    duration_s: float
+    sent: int
+    completed: int
+    errors: int
+    timeouts: int
+    achieved_qps: float
+    # Latency percentiles (seconds) of completed requests, measured from scheduled arrival.
+    latency: dict[str, float]
+    # (bucket upper bound in ms, count) pairs; the last bound is infinity.
+    histogram: list[tuple[float, int]]
+
+
+@dataclass
+class MatrixRow:
+    """Aggregate outcome of one (dataset, adapter) cell of a matrix run."""
+
+    dataset: str
+    adapter: str
+    aggregate_metrics: dict[str, float] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    queries: int = 0
+    failed_queries: int = 0
+    error: str | None = None
+
+
+@dataclass
+class MatrixReport:
+    rows: list[MatrixRow]
+
+
+@dataclass
+class RunRecord:
+    """One benchmark run as stored in the history database."""
+
+    id: int
+    created_at: str
+    dataset: str
+    repo_url: str
+    repo_commit: str | None
+    adapter: str
+    top_k: int | None
+    overlap_threshold: float | None
+    queries: int
+    failed_queries: int
+    aggregate_metrics: dict[str, float] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
+    label: str | None = None
+
+
+@dataclass
+class QueryDelta:
+    """Change in one metric for one query between two runs."""
+
+    query_id: str
+    text: str
+    before: float
+    after: float
+    latency_before_s: float | None = None
+    latency_after_s: float | None = None
+
+    @property
+    def delta(self) -> float:
+        return self.after - self.before
+
+
+@dataclass
+class RunComparison:
+    """Aggregate and per-query differences between a base run and a head run."""
 
+    base: RunRecord
+    head: RunRecord
+    metric: str
+    # Per-query deltas for `metric`, biggest regression first.
+    queries: list[QueryDelta]
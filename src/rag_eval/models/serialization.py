@@ -0,0 +1,23 @@
+from typing import Any
+
+from .chunk import CodeChunk
+
+
+def chunk_to_dict(chunk: CodeChunk) -> dict[str, Any]:
+    return {
+        "file_path": chunk.file_path,
+        "start_line": chunk.start_line,
+        "end_line": chunk.end_line,
+        "score": chunk.score,
+        "content": chunk.content,
+    }
+
+
+def chunk_from_dict(data: dict[str, Any]) -> CodeChunk:
+    return CodeChunk(
+        file_path=data["file_path"],
+        start_line=int(data["start_line"]),
+        end_line=int(data["end_line"]),
+        content=data.get("content", ""),
+        score=data.get("score"),
+    )
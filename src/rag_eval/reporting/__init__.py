@@ -1,5 +1,56 @@
-from .json_reporter import render_json
-from .markdown_reporter import render_markdown
+"""Report renderers. Submodules are imported on first attribute access."""
 
-__all__ = ["render_json", "render_markdown"]
+from typing import TYPE_CHECKING
 
+from rag_eval._lazy import attach
+
+if TYPE_CHECKING:
+    from .json_reporter import (
+        CONTENT_MODES,
+        render_comparison_json,
+        render_history_json,
+        render_json,
+        render_load_test_json,
+        render_matrix_json,
+    )
+    from .jsonl_reporter import JsonlResultWriter
+    from .markdown_reporter import (
+        render_comparison_markdown,
+        render_history_markdown,
+        render_load_test_markdown,
+        render_markdown,
+        render_matrix_markdown,
+    )
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "CONTENT_MODES": ".json_reporter",
+    "JsonlResultWriter": ".jsonl_reporter",
+    "render_comparison_json": ".json_reporter",
+    "render_comparison_markdown": ".markdown_reporter",
+    "render_history_json": ".json_reporter",
+    "render_history_markdown": ".markdown_reporter",
+    "render_json": ".json_reporter",
+    "render_load_test_json": ".json_reporter",
+    "render_load_test_markdown": ".markdown_reporter",
+    "render_markdown": ".markdown_reporter",
+    "render_matrix_json": ".json_reporter",
+    "render_matrix_markdown": ".markdown_reporter",
+}
+
+__all__ = [
+    "CONTENT_MODES",
+    "JsonlResultWriter",
+    "render_comparison_json",
+    "render_comparison_markdown",
+    "render_history_json",
+    "render_history_markdown",
+    "render_json",
+    "render_load_test_json",
+    "render_load_test_markdown",
+    "render_markdown",
+    "render_matrix_json",
+    "render_matrix_markdown",
+]
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
@@ -1,20 +1,35 @@
+import hashlib
 import json
 from typing import Any
 
-from rag_eval.models.results import EvaluationReport, QueryResult
+from rag_eval.models.chunk import CodeChunk
+from rag_eval.models.compact import without_content
+from rag_eval.models.results import (
+    EvaluationReport,
+    LoadTestReport,
+    MatrixReport,
+    QueryResult,
+    RunComparison,
+    RunRecord,
+    SweepResult,
+)
+from rag_eval.models.serialization import chunk_to_dict
 
+CONTENT_MODES = ("full", "hash", "none")
 
-def _chunk_to_dict(chunk) -> dict[str, Any]:
-    return {
-        "file_path": chunk.file_path,
-        "start_line": chunk.start_line,
-        "end_line": chunk.end_line,
-        "score": chunk.score,
-        "content": chunk.content,
-    }
+
+def _chunk_payload(chunk: CodeChunk, content: str) -> dict[str, Any]:
+    payload = chunk_to_dict(chunk)
+    if content == "hash":
+        payload["content_sha256"] = hashlib.sha256(payload.pop("content").encode()).hexdigest()
+    elif content == "none":
+        del payload["content"]
+    return payload
 
 
-def _query_result_to_dict(result: QueryResult) -> dict[str, Any]:
+def _query_result_to_dict(result: QueryResult, content: str = "full") -> dict[str, Any]:
+    # Compacted chunks only re-read their content from the checkout when it is written.
+    retrieved = without_content(result.retrieved) if content == "none" else result.retrieved
     return {
         "id": result.query.id,
         "text": result.query.text,
@@ -26,13 +41,29 @@ def _query_result_to_dict(result: QueryResult) -> dict[str, Any]:
             }
             for gt in result.query.ground_truth
         ],
-        "retrieved": [_chunk_to_dict(chunk) for chunk in result.retrieved],
+        "retrieved": [_chunk_payload(chunk, content) for chunk in retrieved],
         "metrics": result.metrics,
+        "error": result.error,
+        "latency_s": result.latency_s,
+        "status": result.status,
+        "attempts": result.attempts,
+        "hedged": result.hedged,
     }
 
 
-def render_json(report: EvaluationReport) -> str:
-    payload = {
+def _sweep_to_dict(sweep: SweepResult) -> dict[str, Any]:
+    return {
+        "ks": sweep.ks,
+        "overlap_thresholds": sweep.overlap_thresholds,
+        "points": [
+            {"k": k, "overlap_threshold": threshold, "metrics": metrics}
+            for (k, threshold), metrics in sweep.metrics.items()
+        ],
+    }
+
+
+def _report_summary(report: EvaluationReport) -> dict[str, Any]:
+    return {
         "dataset": {
             "name": report.dataset.name,
             "repo": {
@@ -42,7 +73,106 @@ def render_json(report: EvaluationReport) -> str:
             "top_k": report.dataset.top_k,
         },
         "aggregate_metrics": report.aggregate_metrics,
-        "queries": [_query_result_to_dict(r) for r in report.query_results],
+        "index_source": report.index_source,
+        "outcomes": report.outcomes,
+        "timings": report.timings,
+        "peak_memory_mb": report.peak_memory_mb,
+        "sweep": _sweep_to_dict(report.sweep) if report.sweep else None,
+    }
+
+
+def render_json(report: EvaluationReport, content: str = "full") -> str:
+    """Render the full report; `content` is one of `full`, `hash` (sha256) or `none`."""
+    if content not in CONTENT_MODES:
+        raise ValueError(f"content must be one of: {', '.join(CONTENT_MODES)}")
+    payload = _report_summary(report)
+    payload["queries"] = [_query_result_to_dict(r, content) for r in report.query_results]
+    return json.dumps(payload, indent=2)
+
+
+def render_load_test_json(report: LoadTestReport) -> str:
+    payload = {
+        "dataset": report.dataset_name,
+        "arrival": report.arrival,
+        "target_qps": report.target_qps,
+        "duration_s": report.duration_s,
+        "sent": report.sent,
+        "completed": report.completed,
+        "errors": report.errors,
+        "timeouts": report.timeouts,
+        "error_rate": report.errors / report.sent if report.sent else 0.0,
+        "timeout_rate": report.timeouts / report.sent if report.sent else 0.0,
+        "achieved_qps": report.achieved_qps,
+        "latency_s": report.latency,
+        "histogram_ms": [
+            {"le": "inf" if bound == float("inf") else bound, "count": count}
+            for bound, count in report.histogram
+        ],
     }
     return json.dumps(payload, indent=2)
 
+
+def render_matrix_json(report: MatrixReport) -> str:
+    payload = {
+        "rows": [
+            {
+                "dataset": row.dataset,
+                "adapter": row.adapter,
+                "queries": row.queries,
+                "failed_queries": row.failed_queries,
+                "aggregate_metrics": row.aggregate_metrics,
+                "timings": row.timings,
+                "error": row.error,
+            }
+            for row in report.rows
+        ]
+    }
+    return json.dumps(payload, indent=2)
+
+
+def _run_record_to_dict(run: RunRecord) -> dict[str, Any]:
+    return {
+        "id": run.id,
+        "created_at": run.created_at,
+        "dataset": run.dataset,
+        "repo": {"url": run.repo_url, "commit": run.repo_commit},
+        "adapter": run.adapter,
+        "top_k": run.top_k,
+        "overlap_threshold": run.overlap_threshold,
+        "queries": run.queries,
+        "failed_queries": run.failed_queries,
+        "aggregate_metrics": run.aggregate_metrics,
+        "timings": run.timings,
+        "label": run.label,
+    }
+
+
+def render_history_json(runs: list[RunRecord]) -> str:
+    return json.dumps({"runs": [_run_record_to_dict(run) for run in runs]}, indent=2)
+
+
+def render_comparison_json(comparison: RunComparison) -> str:
+    base, head = comparison.base, comparison.head
+    payload = {
+        "base": _run_record_to_dict(base),
+        "head": _run_record_to_dict(head),
+        "aggregate_deltas": {
+            name: head.aggregate_metrics[name] - value
+            for name, value in base.aggregate_metrics.items()
+            if name in head.aggregate_metrics
+        },
+        "metric": comparison.metric,
+        "queries": [
+            {
+                "id": delta.query_id,
+                "text": delta.text,
+                "before": delta.before,
+                "after": delta.after,
+                "delta": delta.delta,
+                "latency_before_s": delta.latency_before_s,
+                "latency_after_s": delta.latency_after_s,
+            }
+            for delta in comparison.queries
+        ],
+    }
+    return json.dumps(payload, indent=2)
@@ -0,0 +1,64 @@
+import json
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from rag_eval.models.results import EvaluationReport, QueryResult
+from rag_eval.reporting.json_reporter import (
+    CONTENT_MODES,
+    _query_result_to_dict,
+    _report_summary,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class JsonlResultWriter:
+    """Streams one JSON line per `QueryResult` as it completes, then a summary line.
+
+    Query lines have `"type": "query"` and the final line `"type": "summary"`. Lines are
+    flushed as they are written, so a crashed run still leaves every finished query on
+    disk. `write_result` is safe to call from several threads.
+
+    With `release_content`, each result's chunks are replaced by copies without content
+    once its line is written, so the run does not hold every chunk's text until it ends.
+    Compacted results (`ChunkView`s) hold no content and are left alone.
+    """
+
+    def __init__(
+        self, path: str | Path, content: str = "full", release_content: bool = False
+    ) -> None:
+        if content not in CONTENT_MODES:
+            raise ValueError(f"content must be one of: {', '.join(CONTENT_MODES)}")
+        self.path = Path(path)
+        self.content = content
+        self.release_content = release_content
+        self._lock = threading.Lock()
+        self._handle: IO[str] = self.path.open("w")
+
+    def _write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._handle.write(line)
+            self._handle.flush()
+
+    def write_result(self, result: QueryResult) -> None:
+        self._write({"type": "query", **_query_result_to_dict(result, self.content)})
+        if self.release_content and isinstance(result.retrieved, list):
+            # Copies, not in-place edits: the adapter may still hold the chunks it returned.
+            result.retrieved = [replace(chunk, content="") for chunk in result.retrieved]
+
+    def write_summary(self, report: EvaluationReport) -> None:
+        self._write({"type": "summary", **_report_summary(report)})
+
+    def close(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
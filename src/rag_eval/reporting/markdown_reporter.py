@@ -1,4 +1,13 @@
-from rag_eval.models.results import EvaluationReport, QueryResult
+from rag_eval.models.compact import without_content
+from rag_eval.models.results import (
+    EvaluationReport,
+    LoadTestReport,
+    MatrixReport,
+    QueryResult,
+    RunComparison,
+    RunRecord,
+    SweepResult,
+)
 
 
 def _format_metrics(metrics: dict) -> str:
@@ -12,8 +21,7 @@ def _format_ground_truth(result: QueryResult) -> str:
     if not result.query.ground_truth:
         return "_None provided_"
     items = [
-        f"- `{gt.file_path}:{gt.start_line}-{gt.end_line}`"
-        for gt in result.query.ground_truth
+        f"- `{gt.file_path}:{gt.start_line}-{gt.end_line}`" for gt in result.query.ground_truth
     ]
     return "\n".join(items)
 
@@ -22,7 +30,7 @@ def _format_retrieved(result: QueryResult, limit: int = 5) -> str:
     if not result.retrieved:
         return "_No results returned_"
     items = []
-    for chunk in result.retrieved[:limit]:
+    for chunk in without_content(result.retrieved)[:limit]:
         items.append(
             f"- `{chunk.file_path}:{chunk.start_line}-{chunk.end_line}`"
             + (f" (score={chunk.score:.3f})" if chunk.score is not None else "")
@@ -32,6 +40,45 @@ def _format_retrieved(result: QueryResult, limit: int = 5) -> str:
     return "\n".join(items)
 
 
+def _format_run(report: EvaluationReport) -> str:
+    lines = [f"Index source: `{report.index_source or 'unknown'}`"]
+    if report.outcomes:
+        lines.append("")
+        lines.append(
+            "Queries: " + ", ".join(f"{count} {key}" for key, count in report.outcomes.items())
+        )
+    if report.timings:
+        lines.append("")
+        lines.append("| timing | value |")
+        lines.append("| --- | --- |")
+        for key, value in report.timings.items():
+            lines.append(f"| {key} | {value:.4f} |")
+    if report.peak_memory_mb:
+        lines.append("")
+        lines.append("| phase | peak RSS (MiB) |")
+        lines.append("| --- | --- |")
+        for phase, value in report.peak_memory_mb.items():
+            lines.append(f"| {phase} | {value:.1f} |")
+    return "\n".join(lines)
+
+
+def _format_sweep(sweep: SweepResult) -> str:
+    # One table per metric: rows trace the curve over k, columns over overlap threshold.
+    metric_names = next(iter(sweep.metrics.values()), {}).keys()
+    header = "| k | " + " | ".join(f"overlap={t:g}" for t in sweep.overlap_thresholds) + " |"
+    divider = "| --- |" + " --- |" * len(sweep.overlap_thresholds)
+    sections = []
+    for name in metric_names:
+        lines = [f"#### {name}", header, divider]
+        for k in sweep.ks:
+            values = " | ".join(
+                f"{sweep.metrics[(k, t)][name]:.4f}" for t in sweep.overlap_thresholds
+            )
+            lines.append(f"| {k} | {values} |")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
 def render_markdown(report: EvaluationReport) -> str:
     lines = [f"# RAG Evaluation: {report.dataset.name}", ""]
 
@@ -39,11 +86,30 @@ def render_markdown(report: EvaluationReport) -> str:
     lines.append(_format_metrics(report.aggregate_metrics) or "_No queries evaluated_")
     lines.append("")
 
+    if report.sweep:
+        lines.append("## Metric Sweep")
+        lines.append(_format_sweep(report.sweep))
+        lines.append("")
+
+    lines.append("## Run")
+    lines.append(_format_run(report))
+    lines.append("")
+
     lines.append("## Per-Query Results")
     for result in report.query_results:
         lines.append(f"### {result.query.id} — {result.query.text}")
         lines.append(_format_metrics(result.metrics))
         lines.append("")
+        if result.latency_s is not None:
+            lines.append(f"Latency: {result.latency_s * 1000:.1f} ms")
+            lines.append("")
+        if result.status != "ok" or result.attempts > 1 or result.hedged:
+            hedged = ", hedged" if result.hedged else ""
+            lines.append(f"Status: {result.status} ({result.attempts} attempts{hedged})")
+            lines.append("")
+        if result.error:
+            lines.append(f"Error: `{result.error}`")
+            lines.append("")
         lines.append("Ground truth:")
         lines.append(_format_ground_truth(result))
         lines.append("")
@@ -53,3 +119,150 @@ def render_markdown(report: EvaluationReport) -> str:
 
     return "\n".join(lines).strip() + "\n"
 
+
+def render_load_test_markdown(report: LoadTestReport) -> str:
+    sent = report.sent or 1
+    lines = [f"# Load Test: {report.dataset_name}", ""]
+    lines.append("## Summary")
+    lines.append("| measure | value |")
+    lines.append("| --- | --- |")
+    lines.append(f"| arrival | {report.arrival} |")
+    lines.append(f"| target qps | {report.target_qps:.2f} |")
+    lines.append(f"| achieved qps | {report.achieved_qps:.2f} |")
+    lines.append(f"| duration (s) | {report.duration_s:.1f} |")
+    lines.append(f"| sent | {report.sent} |")
+    lines.append(f"| completed | {report.completed} |")
+    lines.append(f"| errors | {report.errors} ({report.errors / sent:.2%}) |")
+    lines.append(f"| timeouts | {report.timeouts} ({report.timeouts / sent:.2%}) |")
+    lines.append("")
+
+    lines.append("## Latency")
+    lines.append(
+        _format_metrics({f"{key} (ms)": value * 1000 for key, value in report.latency.items()})
+    )
+    lines.append("")
+
+    lines.append("## Histogram")
+    lines.append("| latency <= (ms) | count |")
+    lines.append("| --- | --- |")
+    for bound, count in report.histogram:
+        label = "inf" if bound == float("inf") else f"{bound:g}"
+        lines.append(f"| {label} | {count} |")
+    return "\n".join(lines).strip() + "\n"
+
+
+def render_matrix_markdown(report: MatrixReport) -> str:
+    metric_names: list[str] = []
+    for row in report.rows:
+        for name in row.aggregate_metrics:
+            if name not in metric_names:
+                metric_names.append(name)
+
+    columns = ["dataset", "adapter", *metric_names, "queries", "failed", "ingest_s", "qps"]
+    lines = ["# RAG Evaluation Matrix", ""]
+    lines.append("| " + " | ".join(columns) + " |")
+    lines.append("|" + " --- |" * len(columns))
+    errors = []
+    for row in report.rows:
+        metrics = [
+            f"{row.aggregate_metrics[name]:.4f}" if name in row.aggregate_metrics else "-"
+            for name in metric_names
+        ]
+        ingest = row.timings.get("ingest_s")
+        qps = row.timings.get("queries_per_s")
+        cells = [
+            row.dataset,
+            row.adapter,
+            *metrics,
+            str(row.queries),
+            str(row.failed_queries),
+            f"{ingest:.2f}" if ingest is not None else "-",
+            f"{qps:.2f}" if qps is not None else "-",
+        ]
+        lines.append("| " + " | ".join(cells) + " |")
+        if row.error:
+            errors.append(f"- {row.dataset} × {row.adapter}: `{row.error}`")
+
+    if errors:
+        lines.append("")
+        lines.append("## Errors")
+        lines.extend(errors)
+    return "\n".join(lines).strip() + "\n"
+
+
+def _metric_names(runs: list[RunRecord]) -> list[str]:
+    names: list[str] = []
+    for run in runs:
+        for name in run.aggregate_metrics:
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def _format_latency_ms(latency_s: float | None) -> str:
+    return f"{latency_s * 1000:.1f}" if latency_s is not None else "-"
+
+
+def render_history_markdown(runs: list[RunRecord]) -> str:
+    metric_names = _metric_names(runs)
+    columns = ["id", "created", "dataset", "adapter", "commit", *metric_names, "queries", "failed"]
+    lines = ["# Run History", ""]
+    if not runs:
+        lines.append("_No runs recorded_")
+        return "\n".join(lines).strip() + "\n"
+    lines.append("| " + " | ".join(columns) + " |")
+    lines.append("|" + " --- |" * len(columns))
+    for run in runs:
+        metrics = [
+            f"{run.aggregate_metrics[name]:.4f}" if name in run.aggregate_metrics else "-"
+            for name in metric_names
+        ]
+        cells = [
+            str(run.id),
+            run.created_at,
+            run.dataset,
+            run.adapter + (f" ({run.label})" if run.label else ""),
+            (run.repo_commit or "HEAD")[:12],
+            *metrics,
+            str(run.queries),
+            str(run.failed_queries),
+        ]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines).strip() + "\n"
+
+
+def render_comparison_markdown(comparison: RunComparison) -> str:
+    base, head = comparison.base, comparison.head
+    lines = [f"# Run {base.id} → Run {head.id}", ""]
+    lines.append(f"- Base: {base.dataset} / {base.adapter} @ {base.created_at}")
+    lines.append(f"- Head: {head.dataset} / {head.adapter} @ {head.created_at}")
+    lines.append("")
+
+    lines.append("## Aggregate Metrics")
+    lines.append("| metric | base | head | delta |")
+    lines.append("| --- | --- | --- | --- |")
+    for name in _metric_names([base, head]):
+        before = base.aggregate_metrics.get(name)
+        after = head.aggregate_metrics.get(name)
+        delta = after - before if before is not None and after is not None else None
+        lines.append(
+            f"| {name} "
+            f"| {f'{before:.4f}' if before is not None else '-'} "
+            f"| {f'{after:.4f}' if after is not None else '-'} "
+            f"| {f'{delta:+.4f}' if delta is not None else '-'} |"
+        )
+    lines.append("")
+
+    lines.append(f"## Per-Query {comparison.metric}")
+    if not comparison.queries:
+        lines.append("_No matching queries_")
+        return "\n".join(lines).strip() + "\n"
+    lines.append("| query | base | head | delta | base latency (ms) | head latency (ms) |")
+    lines.append("| --- | --- | --- | --- | --- | --- |")
+    for delta in comparison.queries:
+        lines.append(
+            f"| {delta.query_id} | {delta.before:.4f} | {delta.after:.4f} | {delta.delta:+.4f} "
+            f"| {_format_latency_ms(delta.latency_before_s)} "
+            f"| {_format_latency_ms(delta.latency_after_s)} |"
+        )
+    return "\n".join(lines).strip() + "\n"
@@ -1,5 +1,64 @@
-from .benchmark_runner import BenchmarkRunner
-from .dataset_loader import load_dataset, prepare_repo
+"""Benchmark runners and their supporting stores.
 
-__all__ = ["BenchmarkRunner", "load_dataset", "prepare_repo"]
+Submodules are imported on first attribute access, so importing the package (as the CLI does
+for every command) costs nothing until a command actually uses the runner, GitPython or PyYAML.
+"""
 
+from typing import TYPE_CHECKING
+
+from rag_eval._lazy import attach
+
+if TYPE_CHECKING:
+    from .adapter_loader import load_adapter
+    from .benchmark_runner import BenchmarkRunner, rescore
+    from .checkpoints import CheckpointStore
+    from .dataset_loader import load_dataset, open_dataset, prepare_repo
+    from .history import HistoryStore
+    from .load_test import run_load_test
+    from .matrix import load_matrix_config, run_matrix
+    from .profiling import PhaseProfiler
+    from .query_policy import QueryPolicy
+    from .retrieval_cache import RetrievalCache
+    from .snapshots import SnapshotStore
+    from .worker_pool import AdapterWorkerPool
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "AdapterWorkerPool": ".worker_pool",
+    "BenchmarkRunner": ".benchmark_runner",
+    "CheckpointStore": ".checkpoints",
+    "HistoryStore": ".history",
+    "PhaseProfiler": ".profiling",
+    "QueryPolicy": ".query_policy",
+    "RetrievalCache": ".retrieval_cache",
+    "SnapshotStore": ".snapshots",
+    "load_adapter": ".adapter_loader",
+    "load_dataset": ".dataset_loader",
+    "load_matrix_config": ".matrix",
+    "open_dataset": ".dataset_loader",
+    "prepare_repo": ".dataset_loader",
+    "rescore": ".benchmark_runner",
+    "run_load_test": ".load_test",
+    "run_matrix": ".matrix",
+}
+
+__all__ = [
+    "AdapterWorkerPool",
+    "BenchmarkRunner",
+    "CheckpointStore",
+    "HistoryStore",
+    "PhaseProfiler",
+    "QueryPolicy",
+    "RetrievalCache",
+    "SnapshotStore",
+    "load_adapter",
+    "load_dataset",
+    "load_matrix_config",
+    "open_dataset",
+    "prepare_repo",
+    "rescore",
+    "run_load_test",
+    "run_matrix",
+]
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
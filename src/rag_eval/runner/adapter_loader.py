@@ -0,0 +1,27 @@
+import importlib
+from typing import Any
+
+from rag_eval.interfaces import RAGSystem
+
+
+def load_adapter(adapter_spec: str, options: dict[str, Any] | None = None) -> RAGSystem:
+    """Instantiate a `module_path:ClassName` adapter, passing `options` as keyword arguments."""
+    return adapter_class(adapter_spec)(**(options or {}))
+
+
+def adapter_class(adapter_spec: str) -> type[RAGSystem]:
+    """Import and return the adapter class named by a `module_path:ClassName` spec."""
+    if ":" not in adapter_spec:
+        raise ValueError("Adapter must be in 'module_path:ClassName' format.")
+    module_name, class_name = adapter_spec.split(":", 1)
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as exc:
+        raise ValueError(f"Module not found: {module_name}") from exc
+    try:
+        adapter_cls: type[RAGSystem] = getattr(module, class_name)
+    except AttributeError as exc:
+        raise ValueError(f"Class '{class_name}' not found in '{module_name}'") from exc
+    if not isinstance(adapter_cls, type) or not issubclass(adapter_cls, RAGSystem):
+        raise TypeError(f"{class_name} must subclass rag_eval.interfaces.RAGSystem")
+    return adapter_cls
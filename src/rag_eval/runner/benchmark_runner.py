@@ -1,55 +1,677 @@
+import asyncio
+import json
+from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 from rag_eval.interfaces import RAGSystem
-from rag_eval.metrics.core import compute_metrics
-from rag_eval.models.dataset import Dataset, GroundTruthChunk, Query
-from rag_eval.models.results import EvaluationReport, QueryResult
-from rag_eval.runner.dataset_loader import load_dataset, prepare_repo
+from rag_eval.metrics.core import compute_metrics, sweep_metrics
+from rag_eval.models.chunk import CodeChunk
+from rag_eval.models.compact import ChunkStore, ContentResolver, without_content
+from rag_eval.models.dataset import Dataset, GroundTruthChunk, Query, RepoSpec
+from rag_eval.models.results import EvaluationReport, QueryResult, SweepResult
+from rag_eval.models.serialization import chunk_from_dict, chunk_to_dict
+from rag_eval.runner.checkpoints import Checkpoint, CheckpointStore
+from rag_eval.runner.dataset_loader import (
+    changed_files,
+    checkout_commit,
+    load_dataset,
+    prepare_repo,
+)
+from rag_eval.runner.instrumentation import RunStats
+from rag_eval.runner.profiling import PhaseProfiler
+from rag_eval.runner.query_policy import CallOutcome, PolicyCaller, QueryPolicy
+from rag_eval.runner.rate_limit import TokenBucket
+from rag_eval.runner.retrieval_cache import RetrievalCache
+from rag_eval.runner.snapshots import SnapshotStore
+
+
+@dataclass
+class _RunState:
+    """What `run` and `arun` share about one run; see `BenchmarkRunner._run_state`."""
+
+    dataset: Dataset
+    k: int
+    retrieve_k: int
+    adapter_id: str
+    reused: dict[int, QueryResult]
+    pending: list[Query]
+    notify: Callable[[QueryResult], None] | None
+    stats: RunStats
+    index_source: str = "skipped"
+    fresh: list[QueryResult] = field(default_factory=list)
 
 
 class BenchmarkRunner:
     """Coordinates ingestion, querying, and scoring for a dataset."""
 
-    def __init__(self, rag_system: RAGSystem, cache_dir: str | Path = ".rag_eval_cache") -> None:
+    def __init__(
+        self,
+        rag_system: RAGSystem,
+        cache_dir: str | Path = ".rag_eval_cache",
+        retrieval_cache: RetrievalCache | None = None,
+        snapshots: SnapshotStore | None = None,
+        checkpoints: CheckpointStore | None = None,
+        compact: bool = False,
+        profiler: PhaseProfiler | None = None,
+        query_policy: QueryPolicy | None = None,
+    ) -> None:
         self.rag_system = rag_system
         self.cache_dir = Path(cache_dir)
+        self.retrieval_cache = retrieval_cache
+        self.snapshots = snapshots
+        self.checkpoints = checkpoints
+        # Keep retrieved chunks in a ChunkStore without the adapter's content; reporters that
+        # write content re-read it from the checkout instead.
+        self.compact = compact
+        # Samples stacks per phase; the caller starts and stops it and writes the output.
+        self.profiler = profiler
+        # Deadlines, retries and hedging for adapter calls; the default calls once, inline.
+        self.query_policy = query_policy or QueryPolicy()
+        # The repo and full commit the adapter's index currently reflects, if known. Later
+        # runs on another commit of the same repo update the index instead of re-ingesting.
+        self._indexed: RepoSpec | None = None
 
     def run(
         self,
         dataset_path: str | Path,
         top_k: int | None = None,
         overlap_threshold: float = 0.5,
+        concurrency: int = 1,
+        batch_size: int = 1,
+        sweep_ks: list[int] | None = None,
+        sweep_thresholds: list[float] | None = None,
+        on_result: Callable[[QueryResult], None] | None = None,
+        resume: bool = False,
+    ) -> EvaluationReport:
+        """Benchmark the adapter on a dataset.
+
+        Passing `sweep_ks` and/or `sweep_thresholds` retrieves once at the largest k and also
+        reports aggregate metrics for every (k, threshold) pair in `EvaluationReport.sweep`.
+        `on_result` is called with each `QueryResult` as soon as it is scored (from worker
+        threads when `concurrency > 1`), e.g. to stream results to disk.
+
+        With a `CheckpointStore`, each completed query is checkpointed as it finishes;
+        `resume=True` skips queries an earlier run with the same dataset, adapter and
+        parameters already completed, and the report covers old and new results together.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        with self._run_state(
+            dataset_path, top_k, overlap_threshold, sweep_ks, on_result, resume
+        ) as state:
+            if state.pending:
+                state.index_source = self._prepare_index(
+                    state.dataset, state.adapter_id, state.stats
+                )
+                with state.stats.phase("query"):
+                    state.fresh = self._run_queries(
+                        state.pending,
+                        state.retrieve_k,
+                        state.k,
+                        overlap_threshold,
+                        concurrency,
+                        batch_size,
+                        state.notify,
+                    )
+        return self._report(state, overlap_threshold, sweep_ks, sweep_thresholds)
+
+    async def arun(
+        self,
+        dataset_path: str | Path,
+        top_k: int | None = None,
+        overlap_threshold: float = 0.5,
+        max_in_flight: int = 8,
+        rate_limit: float | None = None,
+        sweep_ks: list[int] | None = None,
+        sweep_thresholds: list[float] | None = None,
+        on_result: Callable[[QueryResult], None] | None = None,
+        resume: bool = False,
+    ) -> EvaluationReport:
+        """Async variant of `run` driven by the adapter's `aingest`/`aquery` hooks."""
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+
+        with self._run_state(
+            dataset_path, top_k, overlap_threshold, sweep_ks, on_result, resume
+        ) as state:
+            if state.pending:
+                state.index_source = await self._aprepare_index(
+                    state.dataset, state.adapter_id, state.stats
+                )
+                with state.stats.phase("query"):
+                    state.fresh = await self._arun_queries(
+                        state.pending,
+                        state.retrieve_k,
+                        state.k,
+                        overlap_threshold,
+                        max_in_flight,
+                        rate_limit,
+                        state.notify,
+                    )
+        return self._report(state, overlap_threshold, sweep_ks, sweep_thresholds)
+
+    @contextmanager
+    def _run_state(
+        self,
+        dataset_path: str | Path,
+        top_k: int | None,
+        overlap_threshold: float,
+        sweep_ks: list[int] | None,
+        on_result: Callable[[QueryResult], None] | None,
+        resume: bool,
+    ) -> Iterator[_RunState]:
+        """Set up a run around its query step, which is all `run` and `arun` do differently.
+
+        Loads the dataset, opens the checkpoint and scores what it or the retrieval cache
+        already answered; the caller fills in `index_source` and `fresh` for the rest. On
+        exit, the latencies are recorded, fresh retrievals cached, and the checkpoint closed.
+        """
+        with self._profiled("load_dataset"):
+            dataset = load_dataset(dataset_path, cache_dir=self.cache_dir)
+        k = top_k or dataset.top_k
+        retrieve_k = max([k, *(sweep_ks or [])])
+        # Taken once, before ingest, so every cache and checkpoint lookup uses the same key.
+        adapter_id = self.rag_system.fingerprint()
+        checkpoint = self._open_checkpoint(
+            dataset_path, adapter_id, retrieve_k, k, overlap_threshold, resume
+        )
+        succeeded = False
+        try:
+            compact = self._compactor(dataset)
+            with self._profiled("compute_metrics"):
+                reused = self._reuse(
+                    dataset,
+                    adapter_id,
+                    retrieve_k,
+                    k,
+                    overlap_threshold,
+                    checkpoint,
+                    _chain(compact, on_result),
+                )
+            to_cache: dict[str, str] = {}
+            state = _RunState(
+                dataset=dataset,
+                k=k,
+                retrieve_k=retrieve_k,
+                adapter_id=adapter_id,
+                reused=reused,
+                pending=[q for i, q in enumerate(dataset.queries) if i not in reused],
+                notify=_chain(
+                    checkpoint.record if checkpoint else None,
+                    self._cache_recorder(to_cache),
+                    compact,
+                    on_result,
+                ),
+                stats=RunStats(profiler=self.profiler),
+            )
+            yield state
+            if state.fresh:
+                latencies = [r.latency_s for r in state.fresh if r.latency_s is not None]
+                state.stats.record_queries(latencies)
+                self._store_cached(dataset, adapter_id, retrieve_k, to_cache)
+            succeeded = all(result.error is None for result in state.fresh)
+        finally:
+            if checkpoint is not None:
+                # Nothing is left to resume once every query succeeded; otherwise keep the
+                # file so --resume retries only what failed or never ran.
+                checkpoint.close(discard=succeeded)
+
+    def _report(
+        self,
+        state: _RunState,
+        overlap_threshold: float,
+        sweep_ks: list[int] | None,
+        sweep_thresholds: list[float] | None,
     ) -> EvaluationReport:
-        dataset = load_dataset(dataset_path)
-        repo_path = prepare_repo(dataset.repo, self.cache_dir)
+        query_results = _merge(state.dataset.queries, state.reused, state.fresh)
+        with self._profiled("compute_metrics"):
+            return build_report(
+                state.dataset,
+                query_results,
+                index_source=state.index_source,
+                stats=state.stats,
+                sweep=_sweep(query_results, state.k, overlap_threshold, sweep_ks, sweep_thresholds),
+            )
+
+    def _profiled(self, phase: str) -> AbstractContextManager[None]:
+        return self.profiler.phase(phase) if self.profiler is not None else nullcontext()
 
+    def _clear(self) -> None:
         try:
             self.rag_system.clear()
         except NotImplementedError:
             pass
 
-        self.rag_system.ingest(str(repo_path))
+    def _prepare_index(self, dataset: Dataset, adapter_id: str, stats: RunStats) -> str:
+        """Bring the adapter's index to the dataset's commit; return how it was done.
 
-        k = top_k or dataset.top_k
-        query_results = [self._run_single(q, k, overlap_threshold) for q in dataset.queries]
-        aggregate = self._aggregate(query_results)
-        return EvaluationReport(dataset=dataset, aggregate_metrics=aggregate, query_results=query_results)
-
-    def _run_single(
-        self, query: Query, top_k: int, overlap_threshold: float
-    ) -> QueryResult:
-        retrieved = self.rag_system.query(query.text, top_k=top_k)
-        metrics = compute_metrics(retrieved, query.ground_truth, top_k, overlap_threshold)
-        return QueryResult(query=query, retrieved=retrieved, metrics=metrics)
-
-    def _aggregate(self, query_results: list[QueryResult]) -> dict:
-        if not query_results:
+        In order of preference: restore a snapshot of that commit (`snapshot`), update an
+        index of an earlier commit of the same repo with the changed files (`update`), or
+        ingest from scratch (`ingest`).
+        """
+        source, repo_path, commit = self._restore_or_update(dataset, adapter_id, stats)
+        if source is not None:
+            return source
+        with stats.phase("ingest"):
+            self._clear()
+            self.rag_system.ingest(str(repo_path))
+        self._indexed_at(dataset, commit, adapter_id)
+        return "ingest"
+
+    async def _aprepare_index(self, dataset: Dataset, adapter_id: str, stats: RunStats) -> str:
+        source, repo_path, commit = await asyncio.to_thread(
+            self._restore_or_update, dataset, adapter_id, stats
+        )
+        if source is not None:
+            return source
+        with stats.phase("ingest"):
+            self._clear()
+            await self.rag_system.aingest(str(repo_path))
+        await asyncio.to_thread(self._indexed_at, dataset, commit, adapter_id)
+        return "ingest"
+
+    def _restore_or_update(
+        self, dataset: Dataset, adapter_id: str, stats: RunStats
+    ) -> tuple[str | None, Path | None, str | None]:
+        """Try every way of indexing short of a full ingest.
+
+        Returns the index source if one worked, else the checkout and commit to ingest.
+        """
+        with stats.phase("prepare_repo"):
+            repo_path = prepare_repo(dataset.repo, self.cache_dir)
+            commit = checkout_commit(repo_path)
+        # Snapshots are keyed and diffed by the full SHA, never by the dataset's revision,
+        # which may name a branch that has moved since the snapshot was taken.
+        resolved = RepoSpec(url=dataset.repo.url, commit=commit)
+        if self.snapshots is not None:
+            with stats.phase("ingest"):
+                restored = self.snapshots.restore(self.rag_system, adapter_id, resolved)
+            if restored:
+                self._indexed = resolved
+                return "snapshot", repo_path, commit
+
+        with stats.phase("ingest"):
+            updated = self._update(dataset.repo.url, repo_path, commit, adapter_id)
+        if not updated:
+            return None, repo_path, commit
+        self._indexed_at(dataset, commit, adapter_id)
+        return "update", repo_path, commit
+
+    def _indexed_at(self, dataset: Dataset, commit: str, adapter_id: str) -> None:
+        self._indexed = RepoSpec(url=dataset.repo.url, commit=commit)
+        if self.snapshots is not None:
+            self.snapshots.save(self.rag_system, adapter_id, self._indexed)
+
+    def _update(self, url: str, repo_path: Path, commit: str, adapter_id: str) -> bool:
+        """Apply the diff from the indexed commit to `commit`; False if a full ingest is needed.
+
+        The base is the index this runner last built for `url`, or else the newest snapshot
+        of any commit of `url`.
+        """
+        base, self._indexed = self._indexed, None
+        if not _supports_update(self.rag_system):
+            return False
+        if base is not None and base.url == url:
+            base_commit = base.commit
+        elif self.snapshots is not None:
+            base_commit = self.snapshots.restore_latest(self.rag_system, adapter_id, url)
+        else:
+            base_commit = None
+        if base_commit is None:
+            return False
+        try:
+            changed, deleted = changed_files(repo_path, base_commit, commit)
+            self.rag_system.update(changed, deleted, str(repo_path))
+        except (ValueError, NotImplementedError):
+            return False
+        return True
+
+    def _open_checkpoint(
+        self,
+        dataset_path: str | Path,
+        adapter_id: str,
+        retrieve_k: int,
+        top_k: int,
+        overlap_threshold: float,
+        resume: bool,
+    ) -> Checkpoint | None:
+        if self.checkpoints is None:
+            if resume:
+                raise ValueError("resume requires a CheckpointStore")
+            return None
+        params = {"retrieve_k": retrieve_k, "top_k": top_k, "overlap_threshold": overlap_threshold}
+        return self.checkpoints.open(dataset_path, adapter_id, params, resume=resume)
+
+    def _compactor(self, dataset: Dataset) -> Callable[[QueryResult], None] | None:
+        if not self.compact:
+            return None
+        store = ChunkStore(ContentResolver(lambda: prepare_repo(dataset.repo, self.cache_dir)))
+
+        def compact(result: QueryResult) -> None:
+            result.retrieved = store.append(result.retrieved)
+
+        return compact
+
+    def _reuse(
+        self,
+        dataset: Dataset,
+        adapter_id: str,
+        retrieve_k: int,
+        top_k: int,
+        overlap_threshold: float,
+        checkpoint: Checkpoint | None,
+        notify: Callable[[QueryResult], None] | None,
+    ) -> dict[int, QueryResult]:
+        """Score queries already answered by the checkpoint or retrieval cache.
+
+        Returns results keyed by position in the dataset. Cache hits are written to the
+        checkpoint too, so it stays complete for a later resume.
+        """
+        completed = checkpoint.completed if checkpoint is not None else {}
+        cached = self._load_cached(dataset, adapter_id, retrieve_k)
+        reused: dict[int, QueryResult] = {}
+        for position, query in enumerate(dataset.queries):
+            if query.text in completed:
+                retrieved, latency = completed[query.text]
+                result = score_query(query, retrieved, top_k, overlap_threshold, latency_s=latency)
+            elif query.text in cached:
+                result = score_query(
+                    query, cached[query.text], top_k, overlap_threshold, attempts=0
+                )
+                if checkpoint is not None:
+                    checkpoint.record(result)
+            else:
+                continue
+            reused[position] = result
+            if notify is not None:
+                notify(result)
+        return reused
+
+    def _load_cached(
+        self, dataset: Dataset, adapter_id: str, top_k: int
+    ) -> dict[str, list[CodeChunk]]:
+        if self.retrieval_cache is None:
             return {}
+        return self.retrieval_cache.load(adapter_id, dataset.repo, top_k)
+
+    def _cache_recorder(self, sink: dict[str, str]) -> Callable[[QueryResult], None] | None:
+        """Capture successful retrievals for the retrieval cache as they arrive.
+
+        This runs before compaction, which drops chunk content; each entry is kept as one
+        JSON string, so a compact run does not hold chunk objects until the end.
+        """
+        if self.retrieval_cache is None:
+            return None
+
+        def record(result: QueryResult) -> None:
+            if result.error is None:
+                chunks = [chunk_to_dict(chunk) for chunk in result.retrieved]
+                sink[result.query.text] = json.dumps(chunks)
+
+        return record
+
+    def _store_cached(
+        self, dataset: Dataset, adapter_id: str, top_k: int, encoded: dict[str, str]
+    ) -> None:
+        if self.retrieval_cache is None:
+            return
+        retrievals = {
+            text: [chunk_from_dict(chunk) for chunk in json.loads(chunks)]
+            for text, chunks in encoded.items()
+        }
+        self.retrieval_cache.save(adapter_id, dataset.repo, top_k, retrievals)
+
+    def _run_queries(
+        self,
+        queries: list[Query],
+        retrieve_k: int,
+        top_k: int,
+        overlap_threshold: float,
+        concurrency: int,
+        batch_size: int = 1,
+        on_result: Callable[[QueryResult], None] | None = None,
+    ) -> list[QueryResult]:
+        units = [queries[i : i + batch_size] for i in range(0, len(queries), batch_size)]
+        caller = PolicyCaller(self.query_policy)
+
+        def run_unit(unit: list[Query]) -> list[QueryResult]:
+            if batch_size == 1:
+                outcomes = [self._retrieve(unit[0], retrieve_k, caller)]
+            else:
+                outcomes = self._retrieve_batch(unit, retrieve_k, caller)
+            results = [
+                _score_outcome(query, outcome, top_k, overlap_threshold)
+                for query, outcome in zip(unit, outcomes)
+            ]
+            if on_result is not None:
+                for result in results:
+                    on_result(result)
+            return results
+
+        if concurrency == 1:
+            batches = [run_unit(unit) for unit in units]
+        else:
+            # Adapters are dominated by I/O waits, so threads are enough; map() keeps order.
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                batches = list(pool.map(run_unit, units))
+        return [result for batch in batches for result in batch]
+
+    async def _arun_queries(
+        self,
+        queries: list[Query],
+        retrieve_k: int,
+        top_k: int,
+        overlap_threshold: float,
+        max_in_flight: int,
+        rate_limit: float | None,
+        on_result: Callable[[QueryResult], None] | None = None,
+    ) -> list[QueryResult]:
+        in_flight = asyncio.Semaphore(max_in_flight)
+        bucket = TokenBucket(rate_limit) if rate_limit else None
+        caller = PolicyCaller(self.query_policy)
+
+        async def run_one(query: Query) -> QueryResult:
+            async with in_flight:
+                if bucket is not None:
+                    await bucket.acquire()
+                outcome = await self._aretrieve(query, retrieve_k, caller)
+            result = _score_outcome(query, outcome, top_k, overlap_threshold)
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        # gather() returns results in argument order, so dataset order is preserved.
+        return list(await asyncio.gather(*(run_one(q) for q in queries)))
+
+    def _retrieve(self, query: Query, top_k: int, caller: PolicyCaller) -> CallOutcome:
+        # Adapter exceptions and timeouts come back as the outcome's status, never raised.
+        return caller.call(lambda: self.rag_system.query(query.text, top_k=top_k))
+
+    def _retrieve_batch(
+        self, queries: list[Query], top_k: int, caller: PolicyCaller
+    ) -> list[CallOutcome]:
+        def query_batch() -> list[list[CodeChunk]]:
+            retrieved = self.rag_system.query_batch([q.text for q in queries], top_k=top_k)
+            if len(retrieved) != len(queries):
+                raise ValueError(
+                    f"query_batch returned {len(retrieved)} results for {len(queries)} queries"
+                )
+            return retrieved
+
+        # The policy applies to the batch call as a whole, and every query in it waits for
+        # the whole call, so each gets the batch's outcome and latency.
+        outcome = caller.call(query_batch)
+        if outcome.status != "ok":
+            return [outcome] * len(queries)
+        return [replace(outcome, value=chunks) for chunks in outcome.value]
+
+    async def _aretrieve(self, query: Query, top_k: int, caller: PolicyCaller) -> CallOutcome:
+        return await caller.acall(lambda: self.rag_system.aquery(query.text, top_k=top_k))
+
+
+def score_query(
+    query: Query,
+    retrieved: list[CodeChunk],
+    top_k: int,
+    overlap_threshold: float,
+    error: str | None = None,
+    latency_s: float | None = None,
+    status: str | None = None,
+    attempts: int = 1,
+    hedged: bool = False,
+) -> QueryResult:
+    metrics = compute_metrics(retrieved, query.ground_truth, top_k, overlap_threshold)
+    return QueryResult(
+        query=query,
+        retrieved=retrieved,
+        metrics=metrics,
+        error=error,
+        latency_s=latency_s,
+        status=status or ("error" if error else "ok"),
+        attempts=attempts,
+        hedged=hedged,
+    )
+
+
+def _score_outcome(
+    query: Query, outcome: CallOutcome, top_k: int, overlap_threshold: float
+) -> QueryResult:
+    return score_query(
+        query,
+        outcome.value or [],
+        top_k,
+        overlap_threshold,
+        error=outcome.error,
+        latency_s=outcome.latency_s,
+        status=outcome.status,
+        attempts=outcome.attempts,
+        hedged=outcome.hedged,
+    )
+
+
+def build_report(
+    dataset: Dataset,
+    query_results: list[QueryResult],
+    index_source: str | None = None,
+    stats: RunStats | None = None,
+    sweep: SweepResult | None = None,
+) -> EvaluationReport:
+    stats = stats or RunStats()
+    return EvaluationReport(
+        dataset=dataset,
+        aggregate_metrics=aggregate_metrics(query_results),
+        query_results=query_results,
+        index_source=index_source,
+        timings=stats.timings,
+        peak_memory_mb=stats.peak_memory_mb,
+        sweep=sweep,
+        outcomes=query_outcomes(query_results),
+    )
+
+
+def query_outcomes(query_results: list[QueryResult]) -> dict[str, int]:
+    """Count results per status, plus how many queries were retried or hedged."""
+    counts = Counter(result.status for result in query_results)
+    counts["retried"] = sum(1 for result in query_results if result.attempts > 1)
+    counts["hedged"] = sum(1 for result in query_results if result.hedged)
+    return {key: counts[key] for key in ("ok", "error", "timeout", "retried", "hedged")}
+
+
+def aggregate_metrics(query_results: list[QueryResult]) -> dict:
+    return _mean_metrics([result.metrics for result in query_results])
+
+
+def _mean_metrics(per_query: list[dict[str, float]]) -> dict:
+    if not per_query:
+        return {}
+
+    keys = per_query[0].keys()
+    sums = {k: 0.0 for k in keys}
+    for metrics in per_query:
+        for key, value in metrics.items():
+            sums[key] += value
+    return {key: sums[key] / len(per_query) for key in keys}
+
+
+def _sweep(
+    query_results: list[QueryResult],
+    top_k: int,
+    overlap_threshold: float,
+    ks: list[int] | None,
+    thresholds: list[float] | None,
+) -> SweepResult | None:
+    if not ks and not thresholds:
+        return None
+    ks = sorted(set(ks or [top_k]))
+    thresholds = sorted(set(thresholds or [overlap_threshold]))
+    grids = [
+        sweep_metrics(without_content(result.retrieved), result.query.ground_truth, ks, thresholds)
+        for result in query_results
+    ]
+    metrics = {
+        point: _mean_metrics([grid[point] for grid in grids])
+        for point in ((k, threshold) for k in ks for threshold in thresholds)
+    }
+    return SweepResult(ks=ks, overlap_thresholds=thresholds, metrics=metrics)
+
+
+def rescore(
+    dataset: Dataset,
+    retrievals: dict[str, list[CodeChunk]],
+    top_k: int | None = None,
+    overlap_threshold: float = 0.5,
+    sweep_ks: list[int] | None = None,
+    sweep_thresholds: list[float] | None = None,
+) -> EvaluationReport:
+    """Score previously retrieved chunks against a dataset without touching an adapter.
+
+    Each retrieval is truncated to the largest of `top_k` and `sweep_ks`, as if the adapter
+    had been queried at that k, so retrievals cached at a larger k can be rescored at less.
+    """
+    k = top_k or dataset.top_k
+    retrieve_k = max([k, *(sweep_ks or [])])
+    query_results = [
+        score_query(q, retrievals[q.text][:retrieve_k], k, overlap_threshold, attempts=0)
+        if q.text in retrievals
+        else score_query(q, [], k, overlap_threshold, error="No cached retrieval", attempts=0)
+        for q in dataset.queries
+    ]
+    return build_report(
+        dataset,
+        query_results,
+        sweep=_sweep(query_results, k, overlap_threshold, sweep_ks, sweep_thresholds),
+    )
+
+
+def _merge(
+    queries: list[Query], reused: dict[int, QueryResult], fresh: list[QueryResult]
+) -> list[QueryResult]:
+    """Interleave reused and freshly run results back into dataset order."""
+    fresh_iter = iter(fresh)
+    return [reused[i] if i in reused else next(fresh_iter) for i in range(len(queries))]
+
+
+def _chain(
+    *callbacks: Callable[[QueryResult], None] | None,
+) -> Callable[[QueryResult], None] | None:
+    active = [callback for callback in callbacks if callback is not None]
+    if not active:
+        return None
+
+    def notify(result: QueryResult) -> None:
+        for callback in active:
+            callback(result)
+
+    return notify
 
-        keys = query_results[0].metrics.keys()
-        sums = {k: 0.0 for k in keys}
-        for result in query_results:
-            for key, value in result.metrics.items():
-                sums[key] += value
-        return {key: sums[key] / len(query_results) for key in keys}
 
+def _supports_update(rag_system: RAGSystem) -> bool:
+    # Only worth finding a base index when the adapter overrides the hook.
+    return type(rag_system).update is not RAGSystem.update
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+from rag_eval.models.chunk import CodeChunk
+from rag_eval.models.results import QueryResult
+from rag_eval.models.serialization import chunk_from_dict, chunk_to_dict
+
+# Completed query: (retrieved chunks, adapter call latency in seconds)
+Completed = tuple[list[CodeChunk], float | None]
+
+
+class Checkpoint:
+    """An open checkpoint file: results completed earlier plus an append-only writer.
+
+    Each successful `QueryResult` is appended as one JSON line and flushed, so a crash loses
+    at most the line being written. Failed queries are not recorded and run again on resume.
+    `record` is safe to call from several threads.
+    """
+
+    def __init__(self, path: Path, completed: dict[str, Completed]) -> None:
+        self.path = path
+        self.completed = completed
+        self._lock = threading.Lock()
+        self._handle: IO[str] = path.open("a")
+
+    def record(self, result: QueryResult) -> None:
+        if result.error is not None:
+            return
+        record = {
+            "text": result.query.text,
+            "retrieved": [chunk_to_dict(chunk) for chunk in result.retrieved],
+            "latency_s": result.latency_s,
+        }
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._handle.write(line)
+            self._handle.flush()
+
+    def close(self, discard: bool = False) -> None:
+        """Close the file; with `discard`, delete it as well."""
+        with self._lock:
+            self._handle.close()
+        if discard:
+            self.path.unlink(missing_ok=True)
+
+
+class CheckpointStore:
+    """Per-run checkpoints of completed queries, for resuming interrupted runs.
+
+    One JSONL file per (dataset file hash, adapter fingerprint, run parameters), so a resumed
+    run only reuses results produced by the same adapter on the same dataset and settings.
+    The runner deletes a checkpoint once every query of its run has succeeded.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, dataset_path: str | Path, adapter_id: str, params: dict[str, Any]) -> Path:
+        dataset_hash = hashlib.sha256(Path(dataset_path).read_bytes()).hexdigest()
+        key = json.dumps([dataset_hash, adapter_id, params], sort_keys=True)
+        return self.root / f"{hashlib.sha256(key.encode()).hexdigest()}.jsonl"
+
+    def open(
+        self,
+        dataset_path: str | Path,
+        adapter_id: str,
+        params: dict[str, Any],
+        resume: bool = False,
+    ) -> Checkpoint:
+        """Open the checkpoint for a run; without `resume` any earlier one is discarded."""
+        path = self.path_for(dataset_path, adapter_id, params)
+        self.root.mkdir(parents=True, exist_ok=True)
+        completed = _load(path) if resume else {}
+        if not resume:
+            path.write_text("")
+        return Checkpoint(path, completed)
+
+
+def _load(path: Path) -> dict[str, Completed]:
+    if not path.exists():
+        return {}
+    raw = path.read_text()
+    complete, _, partial = raw.rpartition("\n")
+    if partial:
+        # The previous run died mid-line; drop the fragment so appends start on a new line.
+        path.write_text(complete + "\n" if complete else "")
+    completed: dict[str, Completed] = {}
+    for line in complete.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        completed[record["text"]] = (
+            [chunk_from_dict(chunk) for chunk in record["retrieved"]],
+            record.get("latency_s"),
+        )
+    return completed
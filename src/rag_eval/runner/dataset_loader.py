@@ -1,67 +1,245 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
-
-import git
-import yaml
+from typing import TYPE_CHECKING, Any
 
 from rag_eval.models.dataset import Dataset, GroundTruthChunk, Query, RepoSpec
+from rag_eval.runner.locking import file_lock
+
+# GitPython and PyYAML are imported where they are used: GitPython only matters when a repo
+# is prepared, PyYAML only for YAML datasets that miss the parse cache, and both are slow to
+# import for CLI commands that need neither.
+if TYPE_CHECKING:
+    import git
+
+# Bump when the model classes change shape so stale pickles are ignored.
+_DATASET_CACHE_VERSION = 2
 
 
-def _require(data: dict, key: str, context: str) -> Any:
+def require_field(data: dict, key: str, context: str) -> Any:
+    """Return `data[key]`, raising ValueError that names `context` when it is missing."""
     if key not in data:
         raise ValueError(f"Missing required field '{key}' in {context}")
     return data[key]
 
 
-def load_dataset(path: str | Path) -> Dataset:
+def _parse_query(q: dict) -> Query:
+    query_id = require_field(q, "id", "query")
+    text = require_field(q, "text", f"query {query_id}")
+    context = f"query {query_id} ground_truth"
+    gt_chunks = [
+        GroundTruthChunk(
+            file_path=require_field(gt, "file_path", context),
+            start_line=int(require_field(gt, "start_line", context)),
+            end_line=int(require_field(gt, "end_line", context)),
+        )
+        for gt in q.get("ground_truth", [])
+    ]
+    return Query(id=query_id, text=text, ground_truth=gt_chunks)
+
+
+def _parse_header(data: dict) -> Dataset:
+    name = require_field(data, "name", "dataset")
+    repo_data = require_field(data, "repo", "dataset")
+    repo = RepoSpec(url=require_field(repo_data, "url", "repo"), commit=repo_data.get("commit"))
+    return Dataset(name=name, repo=repo, queries=[], top_k=int(data.get("top_k", 10)))
+
+
+def _is_jsonl(path: Path) -> bool:
+    return path.suffix == ".jsonl"
+
+
+def _iter_jsonl(path: Path) -> Iterator[tuple[int, dict]]:
+    with path.open() as handle:
+        for lineno, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield lineno, json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON on line {lineno} of {path}: {exc}") from exc
+
+
+def open_dataset(path: str | Path) -> tuple[Dataset, Iterator[Query]]:
+    """Return a dataset's header (with no queries) and a lazy iterator over its queries.
+
+    JSONL datasets are read line by line, so memory stays flat however large the file is.
+    """
+    dataset_path = Path(path)
+    if not dataset_path.exists():
+        raise FileNotFoundError(f"Dataset not found: {dataset_path}")
+
+    if _is_jsonl(dataset_path):
+        records = _iter_jsonl(dataset_path)
+        first = next(records, None)
+        if first is None:
+            raise ValueError(f"Dataset {dataset_path} is empty")
+        header = _parse_header(first[1])
+        return header, (_parse_query(record) for _, record in records)
+
+    data = _load_yaml(dataset_path.read_text())
+    header = _parse_header(data)
+    queries_data = require_field(data, "queries", "dataset")
+    return header, (_parse_query(q) for q in queries_data)
+
+
+def _load_yaml(text: str) -> Any:
+    import yaml
+
+    # libyaml's C parser is several times faster; fall back to pure Python when it is missing.
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def load_dataset(path: str | Path, cache_dir: str | Path | None = None) -> Dataset:
+    """Load a YAML or JSONL dataset.
+
+    A JSONL dataset has a header object (`name`, `repo`, `top_k`) on its first line and one
+    query object per following line. With `cache_dir`, the parsed dataset is pickled under
+    `<cache_dir>/datasets`, keyed by the file's content hash, so loading an unchanged file
+    again skips parsing and validation.
+    """
     dataset_path = Path(path)
     if not dataset_path.exists():
         raise FileNotFoundError(f"Dataset not found: {dataset_path}")
 
-    data = yaml.safe_load(dataset_path.read_text())
-    name = _require(data, "name", "dataset")
-    repo_data = _require(data, "repo", "dataset")
-    repo = RepoSpec(url=_require(repo_data, "url", "repo"), commit=repo_data.get("commit"))
-
-    queries_data = _require(data, "queries", "dataset")
-    queries = []
-    for q in queries_data:
-        query_id = _require(q, "id", "query")
-        text = _require(q, "text", f"query {query_id}")
-        gt_chunks = [
-            GroundTruthChunk(
-                file_path=_require(gt, "file_path", f"query {query_id} ground_truth"),
-                start_line=int(_require(gt, "start_line", f"query {query_id} ground_truth")),
-                end_line=int(_require(gt, "end_line", f"query {query_id} ground_truth")),
-            )
-            for gt in q.get("ground_truth", [])
-        ]
-        queries.append(Query(id=query_id, text=text, ground_truth=gt_chunks))
-
-    return Dataset(
-        name=name,
-        repo=repo,
-        queries=queries,
-        top_k=int(data.get("top_k", 10)),
-    )
+    cache_path = None
+    if cache_dir is not None:
+        digest = hashlib.sha256(dataset_path.read_bytes()).hexdigest()
+        cache_path = Path(cache_dir) / "datasets" / f"{digest}-v{_DATASET_CACHE_VERSION}.pickle"
+        try:
+            with cache_path.open("rb") as handle:
+                return pickle.load(handle)
+        except FileNotFoundError:
+            pass
+        except Exception:  # noqa: BLE001 - a corrupt or stale cache entry is just a miss
+            cache_path.unlink(missing_ok=True)
+
+    header, queries = open_dataset(dataset_path)
+    header.queries = list(queries)
+    if cache_path is not None:
+        _write_pickle(cache_path, header)
+    return header
+
+
+def _write_pickle(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 def prepare_repo(repo: RepoSpec, cache_dir: Path) -> Path:
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    """Return a checkout of `repo` at its pinned commit (or the remote HEAD).
+
+    Every URL is fetched into one shared bare repository, and each commit is checked out
+    into its own worktree, so runs on different commits of a repo never disturb each other.
+    Pinned commits are fetched shallowly on first use; once present locally, preparing them
+    needs no network access. A file lock per bare repository makes this safe to call from
+    concurrent processes.
+    """
+    # git runs with the bare repo as its working directory, so relative paths would land
+    # inside it rather than where the caller expects them.
+    cache_dir = Path(cache_dir).resolve()
     repo_name = Path(repo.url.rstrip("/")).stem
-    target_dir = cache_dir / repo_name
+    url_key = hashlib.sha256(repo.url.encode()).hexdigest()[:12]
+    bare_dir = cache_dir / "repos" / f"{repo_name}-{url_key}.git"
+    bare_dir.parent.mkdir(parents=True, exist_ok=True)
 
-    if target_dir.exists():
-        repo_obj = git.Repo(target_dir)
-        repo_obj.remotes.origin.fetch()
-    else:
-        target_dir = Path(git.Repo.clone_from(repo.url, target_dir).working_tree_dir)
-        repo_obj = git.Repo(target_dir)
+    with file_lock(bare_dir.with_suffix(".lock")):
+        bare = _open_bare(bare_dir, repo.url)
+        commit = _resolve_commit(bare, repo.commit) if repo.commit else None
+        if commit is None:
+            commit = _fetch(bare, repo.commit)
+        return _worktree(bare, cache_dir / "worktrees" / f"{repo_name}-{commit[:12]}", commit)
+
+
+def checkout_commit(repo_path: str | Path) -> str:
+    """Full SHA of the commit checked out at `repo_path`."""
+    import git
+
+    return git.Repo(repo_path).head.commit.hexsha
+
+
+def changed_files(repo_path: str | Path, base: str, target: str) -> tuple[list[str], list[str]]:
+    """Return the files changed and the files deleted from commit `base` to `target`.
+
+    Paths are relative to the repo root. A rename counts as deleting the old path and
+    adding the new one. Raises ValueError when either commit is not available locally.
+    """
+    import git
+
+    try:
+        output = git.Repo(repo_path).git.diff("--name-status", "--no-renames", "-z", base, target)
+    except git.GitCommandError as exc:
+        raise ValueError(f"Cannot diff {base}..{target} in {repo_path}: {exc}") from exc
+    fields = output.split("\0")
+    changed, deleted = [], []
+    for status, path in zip(fields[0::2], fields[1::2]):
+        (deleted if status == "D" else changed).append(path)
+    return changed, deleted
+
+
+def _open_bare(bare_dir: Path, url: str) -> "git.Repo":
+    import git
+
+    if bare_dir.exists():
+        return git.Repo(bare_dir)
+    bare = git.Repo.init(bare_dir, bare=True)
+    bare.create_remote("origin", url)
+    return bare
+
+
+def _resolve_commit(bare: "git.Repo", rev: str) -> str | None:
+    import git
+
+    try:
+        return bare.git.rev_parse("--verify", "--quiet", f"{rev}^{{commit}}")
+    except git.GitCommandError:
+        return None
+
+
+def _fetch(bare: "git.Repo", commit: str | None) -> str:
+    """Fetch `commit` (or the remote HEAD when None) and return its full SHA.
+
+    `commit` may also name a branch or tag; it is fetched again on every call, so a branch
+    resolves to its current tip.
+    """
+    import git
 
-    if repo.commit:
-        repo_obj.git.checkout(repo.commit)
+    if commit is None:
+        bare.git.fetch("--depth=1", "origin", "HEAD")
+        return bare.git.rev_parse("FETCH_HEAD^{commit}")
+    try:
+        # Most hosts allow fetching a full SHA directly, which transfers just that snapshot.
+        # Fetching by name records the result in FETCH_HEAD only, never under a local ref.
+        bare.git.fetch("--depth=1", "origin", commit)
+    except git.GitCommandError:
+        # Abbreviated SHAs, or servers that refuse fetch-by-SHA: fall back to all branches/tags.
+        bare.git.fetch("--tags", "origin", "+refs/heads/*:refs/remotes/origin/*")
+        resolved = _resolve_commit(bare, commit) or _resolve_commit(bare, f"origin/{commit}")
     else:
-        repo_obj.remotes.origin.pull()
+        resolved = _resolve_commit(bare, "FETCH_HEAD")
+    if resolved is None:
+        raise ValueError(f"Commit {commit} not found in {bare.remotes.origin.url}")
+    return resolved
 
-    return target_dir
 
+def _worktree(bare: "git.Repo", worktree_dir: Path, commit: str) -> Path:
+    if (worktree_dir / ".git").exists():
+        return worktree_dir
+    # A directory without .git is left over from an interrupted checkout.
+    shutil.rmtree(worktree_dir, ignore_errors=True)
+    # Forget worktrees whose directories were deleted, so the path can be registered again.
+    bare.git.worktree("prune")
+    bare.git.worktree("add", "--detach", "--force", str(worktree_dir), commit)
+    return worktree_dir
@@ -0,0 +1,248 @@
+import json
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rag_eval.models.results import EvaluationReport, QueryDelta, RunComparison, RunRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    repo_url TEXT NOT NULL,
+    repo_commit TEXT,
+    adapter TEXT NOT NULL,
+    adapter_fingerprint TEXT,
+    top_k INTEGER,
+    overlap_threshold REAL,
+    index_source TEXT,
+    queries INTEGER NOT NULL,
+    failed_queries INTEGER NOT NULL,
+    timings TEXT NOT NULL,
+    label TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_dataset ON runs (dataset, created_at);
+CREATE INDEX IF NOT EXISTS runs_adapter ON runs (adapter, created_at);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (repo_commit, created_at);
+CREATE INDEX IF NOT EXISTS runs_created_at ON runs (created_at);
+
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, metric)
+);
+
+CREATE TABLE IF NOT EXISTS query_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    query_id TEXT NOT NULL,
+    text TEXT NOT NULL,
+    latency_s REAL,
+    error TEXT,
+    PRIMARY KEY (run_id, query_id)
+) WITHOUT ROWID;
+
+-- (run_id, metric, query_id) serves both sides of the per-query join in `compare`.
+CREATE TABLE IF NOT EXISTS query_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    metric TEXT NOT NULL,
+    query_id TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, metric, query_id)
+) WITHOUT ROWID;
+"""
+
+_RUN_COLUMNS = (
+    "id, created_at, dataset, repo_url, repo_commit, adapter, top_k, overlap_threshold, "
+    "queries, failed_queries, timings, label"
+)
+
+
+class HistoryStore:
+    """SQLite database of benchmark runs with per-query metrics and latencies.
+
+    Queries are matched across runs by their dataset id, so comparisons are meaningful
+    between runs of the same dataset (or datasets that share query ids).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(
+        self,
+        report: EvaluationReport,
+        adapter: str,
+        adapter_fingerprint: str | None = None,
+        top_k: int | None = None,
+        overlap_threshold: float | None = None,
+        label: str | None = None,
+    ) -> int:
+        """Store a finished run and return its id."""
+        results = report.query_results
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (created_at, dataset, repo_url, repo_commit, adapter, "
+                "adapter_fingerprint, top_k, overlap_threshold, index_source, queries, "
+                "failed_queries, timings, label) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    report.dataset.name,
+                    report.dataset.repo.url,
+                    report.dataset.repo.commit,
+                    adapter,
+                    adapter_fingerprint,
+                    top_k or report.dataset.top_k,
+                    overlap_threshold,
+                    report.index_source,
+                    len(results),
+                    sum(1 for result in results if result.error),
+                    json.dumps(report.timings),
+                    label,
+                ),
+            )
+            run_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO run_metrics (run_id, metric, value) VALUES (?, ?, ?)",
+                [(run_id, name, value) for name, value in report.aggregate_metrics.items()],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO query_results (run_id, query_id, text, latency_s, error) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(run_id, r.query.id, r.query.text, r.latency_s, r.error) for r in results],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO query_metrics (run_id, metric, query_id, value) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, name, r.query.id, value)
+                    for r in results
+                    for name, value in r.metrics.items()
+                ],
+            )
+        return run_id
+
+    def runs(
+        self,
+        dataset: str | None = None,
+        adapter: str | None = None,
+        commit: str | None = None,
+        limit: int | None = 20,
+    ) -> list[RunRecord]:
+        """Return matching runs, newest first."""
+        clauses: list[str] = []
+        params: list[object] = []
+        for column, value in (("dataset", dataset), ("adapter", adapter), ("repo_commit", commit)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        sql = f"SELECT {_RUN_COLUMNS} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            return _load_runs(conn, conn.execute(sql, params).fetchall())
+
+    def run(self, run_id: int) -> RunRecord:
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {_RUN_COLUMNS} FROM runs WHERE id = ?", (run_id,))
+            records = _load_runs(conn, rows.fetchall())
+        if not records:
+            raise ValueError(f"No run with id {run_id} in {self.path}")
+        return records[0]
+
+    def compare(
+        self,
+        base_id: int,
+        head_id: int,
+        metric: str = "recall@k",
+        limit: int | None = None,
+        regressions_only: bool = False,
+    ) -> RunComparison:
+        """Per-query change in `metric` from `base_id` to `head_id`, biggest drop first.
+
+        Only queries present in both runs are compared.
+        """
+        base, head = self.run(base_id), self.run(head_id)
+        sql = (
+            "SELECT b.query_id, hq.text, b.value AS before, h.value AS after, "
+            "bq.latency_s AS latency_before, hq.latency_s AS latency_after "
+            "FROM query_metrics b "
+            "JOIN query_metrics h "
+            "ON h.run_id = ? AND h.metric = b.metric AND h.query_id = b.query_id "
+            "JOIN query_results bq ON bq.run_id = b.run_id AND bq.query_id = b.query_id "
+            "JOIN query_results hq ON hq.run_id = h.run_id AND hq.query_id = h.query_id "
+            "WHERE b.run_id = ? AND b.metric = ?"
+        )
+        params: list[object] = [head_id, base_id, metric]
+        if regressions_only:
+            sql += " AND h.value < b.value"
+        sql += " ORDER BY h.value - b.value ASC, b.query_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        queries = [
+            QueryDelta(
+                query_id=row["query_id"],
+                text=row["text"],
+                before=row["before"],
+                after=row["after"],
+                latency_before_s=row["latency_before"],
+                latency_after_s=row["latency_after"],
+            )
+            for row in rows
+        ]
+        return RunComparison(base=base, head=head, metric=metric, queries=queries)
+
+
+def _load_runs(conn: sqlite3.Connection, rows: list[sqlite3.Row]) -> list[RunRecord]:
+    if not rows:
+        return []
+    ids = [row["id"] for row in rows]
+    metrics: dict[int, dict[str, float]] = {run_id: {} for run_id in ids}
+    placeholders = ", ".join("?" * len(ids))
+    for metric_row in conn.execute(
+        f"SELECT run_id, metric, value FROM run_metrics WHERE run_id IN ({placeholders}) "
+        "ORDER BY rowid",
+        ids,
+    ):
+        metrics[metric_row["run_id"]][metric_row["metric"]] = metric_row["value"]
+    return [
+        RunRecord(
+            id=row["id"],
+            created_at=row["created_at"],
+            dataset=row["dataset"],
+            repo_url=row["repo_url"],
+            repo_commit=row["repo_commit"],
+            adapter=row["adapter"],
+            top_k=row["top_k"],
+            overlap_threshold=row["overlap_threshold"],
+            queries=row["queries"],
+            failed_queries=row["failed_queries"],
+            aggregate_metrics=metrics[row["id"]],
+            timings=json.loads(row["timings"]),
+            label=row["label"],
+        )
+        for row in rows
+    ]
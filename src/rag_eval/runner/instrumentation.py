@@ -0,0 +1,100 @@
+import math
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rag_eval.runner.profiling import PhaseProfiler
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def _reset_peak_memory() -> bool:
+    """Reset the kernel's RSS high-water mark so the next reading covers one phase only.
+
+    Only Linux supports this; elsewhere peaks are cumulative since process start.
+    """
+    try:
+        _PROC_CLEAR_REFS.write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_memory_mb() -> float | None:
+    """Peak resident set size in MiB since the last reset (or process start)."""
+    try:
+        for line in _PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Linearly interpolated percentile (0-100) of an already sorted, non-empty list."""
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def latency_summary(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    return {
+        "p50": percentile(ordered, 50),
+        "p90": percentile(ordered, 90),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+@dataclass
+class RunStats:
+    """Wall time and peak memory collected per benchmark phase.
+
+    With a `profiler`, each phase is also entered on it so its samples are filed by phase.
+    """
+
+    timings: dict[str, float] = field(default_factory=dict)
+    peak_memory_mb: dict[str, float] = field(default_factory=dict)
+    profiler: PhaseProfiler | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        _reset_peak_memory()
+        started = time.perf_counter()
+        try:
+            if self.profiler is None:
+                yield
+            else:
+                with self.profiler.phase(name):
+                    yield
+        finally:
+            self.timings[f"{name}_s"] = time.perf_counter() - started
+            peak = peak_memory_mb()
+            if peak is not None:
+                self.peak_memory_mb[name] = peak
+
+    def record_queries(self, latencies: list[float]) -> None:
+        """Add latency percentiles and throughput for the queries run in the `query` phase."""
+        for key, value in latency_summary(latencies).items():
+            self.timings[f"query_{key}_s"] = value
+        wall = self.timings.get("query_s")
+        if latencies and wall:
+            self.timings["queries_per_s"] = len(latencies) / wall
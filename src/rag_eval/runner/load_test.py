@@ -0,0 +1,144 @@
+import math
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from functools import partial
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models.results import LoadTestReport
+from rag_eval.runner.instrumentation import latency_summary
+from rag_eval.runner.query_policy import call_in_thread
+
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, math.inf)
+
+
+def arrival_offsets(
+    rate: float, duration_s: float, arrival: str = "constant", seed: int | None = None
+) -> list[float]:
+    """Scheduled send times (seconds from start) for a constant or Poisson arrival process."""
+    if rate <= 0:
+        raise ValueError("rate must be > 0")
+    if arrival == "constant":
+        return [i / rate for i in range(math.ceil(rate * duration_s))]
+    if arrival == "poisson":
+        rng = random.Random(seed)
+        offsets = []
+        t = rng.expovariate(rate)
+        while t < duration_s:
+            offsets.append(t)
+            t += rng.expovariate(rate)
+        return offsets
+    raise ValueError(f"Unknown arrival process '{arrival}'; expected constant or poisson")
+
+
+def _histogram(latencies_s: list[float]) -> list[tuple[float, int]]:
+    counts = [0] * len(HISTOGRAM_BOUNDS_MS)
+    for latency in latencies_s:
+        ms = latency * 1000
+        counts[next(i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if ms <= bound)] += 1
+    return list(zip(HISTOGRAM_BOUNDS_MS, counts))
+
+
+def _timed_query(
+    rag_system: RAGSystem, text: str, top_k: int, scheduled: float
+) -> tuple[float, str | None]:
+    try:
+        rag_system.query(text, top_k=top_k)
+    except Exception as exc:  # noqa: BLE001 - errors are counted, not raised
+        return time.perf_counter() - scheduled, f"{type(exc).__name__}: {exc}"
+    return time.perf_counter() - scheduled, None
+
+
+def run_load_test(
+    rag_system: RAGSystem,
+    queries: list[str],
+    rate: float,
+    duration_s: float,
+    arrival: str = "constant",
+    top_k: int = 10,
+    timeout_s: float | None = None,
+    max_workers: int = 64,
+    seed: int | None = None,
+    dataset_name: str = "",
+) -> LoadTestReport:
+    """Replay `queries` against an ingested adapter at a target arrival rate.
+
+    The scheduler is open-loop: requests are sent at their scheduled times whether or not
+    earlier ones have finished, and latency is measured from the scheduled time, so queueing
+    behind slow responses shows up in the numbers instead of silently lowering the load.
+
+    Each request runs on its own daemon thread, with at most `max_workers` in flight; later
+    requests wait for a slot. A request still running `timeout_s` after its scheduled time
+    is counted as a timeout and abandoned: it stops holding a slot and cannot block exit.
+    """
+    if not queries:
+        raise ValueError("queries must not be empty")
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    offsets = arrival_offsets(rate, duration_s, arrival, seed)
+
+    pending: dict[Future, float] = {}
+    latencies: list[float] = []
+    errors = timeouts = 0
+
+    def collect(done: set[Future]) -> None:
+        nonlocal errors, timeouts
+        for future in done:
+            pending.pop(future)
+            latency, error = future.result()
+            if error is not None:
+                errors += 1
+            elif timeout_s is not None and latency > timeout_s:
+                timeouts += 1
+            else:
+                latencies.append(latency)
+
+    def settle() -> None:
+        """Wait until a request finishes or the oldest one passes its deadline."""
+        nonlocal timeouts
+        if timeout_s is None:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        else:
+            remaining = min(pending.values()) + timeout_s - time.perf_counter()
+            done, _ = wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+            if not done:
+                # The oldest outstanding requests are past their deadline; stop waiting on them.
+                now = time.perf_counter()
+                expired = [f for f, scheduled in pending.items() if scheduled + timeout_s <= now]
+                for future in expired:
+                    pending.pop(future)
+                timeouts += len(expired)
+                return
+        collect(done)
+
+    start = time.perf_counter()
+    for i, offset in enumerate(offsets):
+        scheduled = start + offset
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        while len(pending) >= max_workers:
+            settle()
+        text = queries[i % len(queries)]
+        pending[call_in_thread(partial(_timed_query, rag_system, text, top_k, scheduled))] = (
+            scheduled
+        )
+        collect({future for future in pending if future.done()})
+
+    while pending:
+        settle()
+    elapsed = time.perf_counter() - start
+
+    return LoadTestReport(
+        dataset_name=dataset_name,
+        arrival=arrival,
+        target_qps=rate,
+        duration_s=duration_s,
+        sent=len(offsets),
+        completed=len(latencies),
+        errors=errors,
+        timeouts=timeouts,
+        achieved_qps=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        latency=latency_summary(latencies),
+        histogram=_histogram(latencies),
+    )
@@ -0,0 +1,94 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rag_eval.models.results import MatrixReport, MatrixRow
+from rag_eval.runner.adapter_loader import load_adapter
+from rag_eval.runner.benchmark_runner import BenchmarkRunner
+from rag_eval.runner.dataset_loader import require_field
+
+_RUN_OPTIONS = ("top_k", "overlap_threshold", "concurrency", "batch_size")
+
+
+@dataclass
+class AdapterConfig:
+    spec: str
+    name: str
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MatrixConfig:
+    datasets: list[Path]
+    adapters: list[AdapterConfig]
+    run_options: dict[str, Any] = field(default_factory=dict)
+
+
+def load_matrix_config(path: str | Path) -> MatrixConfig:
+    """Parse a matrix YAML file.
+
+    ```yaml
+    datasets: [datasets/sample-benchmark.yaml]
+    adapters:
+      - adapters.simple_adapter:SimpleGrepRAG
+      - spec: adapters.code_rag_adapter:CodeRAGAdapter
+        name: code-rag-small
+        options: {collection_name: small}
+    top_k: 10
+    ```
+
+    Relative dataset paths are resolved against the config file's directory.
+    """
+    config_path = Path(path)
+    if not config_path.exists():
+        raise FileNotFoundError(f"Matrix config not found: {config_path}")
+    import yaml
+
+    data = yaml.safe_load(config_path.read_text())
+
+    datasets = [config_path.parent / p for p in require_field(data, "datasets", "matrix config")]
+    adapters = []
+    for entry in require_field(data, "adapters", "matrix config"):
+        if isinstance(entry, str):
+            adapters.append(AdapterConfig(spec=entry, name=entry))
+            continue
+        spec = require_field(entry, "spec", "matrix adapter")
+        adapters.append(
+            AdapterConfig(spec=spec, name=entry.get("name", spec), options=entry.get("options", {}))
+        )
+    run_options = {key: data[key] for key in _RUN_OPTIONS if key in data}
+    return MatrixConfig(datasets=datasets, adapters=adapters, run_options=run_options)
+
+
+def _run_cell(
+    dataset_path: Path, adapter: AdapterConfig, cache_dir: Path, run_options: dict[str, Any]
+) -> MatrixRow:
+    # Runs in a worker process; failures become part of the row instead of killing the pool.
+    row = MatrixRow(dataset=str(dataset_path), adapter=adapter.name)
+    try:
+        runner = BenchmarkRunner(load_adapter(adapter.spec, adapter.options), cache_dir=cache_dir)
+        report = runner.run(dataset_path=dataset_path, **run_options)
+    except Exception as exc:  # noqa: BLE001
+        row.error = f"{type(exc).__name__}: {exc}"
+        return row
+    row.dataset = report.dataset.name
+    row.aggregate_metrics = report.aggregate_metrics
+    row.timings = report.timings
+    row.queries = len(report.query_results)
+    row.failed_queries = sum(1 for result in report.query_results if result.error)
+    return row
+
+
+def run_matrix(config: MatrixConfig, cache_dir: str | Path, workers: int = 1) -> MatrixReport:
+    """Run every (dataset, adapter) cell, `workers` at a time, each in its own process."""
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    cells = [(dataset, adapter) for dataset in config.datasets for adapter in config.adapters]
+    cache_dir = Path(cache_dir)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_cell, dataset, adapter, cache_dir, config.run_options)
+            for dataset, adapter in cells
+        ]
+        return MatrixReport(rows=[future.result() for future in futures])
@@ -0,0 +1,167 @@
+"""Sampling profiler that attributes samples to benchmark phases.
+
+A background thread snapshots every thread's Python stack at a fixed interval and files
+each sample under the phase running at the time. Output is one collapsed-stack file per
+phase (`frame;frame;frame count` lines, readable by flamegraph.pl, speedscope and
+inferno) plus a plain-text summary of the hottest functions in each phase.
+"""
+
+import concurrent.futures._base
+import concurrent.futures.thread
+import queue
+import selectors
+import sys
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING
+
+from rag_eval.metrics.core import compute_metrics, sweep_metrics
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Stacks whose innermost frame is in one of these modules are threads parked on a lock,
+# queue or event loop (the harness's own coordination), not work; their samples are dropped.
+_IDLE_FILES = frozenset(
+    {
+        threading.__file__,
+        queue.__file__,
+        selectors.__file__,
+        concurrent.futures._base.__file__,
+        concurrent.futures.thread.__file__,
+    }
+)
+
+# Scoring runs inside the query phase (each result is scored as it arrives); samples with
+# these functions on the stack are filed under their own phase instead.
+_SUBPHASES = {
+    compute_metrics.__code__: "compute_metrics",
+    sweep_metrics.__code__: "compute_metrics",
+}
+
+_Stack = tuple[CodeType, ...]
+
+
+def _frame_label(code: CodeType) -> str:
+    path = Path(code.co_filename)
+    location = "/".join(path.parts[-2:]) if len(path.parts) > 1 else path.name
+    return f"{code.co_name} ({location}:{code.co_firstlineno})"
+
+
+class PhaseProfiler:
+    """Collects stack samples per phase between `start` and `stop`.
+
+    Phases are entered with `phase(name)`; `RunStats` does this for every phase it times
+    when given a profiler. Samples taken outside any phase are discarded. The profile is
+    wall-clock: threads blocked in I/O (an adapter waiting on the network) are sampled too.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.interval = interval
+        self.samples: dict[str, Counter[_Stack]] = defaultdict(Counter)
+        self._phases: list[str] = []
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("profiler already started")
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="rag-eval-profiler")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "Self":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        # Phases run one after another, so a single process-wide stack is enough: worker
+        # threads spawned for a phase are attributed to it without registering themselves.
+        self._phases.append(name)
+        try:
+            yield
+        finally:
+            self._phases.pop()
+
+    def _sample_loop(self) -> None:
+        own = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            try:
+                phase = self._phases[-1]
+            except IndexError:
+                continue
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._record(phase, frame)
+
+    def _record(self, phase: str, frame: FrameType | None) -> None:
+        if frame is None or frame.f_code.co_filename in _IDLE_FILES:
+            return
+        stack: list[CodeType] = []
+        while frame is not None:
+            code = frame.f_code
+            phase = _SUBPHASES.get(code, phase)
+            stack.append(code)
+            frame = frame.f_back
+        stack.reverse()
+        self.samples[phase][tuple(stack)] += 1
+
+    def write(self, output_dir: str | Path, top: int = 20) -> list[Path]:
+        """Write `<phase>.collapsed` files and `summary.txt`; return the paths written."""
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        written = []
+        for phase, stacks in self.samples.items():
+            lines = [
+                f"{';'.join(_frame_label(code) for code in stack)} {count}"
+                for stack, count in stacks.most_common()
+            ]
+            path = output / f"{phase}.collapsed"
+            path.write_text("\n".join(lines) + "\n")
+            written.append(path)
+        summary = output / "summary.txt"
+        summary.write_text(self.summary(top))
+        written.append(summary)
+        return written
+
+    def summary(self, top: int = 20) -> str:
+        """The `top` functions of each phase by self and inclusive share of its samples."""
+        sections = []
+        for phase, stacks in self.samples.items():
+            total = sum(stacks.values())
+            own: Counter[CodeType] = Counter()
+            inclusive: Counter[CodeType] = Counter()
+            for stack, count in stacks.items():
+                own[stack[-1]] += count
+                # Recursive functions appear several times in one stack; count them once.
+                for code in set(stack):
+                    inclusive[code] += count
+            lines = [
+                f"== {phase}: {total} samples (~{total * self.interval:.2f} thread-seconds) ==",
+                f"{'self %':>7} {'total %':>8}  function",
+            ]
+            for code, count in own.most_common(top):
+                lines.append(
+                    f"{100 * count / total:7.1f} {100 * inclusive[code] / total:8.1f}  "
+                    f"{_frame_label(code)}"
+                )
+            sections.append("\n".join(lines))
+        return "\n\n".join(sections) + "\n" if sections else "No samples collected.\n"
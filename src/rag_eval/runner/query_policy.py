@@ -0,0 +1,263 @@
+"""Deadlines, retries with backoff, and hedged requests for adapter calls."""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any
+
+from rag_eval.runner.instrumentation import percentile
+
+
+@dataclass
+class QueryPolicy:
+    """How the runner calls the adapter for each query (or `query_batch` call).
+
+    `timeout_s` is the deadline for the whole query, retries and backoff included. A call
+    still running at the deadline is abandoned and the query is recorded as `timeout`.
+    Failed calls are retried up to `retries` times, sleeping a random time of up to
+    `backoff_s * 2**(n-1)` (capped at `max_backoff_s`) before the n-th retry. With
+    `hedge_percentile`, a call still running after that percentile of the run's latencies so
+    far gets a duplicate request and the first successful answer wins. Hedging starts once
+    `hedge_min_samples` calls have succeeded.
+    """
+
+    timeout_s: float | None = None
+    retries: int = 0
+    backoff_s: float = 0.1
+    max_backoff_s: float = 10.0
+    hedge_percentile: float | None = None
+    hedge_min_samples: int = 20
+
+    def __post_init__(self) -> None:
+        if self.timeout_s is not None and self.timeout_s <= 0:
+            raise ValueError("timeout_s must be > 0")
+        if self.retries < 0:
+            raise ValueError("retries must be >= 0")
+        if self.backoff_s < 0 or self.max_backoff_s < 0:
+            raise ValueError("backoff_s and max_backoff_s must be >= 0")
+        if self.hedge_percentile is not None and not 0 < self.hedge_percentile < 100:
+            raise ValueError("hedge_percentile must be between 0 and 100")
+        if self.hedge_min_samples < 1:
+            raise ValueError("hedge_min_samples must be >= 1")
+
+    @property
+    def concurrent(self) -> bool:
+        """Whether calls run in helper threads (needed to abandon or duplicate them)."""
+        return self.timeout_s is not None or self.hedge_percentile is not None
+
+
+@dataclass(slots=True)
+class CallOutcome:
+    """What calling the adapter under a `QueryPolicy` produced.
+
+    `status` is `ok` (with `value`), `error` (every attempt raised; `error` describes the
+    last) or `timeout`. `latency_s` covers all attempts and backoff sleeps.
+    """
+
+    value: Any
+    error: str | None
+    status: str
+    latency_s: float
+    attempts: int = 1
+    hedged: bool = False
+
+
+# One attempt: (value, error description, timed out, hedge fired)
+_Attempt = tuple[Any, str | None, bool, bool]
+
+
+class PolicyCaller:
+    """Applies a `QueryPolicy` to adapter calls; create one per run.
+
+    The hedging threshold comes from the latencies of calls made through this caller, so
+    it adapts to the adapter and dataset being run. Safe to use from several threads.
+    """
+
+    def __init__(self, policy: QueryPolicy, window: int = 1000) -> None:
+        self.policy = policy
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[[], Any]) -> CallOutcome:
+        started = time.perf_counter()
+        deadline = self._deadline(started)
+        attempts, hedged = 0, False
+        while True:
+            attempts += 1
+            attempt_started = time.perf_counter()
+            if self.policy.concurrent:
+                value, error, timed_out, fired = self._attempt(fn, attempt_started, deadline)
+            else:
+                value, error, timed_out, fired = _direct(fn)
+            hedged |= fired
+            outcome = self._settle(
+                value, error, timed_out, started, attempt_started, deadline, attempts, hedged
+            )
+            if isinstance(outcome, CallOutcome):
+                return outcome
+            time.sleep(outcome)
+
+    async def acall(self, fn: Callable[[], Awaitable[Any]]) -> CallOutcome:
+        started = time.perf_counter()
+        deadline = self._deadline(started)
+        attempts, hedged = 0, False
+        while True:
+            attempts += 1
+            attempt_started = time.perf_counter()
+            if self.policy.concurrent:
+                attempt = await self._aattempt(fn, attempt_started, deadline)
+            else:
+                attempt = await _adirect(fn)
+            value, error, timed_out, fired = attempt
+            hedged |= fired
+            outcome = self._settle(
+                value, error, timed_out, started, attempt_started, deadline, attempts, hedged
+            )
+            if isinstance(outcome, CallOutcome):
+                return outcome
+            await asyncio.sleep(outcome)
+
+    def _deadline(self, started: float) -> float | None:
+        return started + self.policy.timeout_s if self.policy.timeout_s is not None else None
+
+    def _settle(
+        self,
+        value: Any,
+        error: str | None,
+        timed_out: bool,
+        started: float,
+        attempt_started: float,
+        deadline: float | None,
+        attempts: int,
+        hedged: bool,
+    ) -> CallOutcome | float:
+        """The final outcome of a call, or how long to back off before retrying it."""
+        now = time.perf_counter()
+        if timed_out:
+            error = f"Timed out after {self.policy.timeout_s:g}s"
+            return CallOutcome(None, error, "timeout", now - started, attempts, hedged)
+        if error is None:
+            with self._lock:
+                self._latencies.append(now - attempt_started)
+            return CallOutcome(value, None, "ok", now - started, attempts, hedged)
+        delay = self._backoff(attempts)
+        if attempts > self.policy.retries or (deadline is not None and now + delay >= deadline):
+            return CallOutcome(None, error, "error", now - started, attempts, hedged)
+        return delay
+
+    def _backoff(self, attempts: int) -> float:
+        # "Full jitter": spreads retries of queries that failed together across the window.
+        ceiling = min(self.policy.max_backoff_s, self.policy.backoff_s * 2 ** (attempts - 1))
+        return random.uniform(0, ceiling)
+
+    def _hedge_at(self, attempt_started: float) -> float | None:
+        q = self.policy.hedge_percentile
+        if q is None:
+            return None
+        with self._lock:
+            if len(self._latencies) < self.policy.hedge_min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return attempt_started + percentile(latencies, q)
+
+    def _attempt(
+        self, fn: Callable[[], Any], attempt_started: float, deadline: float | None
+    ) -> _Attempt:
+        hedge_at = self._hedge_at(attempt_started)
+        pending = {call_in_thread(fn)}
+        hedged, error = False, None
+        while pending:
+            now = time.perf_counter()
+            if hedge_at is not None and now >= hedge_at:
+                pending.add(call_in_thread(fn))
+                hedged, hedge_at = True, None
+            if deadline is not None and now >= deadline:
+                # Threads cannot be cancelled; the abandoned call finishes in the background.
+                return None, None, True, hedged
+            wake = [t for t in (hedge_at, deadline) if t is not None]
+            done, pending = wait(
+                pending,
+                timeout=max(0.0, min(wake) - now) if wake else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                exc = future.exception()
+                if exc is None:
+                    return future.result(), None, False, hedged
+                error = _describe(exc)
+        return None, error, False, hedged
+
+    async def _aattempt(
+        self, fn: Callable[[], Awaitable[Any]], attempt_started: float, deadline: float | None
+    ) -> _Attempt:
+        hedge_at = self._hedge_at(attempt_started)
+        pending: set[asyncio.Future[Any]] = {asyncio.ensure_future(fn())}
+        hedged, error = False, None
+        try:
+            while pending:
+                now = time.perf_counter()
+                if hedge_at is not None and now >= hedge_at:
+                    pending.add(asyncio.ensure_future(fn()))
+                    hedged, hedge_at = True, None
+                if deadline is not None and now >= deadline:
+                    return None, None, True, hedged
+                wake = [t for t in (hedge_at, deadline) if t is not None]
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, min(wake) - now) if wake else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        return task.result(), None, False, hedged
+                    error = _describe(exc)
+            return None, error, False, hedged
+        finally:
+            # Unlike threads, the losing or timed-out coroutines can be cancelled.
+            for task in pending:
+                task.cancel()
+
+
+def _direct(fn: Callable[[], Any]) -> _Attempt:
+    try:
+        return fn(), None, False, False
+    except Exception as exc:  # noqa: BLE001 - one failing query must not abort the run
+        return None, _describe(exc), False, False
+
+
+async def _adirect(fn: Callable[[], Awaitable[Any]]) -> _Attempt:
+    try:
+        return await fn(), None, False, False
+    except Exception as exc:  # noqa: BLE001 - one failing query must not abort the run
+        return None, _describe(exc), False, False
+
+
+def call_in_thread(fn: Callable[[], Any]) -> Future:
+    """Run `fn` on a new daemon thread and return a future for its result.
+
+    Unlike an executor's workers, the thread never keeps the interpreter from exiting, so a
+    call that hangs can simply be abandoned.
+    """
+    future: Future = Future()
+
+    def target() -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            result = fn()
+        except BaseException as exc:  # noqa: BLE001 - handed to the waiting caller
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=target, name="rag-eval-query", daemon=True).start()
+    return future
+
+
+def _describe(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
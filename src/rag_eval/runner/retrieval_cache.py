@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from rag_eval.models.chunk import CodeChunk
+from rag_eval.models.dataset import RepoSpec
+from rag_eval.models.serialization import chunk_from_dict, chunk_to_dict
+
+
+class RetrievalCache:
+    """On-disk cache of retrieved chunks.
+
+    Entries are grouped into one JSON file per (adapter fingerprint, repo URL, commit, top_k)
+    and keyed by query text inside it. Only pinned commits are cached, since an unpinned
+    repo can change underneath the cache.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def _path(self, adapter_id: str, repo: RepoSpec, top_k: int) -> Path:
+        key = json.dumps([adapter_id, repo.url, repo.commit, top_k])
+        return self.root / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def load(self, adapter_id: str, repo: RepoSpec, top_k: int) -> dict[str, list[CodeChunk]]:
+        if not repo.commit:
+            return {}
+        path = self._path(adapter_id, repo, top_k)
+        if not path.exists():
+            return {}
+        return _decode(json.loads(path.read_text()))
+
+    def save(
+        self,
+        adapter_id: str,
+        repo: RepoSpec,
+        top_k: int,
+        retrievals: dict[str, list[CodeChunk]],
+    ) -> None:
+        if not repo.commit or not retrievals:
+            return
+        merged = self.load(adapter_id, repo, top_k)
+        merged.update(retrievals)
+        payload = {
+            "adapter": adapter_id,
+            "repo": {"url": repo.url, "commit": repo.commit},
+            "top_k": top_k,
+            "retrievals": {
+                text: [chunk_to_dict(chunk) for chunk in chunks] for text, chunks in merged.items()
+            },
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self._path(adapter_id, repo, top_k), json.dumps(payload))
+
+    def find(
+        self, repo: RepoSpec, top_k: int, adapter_id: str | None = None
+    ) -> dict[str, dict[str, list[CodeChunk]]]:
+        """Return cached retrievals for a repo/top_k, keyed by adapter fingerprint.
+
+        `adapter_id` filters fingerprints by substring.
+        """
+        found: dict[str, dict[str, list[CodeChunk]]] = {}
+        if not self.root.exists():
+            return found
+        for path in sorted(self.root.glob("*.json")):
+            payload = json.loads(path.read_text())
+            if payload["repo"] != {"url": repo.url, "commit": repo.commit}:
+                continue
+            if payload["top_k"] != top_k:
+                continue
+            if adapter_id is not None and adapter_id not in payload["adapter"]:
+                continue
+            found[payload["adapter"]] = _decode(payload)
+        return found
+
+
+def _decode(payload: dict[str, Any]) -> dict[str, list[CodeChunk]]:
+    return {
+        text: [chunk_from_dict(chunk) for chunk in chunks]
+        for text, chunks in payload["retrievals"].items()
+    }
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as handle:
+            handle.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,85 @@
+import hashlib
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models.dataset import RepoSpec
+
+_MARKER = "snapshot.json"
+
+
+class SnapshotStore:
+    """Index snapshots keyed by adapter fingerprint and repo commit.
+
+    The runner passes the full SHA a dataset's revision resolved to, so the commit recorded
+    in each marker can be diffed against later commits even when the dataset names a branch.
+
+    A snapshot directory only counts once its marker file exists, so a crash while saving
+    never leaves a half-written snapshot that later runs would load.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, adapter_id: str, repo: RepoSpec) -> Path:
+        key = json.dumps([adapter_id, repo.url, repo.commit])
+        return self.root / hashlib.sha256(key.encode()).hexdigest()
+
+    def restore(self, rag_system: RAGSystem, adapter_id: str, repo: RepoSpec) -> bool:
+        """Load a matching snapshot into `rag_system`; return False when none is usable."""
+        if not repo.commit:
+            return False
+        path = self.path_for(adapter_id, repo)
+        if not (path / _MARKER).exists():
+            return False
+        try:
+            rag_system.load_index(str(path / "index"))
+        except NotImplementedError:
+            return False
+        return True
+
+    def restore_latest(self, rag_system: RAGSystem, adapter_id: str, url: str) -> str | None:
+        """Load the newest snapshot of any commit of `url`; return its commit, or None.
+
+        Used to start an incremental update when there is no snapshot of the exact commit.
+        """
+        candidates = []
+        for marker_path in self.root.glob(f"*/{_MARKER}"):
+            try:
+                marker = json.loads(marker_path.read_text())
+                saved_at = marker_path.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            if marker.get("adapter") == adapter_id and marker.get("repo", {}).get("url") == url:
+                candidates.append((saved_at, marker["repo"]["commit"], marker_path.parent))
+        if not candidates:
+            return None
+        _, commit, path = max(candidates)
+        try:
+            rag_system.load_index(str(path / "index"))
+        except NotImplementedError:
+            return None
+        return commit
+
+    def save(self, rag_system: RAGSystem, adapter_id: str, repo: RepoSpec) -> bool:
+        """Snapshot the current index of `rag_system`; return False if it cannot save."""
+        if not repo.commit:
+            return False
+        target = self.path_for(adapter_id, repo)
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.root, prefix=".staging-"))
+        try:
+            index_dir = staging / "index"
+            index_dir.mkdir()
+            rag_system.save_index(str(index_dir))
+            marker = {"adapter": adapter_id, "repo": {"url": repo.url, "commit": repo.commit}}
+            (staging / _MARKER).write_text(json.dumps(marker))
+            shutil.rmtree(target, ignore_errors=True)
+            staging.rename(target)
+        except NotImplementedError:
+            return False
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return True
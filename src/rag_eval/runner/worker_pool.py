@@ -0,0 +1,381 @@
+import inspect
+import multiprocessing
+import queue
+import shutil
+import sys
+import tempfile
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models.chunk import CodeChunk
+from rag_eval.runner.adapter_loader import adapter_class
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Chunks cross the process boundary as plain tuples, which pickle far smaller and faster
+# than CodeChunk instances: (file_path, start_line, end_line, content, score).
+_WireChunk = tuple[str, int, int, str, float | None]
+
+
+def _encode(chunks: list[CodeChunk]) -> list[_WireChunk]:
+    return [(c.file_path, c.start_line, c.end_line, c.content, c.score) for c in chunks]
+
+
+def _decode(chunks: list[_WireChunk]) -> list[CodeChunk]:
+    return [CodeChunk(path, start, end, text, score) for path, start, end, text, score in chunks]
+
+
+def _describe(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _serve(adapter: RAGSystem, op: str, args: tuple) -> Any:
+    if op == "query":
+        return _encode(adapter.query(args[0], top_k=args[1]))
+    if op == "query_batch":
+        return [_encode(chunks) for chunks in adapter.query_batch(args[0], top_k=args[1])]
+    if op in ("ingest", "save_index", "load_index"):
+        return getattr(adapter, op)(args[0])
+    if op == "update":
+        return adapter.update(args[0], args[1], args[2])
+    if op == "clear":
+        return adapter.clear()
+    raise ValueError(f"Unknown worker operation: {op}")
+
+
+def _private_data_dir(
+    cls: type[RAGSystem], options: dict[str, Any], index: int
+) -> tuple[str, str] | None:
+    """(shared, per-worker) `data_dir` for adapters that keep their index on disk there.
+
+    Workers must not share that directory: `load_index` replaces it while other workers
+    have it open. Returns None when the adapter takes no `data_dir` argument.
+    """
+    parameter = inspect.signature(cls).parameters.get("data_dir")
+    if parameter is None:
+        return None
+    shared = options.get("data_dir", parameter.default)
+    if shared is inspect.Parameter.empty or shared is None:
+        return None
+    return str(shared), str(Path(shared) / f"worker-{index}")
+
+
+def _worker_main(
+    conn: Connection,
+    index: int,
+    spec: str,
+    options: dict[str, Any],
+    sys_path: list[str],
+    max_memory_mb: int | None,
+) -> None:
+    """Worker process loop: one adapter instance answering (op, *args) messages."""
+    # Spawned interpreters start with a fresh sys.path; adapters must import the same way.
+    sys.path[:] = sys_path
+    if max_memory_mb is not None and resource is not None:
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    try:
+        cls = adapter_class(spec)
+        data_dirs = _private_data_dir(cls, options, index)
+        if data_dirs is not None:
+            options = {**options, "data_dir": data_dirs[1]}
+        adapter = cls(**options)
+        fingerprint = adapter.fingerprint()
+    except Exception as exc:  # noqa: BLE001 - reported to the parent instead
+        conn.send(("error", _describe(exc)))
+        return
+    if data_dirs is not None:
+        # Report the configured directory so the pool shares caches with in-process runs.
+        fingerprint = fingerprint.replace(repr(data_dirs[1]), repr(data_dirs[0]))
+    conn.send(("ok", fingerprint))
+
+    while True:
+        try:
+            op, *args = conn.recv()
+        except EOFError:
+            return
+        if op == "stop":
+            return
+        try:
+            conn.send(("ok", _serve(adapter, op, tuple(args))))
+        except NotImplementedError:
+            conn.send(("unsupported", None))
+        except Exception as exc:  # noqa: BLE001 - one failing call must not kill the worker
+            conn.send(("error", _describe(exc)))
+
+
+class _Worker:
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: multiprocessing.process.BaseProcess | None = None
+        self.conn: Connection | None = None
+        self.served = 0
+
+
+class WorkerCrashed(RuntimeError):
+    """A worker process died while handling a call; it has been restarted."""
+
+
+class AdapterWorkerPool(RAGSystem):
+    """Runs an adapter in `workers` separate processes behind the `RAGSystem` interface.
+
+    Each process holds its own adapter instance, so GIL-bound or non-thread-safe adapters
+    scale across cores and a crash or leak is contained to one worker. `ingest` and `update`
+    run once in the first worker; if the adapter supports `save_index`, the other workers load
+    that snapshot, otherwise they repeat the call. Queries go to whichever worker is idle, so
+    run the benchmark with `concurrency` of at least `workers`.
+
+    Adapters whose constructor takes a `data_dir` keep their index on disk there, so each
+    worker gets its own `<data_dir>/worker-<n>` instead of sharing one directory.
+
+    A worker that dies mid-call is restarted and brought back to the current index (by
+    loading the snapshot or ingesting again), and the call fails with `WorkerCrashed`.
+    `max_memory_mb` caps each worker's address space (POSIX only), and `recycle_after`
+    restarts a worker after that many queries to contain slow leaks. Call `close` when done.
+    """
+
+    def __init__(
+        self,
+        spec: str,
+        options: dict[str, Any] | None = None,
+        workers: int = 2,
+        max_memory_mb: int | None = None,
+        recycle_after: int | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.spec = spec
+        self.options = dict(options or {})
+        self.workers = workers
+        self.max_memory_mb = max_memory_mb
+        self.recycle_after = recycle_after
+        # Spawn rather than fork: the runner process may already have threads running.
+        self._context = multiprocessing.get_context("spawn")
+        self._snapshot_dir: str | None = None
+        # The call that rebuilds a fresh worker's index: ("ingest" | "load_index", path).
+        self._state: tuple[str, str] | None = None
+        self._pool = [_Worker(index) for index in range(workers)]
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._fingerprint = ""
+        try:
+            for worker in self._pool:
+                self._spawn(worker)
+            for worker in self._pool:
+                self._fingerprint = self._handshake(worker)
+                self._idle.put(worker)
+        except BaseException:
+            self.close()
+            raise
+
+    def _spawn(self, worker: _Worker) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        worker.process = self._context.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                worker.index,
+                self.spec,
+                self.options,
+                list(sys.path),
+                self.max_memory_mb,
+            ),
+            name=f"rag-eval-adapter-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        child_conn.close()
+        worker.conn = parent_conn
+        worker.served = 0
+
+    def _handshake(self, worker: _Worker) -> str:
+        status, payload = self._receive(worker, "start")
+        if status != "ok":
+            raise RuntimeError(f"Adapter worker {worker.index} failed to start: {payload}")
+        return payload
+
+    def _receive(self, worker: _Worker, op: str) -> tuple[str, Any]:
+        assert worker.conn is not None and worker.process is not None
+        try:
+            return worker.conn.recv()
+        except (EOFError, OSError) as exc:
+            worker.process.join(timeout=1)
+            code = worker.process.exitcode
+            raise WorkerCrashed(
+                f"Adapter worker {worker.index} exited (code {code}) during {op}"
+            ) from exc
+
+    def _send(self, worker: _Worker, op: str, *args: Any) -> None:
+        assert worker.conn is not None
+        try:
+            worker.conn.send((op, *args))
+        except (BrokenPipeError, OSError) as exc:
+            raise WorkerCrashed(f"Adapter worker {worker.index} is gone ({op})") from exc
+
+    def _call(self, worker: _Worker, op: str, *args: Any) -> Any:
+        try:
+            self._send(worker, op, *args)
+            status, payload = self._receive(worker, op)
+        except WorkerCrashed:
+            self._restart(worker)
+            raise
+        return _unwrap(status, payload, op)
+
+    def _broadcast(self, op: str, *args: Any, skip: _Worker | None = None) -> list[tuple[str, Any]]:
+        """Send one call to every worker (but `skip`) at once and collect the replies."""
+        workers = self._take_all()
+        targets = [worker for worker in workers if worker is not skip]
+        try:
+            for worker in targets:
+                self._ensure_alive(worker)
+            for worker in targets:
+                self._send(worker, op, *args)
+            return [self._receive(worker, op) for worker in targets]
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def _take_all(self) -> list[_Worker]:
+        return [self._idle.get() for _ in self._pool]
+
+    def _ensure_alive(self, worker: _Worker) -> None:
+        if worker.process is None or not worker.process.is_alive():
+            # The worker died between calls or an earlier restart failed; start it again.
+            self._restart(worker)
+
+    def _restart(self, worker: _Worker) -> None:
+        self._stop(worker)
+        try:
+            self._spawn(worker)
+            self._handshake(worker)
+            if self._state is not None:
+                op, path = self._state
+                self._send(worker, op, path)
+                _unwrap(*self._receive(worker, op), op)
+        except BaseException:
+            # Leave the slot empty; the next call that picks it up tries again.
+            self._stop(worker)
+            raise
+
+    def _stop(self, worker: _Worker) -> None:
+        if worker.process is None:
+            return
+        if worker.process.is_alive() and worker.conn is not None:
+            try:
+                worker.conn.send(("stop",))
+            except OSError:
+                pass
+            worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        if worker.conn is not None:
+            worker.conn.close()
+        worker.process, worker.conn = None, None
+
+    def ingest(self, repo_path: str) -> None:
+        self._replicate(repo_path, "ingest", repo_path)
+
+    def update(self, changed: list[str], deleted: list[str], repo_path: str) -> None:
+        self._replicate(repo_path, "update", changed, deleted, repo_path)
+
+    def _replicate(self, repo_path: str, op: str, *args: Any) -> None:
+        """Run `op` in the first worker, then bring the others to the same index."""
+        first, *rest = self._take_all()
+        try:
+            self._ensure_alive(first)
+            # If this fails, the earlier state still describes every worker's index.
+            self._call(first, op, *args)
+            self._drop_snapshot()
+            self._state = None
+            self._snapshot_dir = tempfile.mkdtemp(prefix="rag-eval-pool-")
+            self._send(first, "save_index", self._snapshot_dir)
+            status, payload = self._receive(first, "save_index")
+        finally:
+            for worker in (first, *rest):
+                self._idle.put(worker)
+
+        if status == "ok":
+            self._state = ("load_index", self._snapshot_dir)
+            replay: tuple[Any, ...] = self._state
+        else:
+            self._drop_snapshot()
+            # A restarted worker can rebuild the same index by ingesting the new checkout.
+            self._state = ("ingest", repo_path)
+            replay = (op, *args)
+        # The first worker already holds the index.
+        for status, payload in self._broadcast(*replay, skip=first):
+            _unwrap(status, payload, replay[0])
+
+    def load_index(self, path: str) -> None:
+        self._drop_snapshot()
+        for status, payload in self._broadcast("load_index", path):
+            _unwrap(status, payload, "load_index")
+        self._state = ("load_index", path)
+
+    def save_index(self, path: str) -> None:
+        worker = self._idle.get()
+        try:
+            self._ensure_alive(worker)
+            self._call(worker, "save_index", path)
+        finally:
+            self._idle.put(worker)
+
+    def clear(self) -> None:
+        self._drop_snapshot()
+        self._state = None
+        for status, payload in self._broadcast("clear"):
+            _unwrap(status, payload, "clear")
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        return _decode(self._dispatch("query", query, top_k))
+
+    def query_batch(self, queries: list[str], top_k: int = 10) -> list[list[CodeChunk]]:
+        return [_decode(chunks) for chunks in self._dispatch("query_batch", queries, top_k)]
+
+    def _dispatch(self, op: str, *args: Any) -> Any:
+        worker = self._idle.get()
+        try:
+            self._ensure_alive(worker)
+            result = self._call(worker, op, *args)
+            worker.served += 1
+            if self.recycle_after is not None and worker.served >= self.recycle_after:
+                self._restart(worker)
+            return result
+        finally:
+            self._idle.put(worker)
+
+    def fingerprint(self) -> str:
+        """The wrapped adapter's fingerprint, so caches and snapshots are shared with it."""
+        return self._fingerprint
+
+    def close(self) -> None:
+        for worker in self._pool:
+            self._stop(worker)
+        self._drop_snapshot()
+
+    def _drop_snapshot(self) -> None:
+        if self._snapshot_dir is not None:
+            shutil.rmtree(self._snapshot_dir, ignore_errors=True)
+            self._snapshot_dir = None
+
+    def __enter__(self) -> "Self":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _unwrap(status: str, payload: Any, op: str) -> Any:
+    if status == "ok":
+        return payload
+    if status == "unsupported":
+        raise NotImplementedError(f"Adapter does not support {op}")
+    raise RuntimeError(payload)
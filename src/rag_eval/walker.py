@@ -0,0 +1,128 @@
+"""Shared repository walker for adapters.
+
+`walk_repo` lists the files worth indexing in a checkout and streams their text in a
+stable order, reading ahead on a thread pool so adapters overlap file I/O with their own
+processing.
+"""
+
+import os
+import subprocess
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+
+# Bytes inspected for a NUL byte when deciding whether a file is binary (git uses the same).
+_BINARY_SNIFF_BYTES = 8000
+
+# Files larger than this are skipped by default: they are almost always generated code,
+# data or vendored bundles, and reading them dominates ingest time.
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+# Skipped when the root is not a git checkout and .gitignore cannot be consulted.
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {".git", ".hg", ".svn", "node_modules", "vendor", "__pycache__", ".venv", "venv"}
+)
+
+
+@dataclass(slots=True)
+class RepoFile:
+    # Path relative to the walked root, with forward slashes.
+    path: str
+    text: str
+
+
+def list_files(root: str | Path, tracked_only: bool = False) -> list[str]:
+    """Return the relative paths of files to index under `root`, sorted.
+
+    In a git checkout the list comes from `git ls-files`, so `.gitignore` rules and `.git`
+    itself are honoured; `tracked_only` drops untracked files, leaving exactly the files of
+    the checked-out commit. Elsewhere, directories in `DEFAULT_EXCLUDED_DIRS` are skipped.
+    """
+    root_path = Path(root)
+    paths = _git_ls_files(root_path, tracked_only)
+    if paths is None:
+        paths = _walk_filesystem(root_path)
+    return sorted(paths)
+
+
+def _git_ls_files(root: Path, tracked_only: bool) -> list[str] | None:
+    # Only trust git for the top of a checkout (worktrees have a .git file); a plain
+    # directory nested in some other repo could be ignored wholesale by that repo.
+    if not (root / ".git").exists():
+        return None
+    args = ["git", "-C", str(root), "ls-files", "-z", "--cached"]
+    if not tracked_only:
+        args += ["--others", "--exclude-standard"]
+    try:
+        completed = subprocess.run(args, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    names = completed.stdout.decode("utf-8", "surrogateescape").split("\0")
+    # Deleted-but-tracked files and submodules show up in the index; keep regular files.
+    return list(dict.fromkeys(name for name in names if name and (root / name).is_file()))
+
+
+def _walk_filesystem(root: Path) -> list[str]:
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [name for name in dirnames if name not in DEFAULT_EXCLUDED_DIRS]
+        base = Path(dirpath).relative_to(root)
+        paths.extend((base / name).as_posix() for name in filenames)
+    return paths
+
+
+def _read_text(path: Path, max_bytes: int | None) -> str | None:
+    # Binary and oversized files are rejected after at most one sniff-sized read.
+    try:
+        with path.open("rb") as handle:
+            if max_bytes is not None and os.fstat(handle.fileno()).st_size > max_bytes:
+                return None
+            data = handle.read(_BINARY_SNIFF_BYTES)
+            if b"\0" in data:
+                return None
+            data += handle.read()
+    except OSError:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def walk_repo(
+    root: str | Path,
+    tracked_only: bool = False,
+    max_bytes: int | None = DEFAULT_MAX_BYTES,
+    workers: int = 8,
+    paths: Iterable[str] | None = None,
+) -> Iterator[RepoFile]:
+    """Yield the UTF-8 text files under `root` in path order.
+
+    Binary files (a NUL byte near the start), files that are not valid UTF-8, and files
+    larger than `max_bytes` (1 MiB by default; None for no limit) are skipped. Files are
+    read on `workers` threads with a bounded read-ahead, so memory holds only a few files at
+    a time. `paths` restricts the walk to those relative paths (e.g. the files
+    `RAGSystem.update` was given); missing ones are skipped.
+    """
+    root_path = Path(root)
+    if paths is None:
+        names = iter(list_files(root_path, tracked_only=tracked_only))
+    else:
+        names = iter(sorted(set(paths)))
+    pending: deque[tuple[str, Future[str | None]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def submit(batch: int) -> None:
+            for name in islice(names, batch):
+                pending.append((name, pool.submit(_read_text, root_path / name, max_bytes)))
+
+        submit(workers * 4)
+        while pending:
+            name, future = pending.popleft()
+            submit(1)
+            text = future.result()
+            if text is not None:
+                yield RepoFile(path=name, text=text)
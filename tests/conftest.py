@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+from helpers import commit_all, git
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """A small git repository with one commit of two Python files."""
+    repo = tmp_path / "origin"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "alpha.py").write_text("def alpha():\n    return 'alpha'\n")
+    (repo / "pkg" / "beta.py").write_text("def beta():\n    return 'beta'\n")
+    git(repo, "init", "--quiet")
+    commit_all(repo, "initial")
+    return repo
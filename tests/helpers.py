@@ -0,0 +1,62 @@
+"""Shared test helpers: git fixtures, dataset files and a stub adapter."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models import CodeChunk
+
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "rag-eval",
+    "GIT_AUTHOR_EMAIL": "rag-eval@example.invalid",
+    "GIT_COMMITTER_NAME": "rag-eval",
+    "GIT_COMMITTER_EMAIL": "rag-eval@example.invalid",
+}
+
+
+def git(repo: Path, *args: str) -> str:
+    completed = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        env={**os.environ, **_GIT_ENV},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.strip()
+
+
+def commit_all(repo: Path, message: str = "commit") -> str:
+    git(repo, "add", "--all")
+    git(repo, "commit", "--quiet", "--allow-empty", "-m", message)
+    return git(repo, "rev-parse", "HEAD")
+
+
+def write_dataset(path: Path, repo: Path, commit: str, queries: list[str], top_k: int = 5) -> Path:
+    """Write a JSONL dataset over `repo` whose queries all expect `pkg/alpha.py:1-2`."""
+    header = {"name": "test", "repo": {"url": str(repo), "commit": commit}, "top_k": top_k}
+    records = [header] + [
+        {
+            "id": f"q{i}",
+            "text": text,
+            "ground_truth": [{"file_path": "pkg/alpha.py", "start_line": 1, "end_line": 2}],
+        }
+        for i, text in enumerate(queries)
+    ]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+class StubRAG(RAGSystem):
+    """Returns one fixed chunk whose content differs from the file it points at."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def ingest(self, repo_path: str) -> None:
+        pass
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        self.queries.append(query)
+        return [CodeChunk("pkg/alpha.py", 1, 2, content="from the adapter", score=1.0)]
@@ -0,0 +1,40 @@
+"""Adapters for the worker pool tests; worker processes import them by spec."""
+
+import json
+import os
+from pathlib import Path
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models import CodeChunk
+
+
+class RecordingAdapter(RAGSystem):
+    """Answers every query with the repo it indexed; the query "crash" kills the worker."""
+
+    def __init__(self) -> None:
+        self.indexed: str | None = None
+
+    def ingest(self, repo_path: str) -> None:
+        self.indexed = repo_path
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        if query == "crash":
+            os._exit(1)
+        return [CodeChunk("indexed.txt", 1, 1, content=str(self.indexed))]
+
+    def save_index(self, path: str) -> None:
+        Path(path, "index.json").write_text(json.dumps(self.indexed))
+
+    def load_index(self, path: str) -> None:
+        self.indexed = json.loads(Path(path, "index.json").read_text())
+
+
+class DiskAdapter(RecordingAdapter):
+    """Keeps its index under `data_dir` and reports that directory in query results."""
+
+    def __init__(self, data_dir: str = "./unused") -> None:
+        super().__init__()
+        self.data_dir = data_dir
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        return [CodeChunk("data_dir.txt", 1, 1, content=self.data_dir)]
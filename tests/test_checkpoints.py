@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from helpers import StubRAG, git, write_dataset
+
+from rag_eval.models import CodeChunk, Query, QueryResult
+from rag_eval.runner import BenchmarkRunner, CheckpointStore
+
+
+class FailingRAG(StubRAG):
+    """Fails every query whose text is in `failing`."""
+
+    def __init__(self, failing: set[str]) -> None:
+        super().__init__()
+        self._failing = failing
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        if query in self._failing:
+            self.queries.append(query)
+            raise ConnectionError("unavailable")
+        return super().query(query, top_k)
+
+
+def test_checkpoint_round_trip(tmp_path: Path) -> None:
+    dataset = tmp_path / "dataset.jsonl"
+    dataset.write_text("{}\n")
+    store = CheckpointStore(tmp_path / "checkpoints")
+    chunk = CodeChunk("pkg/alpha.py", 1, 2, content="def alpha():", score=0.5)
+
+    checkpoint = store.open(dataset, "adapter", {"top_k": 5})
+    checkpoint.record(QueryResult(Query("q0", "a"), [chunk], {}, latency_s=0.25))
+    checkpoint.record(QueryResult(Query("q1", "b"), [], {}, error="boom"))
+    checkpoint.close()
+    # A crash mid-write leaves a partial line behind; it is dropped on resume.
+    with checkpoint.path.open("a") as handle:
+        handle.write('{"text": "c", "retr')
+
+    resumed = store.open(dataset, "adapter", {"top_k": 5}, resume=True)
+    resumed.close()
+    assert resumed.completed == {"a": ([chunk], 0.25)}
+    assert store.open(dataset, "adapter", {"top_k": 6}, resume=True).completed == {}
+
+
+def test_resume_retries_only_failed_queries(git_repo: Path, tmp_path: Path) -> None:
+    commit = git(git_repo, "rev-parse", "HEAD")
+    dataset = write_dataset(tmp_path / "dataset.jsonl", git_repo, commit, ["a", "b", "c"])
+    checkpoints = CheckpointStore(tmp_path / "checkpoints")
+
+    first = BenchmarkRunner(
+        FailingRAG({"b"}), cache_dir=tmp_path / "cache", checkpoints=checkpoints
+    ).run(dataset)
+    assert [r.error is None for r in first.query_results] == [True, False, True]
+    # The failed run keeps its checkpoint for --resume.
+    assert len(list(checkpoints.root.glob("*.jsonl"))) == 1
+
+    adapter = FailingRAG(set())
+    second = BenchmarkRunner(adapter, cache_dir=tmp_path / "cache", checkpoints=checkpoints).run(
+        dataset, resume=True
+    )
+    assert adapter.queries == ["b"]
+    assert [r.query.id for r in second.query_results] == ["q0", "q1", "q2"]
+    assert all(r.error is None for r in second.query_results)
+    # Once everything succeeded there is nothing left to resume.
+    assert list(checkpoints.root.glob("*.jsonl")) == []
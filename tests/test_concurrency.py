@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from helpers import StubRAG, git, write_dataset
+
+from rag_eval.models import CodeChunk
+from rag_eval.runner import BenchmarkRunner
+from rag_eval.runner.rate_limit import TokenBucket
+
+QUERIES = ["q-0.04", "q-0.03", "boom", "q-0.01", "q-0.0"]
+
+
+class SleepyRAG(StubRAG):
+    """Sleeps for the delay in the query text, so later queries finish first; fails on boom."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        if query == "boom":
+            raise RuntimeError("boom")
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(float(query.removeprefix("q-")))
+        finally:
+            with self._lock:
+                self.active -= 1
+        return super().query(query, top_k)
+
+    async def aquery(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        if query == "boom":
+            raise RuntimeError("boom")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(float(query.removeprefix("q-")))
+        finally:
+            self.active -= 1
+        return super().query(query, top_k)
+
+
+class ShortBatchRAG(StubRAG):
+    def query_batch(self, queries: list[str], top_k: int = 10) -> list[list[CodeChunk]]:
+        return [self.query(query, top_k) for query in queries[:-1]]
+
+
+@pytest.fixture
+def dataset(git_repo: Path, tmp_path: Path) -> Path:
+    return write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), QUERIES
+    )
+
+
+def _check_results(report) -> None:
+    assert [r.query.id for r in report.query_results] == [f"q{i}" for i in range(len(QUERIES))]
+    statuses = {r.query.text: r.status for r in report.query_results}
+    assert statuses.pop("boom") == "error"
+    assert set(statuses.values()) == {"ok"}
+    (failed,) = [r for r in report.query_results if r.error]
+    assert "boom" in failed.error
+    assert failed.retrieved == []
+
+
+def test_threaded_run_keeps_query_order_and_captures_failures(
+    dataset: Path, tmp_path: Path
+) -> None:
+    adapter = SleepyRAG()
+    streamed = []
+    report = BenchmarkRunner(adapter, cache_dir=tmp_path / "cache").run(
+        dataset, concurrency=4, on_result=streamed.append
+    )
+
+    _check_results(report)
+    assert adapter.peak > 1
+    assert sorted(r.query.id for r in streamed) == [r.query.id for r in report.query_results]
+
+
+def test_async_run_keeps_query_order_and_respects_max_in_flight(
+    dataset: Path, tmp_path: Path
+) -> None:
+    adapter = SleepyRAG()
+    report = asyncio.run(
+        BenchmarkRunner(adapter, cache_dir=tmp_path / "cache").arun(dataset, max_in_flight=2)
+    )
+
+    _check_results(report)
+    assert adapter.peak == 2
+
+
+def test_batch_length_mismatch_fails_the_batch(dataset: Path, tmp_path: Path) -> None:
+    report = BenchmarkRunner(ShortBatchRAG(), cache_dir=tmp_path / "cache").run(
+        dataset, batch_size=2
+    )
+
+    assert [r.status for r in report.query_results] == ["error"] * len(QUERIES)
+    assert "query_batch returned 1 results for 2 queries" in report.query_results[0].error
+    assert "query_batch returned 0 results for 1 queries" in report.query_results[-1].error
+
+
+def test_token_bucket_spaces_acquires_at_the_rate() -> None:
+    async def acquire_all(bucket: TokenBucket, count: int) -> float:
+        start = time.monotonic()
+        for _ in range(count):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    # The burst is free; each further token waits 1/rate seconds.
+    elapsed = asyncio.run(acquire_all(TokenBucket(rate=50, burst=2), 7))
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_rate_limited_async_run(dataset: Path, tmp_path: Path) -> None:
+    runner = BenchmarkRunner(StubRAG(), cache_dir=tmp_path / "cache")
+    start = time.monotonic()
+    report = asyncio.run(runner.arun(dataset, rate_limit=50))
+
+    assert len(report.query_results) == len(QUERIES)
+    assert time.monotonic() - start >= 0.07
+
+
+@pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "burst": 0}])
+def test_token_bucket_rejects_invalid_settings(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(**kwargs)
@@ -0,0 +1,134 @@
+import json
+from pathlib import Path
+
+import pytest
+from helpers import commit_all, git
+
+from rag_eval.models import GroundTruthChunk, Query, RepoSpec
+from rag_eval.runner import dataset_loader, load_dataset, open_dataset, prepare_repo
+from rag_eval.runner.dataset_loader import checkout_commit
+
+HEADER = {"name": "demo", "repo": {"url": "https://example.invalid/r", "commit": "abc"}, "top_k": 3}
+QUERY = {
+    "id": "q1",
+    "text": "where is alpha",
+    "ground_truth": [{"file_path": "pkg/alpha.py", "start_line": 1, "end_line": "2"}],
+}
+
+
+def write_jsonl(path: Path, *records: dict) -> Path:
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+def test_prepare_repo_with_relative_cache_dir(
+    git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    commit = git(git_repo, "rev-parse", "HEAD")
+
+    checkout = prepare_repo(RepoSpec(url=str(git_repo), commit=commit), Path("cache"))
+
+    assert checkout.is_absolute()
+    assert checkout.is_relative_to(tmp_path / "cache" / "worktrees")
+    expected = (git_repo / "pkg" / "alpha.py").read_text()
+    assert (checkout / "pkg" / "alpha.py").read_text() == expected
+    # A second call reuses the worktree instead of failing on the existing path.
+    assert prepare_repo(RepoSpec(url=str(git_repo), commit=commit), Path("cache")) == checkout
+
+
+def test_prepare_repo_follows_branches_and_short_shas(git_repo: Path, tmp_path: Path) -> None:
+    git(git_repo, "branch", "--move", "--force", "main")
+    first = git(git_repo, "rev-parse", "HEAD")
+    cache = tmp_path / "cache"
+
+    assert checkout_commit(prepare_repo(RepoSpec(str(git_repo), "main"), cache)) == first
+    (git_repo / "pkg" / "alpha.py").write_text("def alpha():\n    return 'changed'\n")
+    second = commit_all(git_repo, "change alpha")
+    assert checkout_commit(prepare_repo(RepoSpec(str(git_repo), "main"), cache)) == second
+    assert checkout_commit(prepare_repo(RepoSpec(str(git_repo), first[:10]), cache)) == first
+
+
+def test_jsonl_dataset_is_parsed_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "demo.jsonl"
+    path.write_text(json.dumps(HEADER) + "\n\n" + json.dumps(QUERY) + "\n")
+
+    header, queries = open_dataset(path)
+
+    assert (header.name, header.repo, header.top_k, header.queries) == (
+        "demo",
+        RepoSpec("https://example.invalid/r", "abc"),
+        3,
+        [],
+    )
+    assert list(queries) == [
+        Query("q1", "where is alpha", [GroundTruthChunk("pkg/alpha.py", 1, 2)])
+    ]
+    assert load_dataset(path).queries == [
+        Query("q1", "where is alpha", [GroundTruthChunk("pkg/alpha.py", 1, 2)])
+    ]
+
+
+@pytest.mark.parametrize(
+    ("records", "message"),
+    [
+        ((), "is empty"),
+        ((HEADER, {"text": "no id"}), "Missing required field 'id' in query"),
+        (({"repo": {"url": "u"}},), "Missing required field 'name' in dataset"),
+    ],
+)
+def test_invalid_jsonl_datasets_are_rejected(
+    tmp_path: Path, records: tuple[dict, ...], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        load_dataset(write_jsonl(tmp_path / "bad.jsonl", *records))
+
+
+def test_invalid_json_line_is_reported_by_line_number(tmp_path: Path) -> None:
+    path = tmp_path / "bad.jsonl"
+    path.write_text(json.dumps(HEADER) + "\n{not json\n")
+
+    with pytest.raises(ValueError, match="Invalid JSON on line 2"):
+        load_dataset(path)
+
+
+def test_parse_cache_hits_until_the_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = write_jsonl(tmp_path / "demo.jsonl", HEADER, QUERY)
+    cache = tmp_path / "cache"
+    dataset = load_dataset(path, cache_dir=cache)
+    (entry,) = (cache / "datasets").iterdir()
+
+    def fail(path):
+        raise AssertionError("parsed despite a cached copy")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(dataset_loader, "open_dataset", fail)
+        assert load_dataset(path, cache_dir=cache) == dataset
+
+    # Same size, different content: the key is the content hash, not mtime or size.
+    write_jsonl(path, HEADER, {**QUERY, "text": "where is gamma"})
+    assert load_dataset(path, cache_dir=cache).queries[0].text == "where is gamma"
+    assert len(list((cache / "datasets").iterdir())) == 2
+    assert entry.exists()
+
+
+def test_corrupt_parse_cache_is_replaced(tmp_path: Path) -> None:
+    path = write_jsonl(tmp_path / "demo.jsonl", HEADER, QUERY)
+    cache = tmp_path / "cache"
+    expected = load_dataset(path, cache_dir=cache)
+    (entry,) = (cache / "datasets").iterdir()
+    entry.write_bytes(b"not a pickle")
+
+    assert load_dataset(path, cache_dir=cache) == expected
+    assert load_dataset(path) == expected
+    assert entry.read_bytes() != b"not a pickle"
+
+
+def test_yaml_and_jsonl_datasets_load_the_same(tmp_path: Path) -> None:
+    yaml = pytest.importorskip("yaml")
+    (tmp_path / "demo.yaml").write_text(yaml.safe_dump({**HEADER, "queries": [QUERY]}))
+    write_jsonl(tmp_path / "demo.jsonl", HEADER, QUERY)
+
+    assert load_dataset(tmp_path / "demo.yaml") == load_dataset(tmp_path / "demo.jsonl")
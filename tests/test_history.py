@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from rag_eval.models import Dataset, Query, QueryResult, RepoSpec
+from rag_eval.runner import HistoryStore
+from rag_eval.runner.benchmark_runner import build_report
+
+
+def make_report(recalls: dict[str, float], name: str = "bench", commit: str = "abc"):
+    queries = [Query(query_id, f"text {query_id}") for query_id in recalls]
+    dataset = Dataset(
+        name=name, repo=RepoSpec("https://example.invalid/r", commit), queries=queries
+    )
+    # Queries that found nothing are recorded as failures, to exercise failed_queries.
+    results = [
+        QueryResult(
+            query,
+            [],
+            {"recall@k": recall, "mrr": recall / 2},
+            error=None if recall else "boom",
+            latency_s=0.1,
+        )
+        for query, recall in zip(queries, recalls.values())
+    ]
+    return build_report(dataset, results, index_source="ingest")
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> HistoryStore:
+    return HistoryStore(tmp_path / "history" / "runs.sqlite")
+
+
+def test_runs_are_listed_newest_first_and_filtered(store: HistoryStore) -> None:
+    first = store.record(make_report({"a": 1.0, "b": 0.0}), adapter="grep", label="base")
+    second = store.record(make_report({"a": 0.5, "b": 1.0}, commit="def"), adapter="grep")
+    third = store.record(make_report({"a": 1.0}, name="other"), adapter="vector", top_k=3)
+
+    assert [run.id for run in store.runs()] == [third, second, first]
+    assert [run.id for run in store.runs(adapter="grep")] == [second, first]
+    assert [run.id for run in store.runs(commit="abc")] == [third, first]
+    assert [run.id for run in store.runs(limit=1)] == [third]
+
+    base = store.run(first)
+    assert (base.dataset, base.repo_commit, base.label) == ("bench", "abc", "base")
+    assert (base.queries, base.failed_queries, base.top_k) == (2, 1, 10)
+    assert base.aggregate_metrics == {"recall@k": 0.5, "mrr": 0.25}
+    assert store.run(third).top_k == 3
+    with pytest.raises(ValueError, match="No run with id"):
+        store.run(999)
+
+
+def test_compare_reports_per_query_deltas(store: HistoryStore) -> None:
+    base = store.record(make_report({"a": 1.0, "b": 0.5, "c": 0.0, "d": 1.0}), adapter="grep")
+    head = store.record(make_report({"a": 0.0, "b": 1.0, "c": 0.0, "e": 1.0}), adapter="grep")
+
+    comparison = store.compare(base, head)
+
+    assert (comparison.base.id, comparison.head.id, comparison.metric) == (base, head, "recall@k")
+    # Only queries in both runs, biggest drop first, ties by query id.
+    assert [(q.query_id, q.delta) for q in comparison.queries] == [
+        ("a", -1.0),
+        ("c", 0.0),
+        ("b", 0.5),
+    ]
+    assert comparison.queries[0].text == "text a"
+    assert comparison.queries[0].latency_before_s == comparison.queries[0].latency_after_s == 0.1
+
+    regressions = store.compare(base, head, metric="mrr", regressions_only=True)
+    assert [(q.query_id, q.before, q.after) for q in regressions.queries] == [("a", 0.5, 0.0)]
+    assert [q.query_id for q in store.compare(base, head, limit=2).queries] == ["a", "c"]
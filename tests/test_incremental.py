@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pytest
+from helpers import StubRAG, commit_all, git, write_dataset
+
+from adapters.simple_adapter import SimpleGrepRAG
+from rag_eval.models import RepoSpec
+from rag_eval.runner import BenchmarkRunner, SnapshotStore, prepare_repo
+from rag_eval.runner.dataset_loader import changed_files
+
+QUERIES = ["alpha", "beta", "gamma parser", "delta", "render template", "moved helper"]
+
+
+def prepare_repo_at(repo: Path, commit: str, tmp_path: Path) -> Path:
+    return prepare_repo(RepoSpec(url=str(repo), commit=commit), tmp_path / "cache")
+
+
+@pytest.fixture
+def two_commits(git_repo: Path) -> tuple[Path, str, str]:
+    """`git_repo` plus a second commit that edits, deletes, adds and renames files."""
+    first = git(git_repo, "rev-parse", "HEAD")
+    (git_repo / "pkg" / "alpha.py").write_text("def alpha():\n    return render_template()\n")
+    (git_repo / "pkg" / "beta.py").unlink()
+    (git_repo / "pkg" / "gamma.py").write_text("class GammaParser:\n    delta = 1\n")
+    (git_repo / "pkg" / "util.py").write_text("def moved_helper():\n    pass\n")
+    commit_all(git_repo, "second")
+    git(git_repo, "mv", "pkg/util.py", "pkg/helpers.py")
+    return git_repo, first, commit_all(git_repo, "rename")
+
+
+def test_changed_files_lists_edits_additions_deletions_and_renames(
+    two_commits: tuple[Path, str, str], tmp_path: Path
+) -> None:
+    repo, first, second = two_commits
+    prepare_repo_at(repo, first, tmp_path)
+    checkout = prepare_repo_at(repo, second, tmp_path)
+
+    changed, deleted = changed_files(checkout, first, second)
+
+    assert sorted(changed) == ["pkg/alpha.py", "pkg/gamma.py", "pkg/helpers.py"]
+    assert deleted == ["pkg/beta.py"]
+
+
+def test_update_matches_a_fresh_ingest(two_commits: tuple[Path, str, str], tmp_path: Path) -> None:
+    repo, first, second = two_commits
+    old, new = prepare_repo_at(repo, first, tmp_path), prepare_repo_at(repo, second, tmp_path)
+    updated = SimpleGrepRAG(window=2, stride=1)
+    updated.ingest(str(old))
+    updated.update(*changed_files(new, first, second), str(new))
+    fresh = SimpleGrepRAG(window=2, stride=1)
+    fresh.ingest(str(new))
+
+    for query in QUERIES:
+        assert updated.query(query) == pytest.approx(fresh.query(query)), query
+
+
+def test_runner_updates_across_commits_and_falls_back_to_ingest(
+    two_commits: tuple[Path, str, str], tmp_path: Path
+) -> None:
+    repo, first, second = two_commits
+    old = write_dataset(tmp_path / "old.jsonl", repo, first, QUERIES)
+    new = write_dataset(tmp_path / "new.jsonl", repo, second, QUERIES)
+
+    runner = BenchmarkRunner(SimpleGrepRAG(), cache_dir=tmp_path / "cache")
+    assert runner.run(old).index_source == "ingest"
+    assert runner.run(new).index_source == "update"
+
+    # StubRAG keeps RAGSystem.update, which cannot update, so it is re-ingested.
+    runner = BenchmarkRunner(StubRAG(), cache_dir=tmp_path / "cache")
+    assert runner.run(old).index_source == "ingest"
+    assert runner.run(new).index_source == "ingest"
+
+
+def test_snapshot_of_a_moved_branch_is_updated_from_its_commit(
+    two_commits: tuple[Path, str, str], tmp_path: Path
+) -> None:
+    repo, first, second = two_commits
+    git(repo, "branch", "--force", "bench", first)
+    dataset = write_dataset(tmp_path / "dataset.jsonl", repo, "bench", QUERIES)
+    snapshots = SnapshotStore(tmp_path / "snapshots")
+
+    def run() -> tuple[str, list]:
+        runner = BenchmarkRunner(
+            SimpleGrepRAG(window=2, stride=1), cache_dir=tmp_path / "cache", snapshots=snapshots
+        )
+        report = runner.run(dataset)
+        return report.index_source, [result.retrieved for result in report.query_results]
+
+    assert run()[0] == "ingest"
+    assert run()[0] == "snapshot"
+
+    git(repo, "branch", "--force", "bench", second)
+    source, retrieved = run()
+    assert source == "update"
+    fresh = SimpleGrepRAG(window=2, stride=1)
+    fresh.ingest(str(prepare_repo_at(repo, second, tmp_path)))
+    assert retrieved == [fresh.query(query, top_k=5) for query in QUERIES]
@@ -0,0 +1,44 @@
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+from helpers import StubRAG, git, write_dataset
+
+from rag_eval.reporting import JsonlResultWriter
+from rag_eval.runner import BenchmarkRunner
+
+
+def test_results_stream_one_line_per_query_then_a_summary(git_repo: Path, tmp_path: Path) -> None:
+    dataset = write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), ["a", "b", "c"]
+    )
+    output = tmp_path / "results.jsonl"
+
+    with JsonlResultWriter(output, content="hash", release_content=True) as writer:
+        report = BenchmarkRunner(StubRAG(), cache_dir=tmp_path / "cache").run(
+            dataset, concurrency=2, on_result=writer.write_result
+        )
+        writer.write_summary(report)
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["type"] for record in records] == ["query", "query", "query", "summary"]
+    assert sorted(record["text"] for record in records[:3]) == ["a", "b", "c"]
+    (chunk,) = records[0]["retrieved"]
+    assert "content" not in chunk
+    assert chunk["content_sha256"] == hashlib.sha256(b"from the adapter").hexdigest()
+    assert records[0]["metrics"]["recall@k"] == 1.0
+
+    summary = records[-1]
+    assert summary["dataset"]["name"] == "test"
+    assert summary["aggregate_metrics"] == report.aggregate_metrics
+    assert summary["outcomes"]["ok"] == 3
+
+    # Written results keep their locations but no longer hold chunk text.
+    assert [c.content for r in report.query_results for c in r.retrieved] == ["", "", ""]
+    assert report.query_results[0].retrieved[0].file_path == "pkg/alpha.py"
+
+
+def test_rejects_unknown_content_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="content must be one of"):
+        JsonlResultWriter(tmp_path / "out.jsonl", content="gzip")
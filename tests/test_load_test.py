@@ -0,0 +1,37 @@
+import threading
+
+from rag_eval.interfaces import RAGSystem
+from rag_eval.models import CodeChunk
+from rag_eval.runner import run_load_test
+
+
+class HalfHungRAG(RAGSystem):
+    """Every other query blocks until the test releases it."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.release = threading.Event()
+
+    def ingest(self, repo_path: str) -> None:
+        pass
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        with self._lock:
+            self.calls += 1
+            hang = self.calls % 2 == 1
+        if hang:
+            self.release.wait(30)
+        return []
+
+
+def test_timed_out_requests_free_their_slots() -> None:
+    adapter = HalfHungRAG()
+    try:
+        report = run_load_test(adapter, ["q"], rate=20, duration_s=1, timeout_s=0.2, max_workers=2)
+    finally:
+        adapter.release.set()
+
+    assert report.sent == 20
+    # With two slots, hung requests would starve every later one if they kept their slot.
+    assert (report.completed, report.timeouts, report.errors) == (10, 10, 0)
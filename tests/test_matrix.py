@@ -0,0 +1,78 @@
+import pytest
+from helpers import git, write_dataset
+
+from rag_eval.runner.matrix import load_matrix_config, run_matrix
+
+
+def test_load_matrix_config_resolves_datasets_and_adapters(tmp_path):
+    config = tmp_path / "matrix.yaml"
+    config.write_text(
+        "datasets: [data/one.jsonl]\n"
+        "adapters:\n"
+        "  - helpers:StubRAG\n"
+        "  - spec: adapters.simple_adapter:SimpleGrepRAG\n"
+        "    name: grep-small\n"
+        "    options: {window: 5}\n"
+        "top_k: 3\n"
+        "ignored: true\n"
+    )
+
+    matrix = load_matrix_config(config)
+
+    assert matrix.datasets == [tmp_path / "data/one.jsonl"]
+    assert [(a.spec, a.name, a.options) for a in matrix.adapters] == [
+        ("helpers:StubRAG", "helpers:StubRAG", {}),
+        ("adapters.simple_adapter:SimpleGrepRAG", "grep-small", {"window": 5}),
+    ]
+    assert matrix.run_options == {"top_k": 3}
+
+
+@pytest.mark.parametrize(
+    "body, field",
+    [
+        ("adapters: [helpers:StubRAG]\n", "datasets"),
+        ("datasets: [one.jsonl]\n", "adapters"),
+        ("datasets: [one.jsonl]\nadapters:\n  - name: nameless\n", "spec"),
+    ],
+)
+def test_load_matrix_config_rejects_missing_fields(tmp_path, body, field):
+    config = tmp_path / "matrix.yaml"
+    config.write_text(body)
+
+    with pytest.raises(ValueError, match=f"Missing required field '{field}'"):
+        load_matrix_config(config)
+
+
+def test_run_matrix_runs_every_cell(git_repo, tmp_path):
+    sha = git(git_repo, "rev-parse", "HEAD")
+    write_dataset(tmp_path / "data.jsonl", git_repo, sha, ["alpha", "beta"])
+    config = tmp_path / "matrix.yaml"
+    config.write_text(
+        "datasets: [data.jsonl]\n"
+        "adapters:\n"
+        "  - helpers:StubRAG\n"
+        "  - spec: adapters.simple_adapter:SimpleGrepRAG\n"
+        "    name: grep\n"
+        "  - missing.module:Nothing\n"
+        "top_k: 2\n"
+    )
+
+    report = run_matrix(load_matrix_config(config), cache_dir=tmp_path / "cache", workers=2)
+
+    rows = {row.adapter: row for row in report.rows}
+    assert list(rows) == ["helpers:StubRAG", "grep", "missing.module:Nothing"]
+    for name in ("helpers:StubRAG", "grep"):
+        assert rows[name].error is None
+        assert rows[name].dataset == "test"
+        assert rows[name].queries == 2
+        assert rows[name].failed_queries == 0
+    assert rows["helpers:StubRAG"].aggregate_metrics["recall@k"] == 1.0
+    assert rows["missing.module:Nothing"].error is not None
+
+
+def test_run_matrix_rejects_zero_workers(tmp_path):
+    config = tmp_path / "matrix.yaml"
+    config.write_text("datasets: []\nadapters: []\n")
+
+    with pytest.raises(ValueError, match="workers"):
+        run_matrix(load_matrix_config(config), cache_dir=tmp_path, workers=0)
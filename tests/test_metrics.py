@@ -0,0 +1,148 @@
+import math
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from rag_eval.metrics import core
+from rag_eval.metrics.core import (
+    chunk_matches,
+    compute_metrics,
+    line_precision_at_k,
+    line_recall_at_k,
+    sweep_metrics,
+)
+from rag_eval.models import CodeChunk, GroundTruthChunk
+
+FILES = ["a.py", "b.py", "c.py"]
+
+
+def _reference_metrics(
+    retrieved: Sequence[CodeChunk],
+    ground_truth: Sequence[GroundTruthChunk],
+    k: int,
+    overlap_threshold: float,
+) -> dict[str, float]:
+    """The original quadratic implementation: scan all ground truth for every chunk."""
+
+    def first_match(chunk: CodeChunk) -> int | None:
+        for idx, gt in enumerate(ground_truth):
+            if chunk_matches(gt, chunk, overlap_threshold):
+                return idx
+        return None
+
+    matches = [first_match(chunk) for chunk in retrieved[:k]]
+    relevance = [1 if match is not None else 0 for match in matches]
+    dcg = sum((2**rel - 1) / math.log2(idx + 2) for idx, rel in enumerate(relevance))
+    ideal = sorted(relevance, reverse=True)
+    idcg = sum((2**rel - 1) / math.log2(idx + 2) for idx, rel in enumerate(ideal))
+    return {
+        "precision@k": sum(relevance) / len(matches) if matches else 0.0,
+        "recall@k": (
+            len({m for m in matches if m is not None}) / len(ground_truth) if ground_truth else 1.0
+        ),
+        "mrr": next((1.0 / rank for rank, rel in enumerate(relevance, 1) if rel), 0.0),
+        "ndcg@k": dcg / idcg if idcg else 0.0,
+    }
+
+
+def _reference_lines(
+    retrieved: Sequence[CodeChunk], ground_truth: Sequence[GroundTruthChunk], k: int
+) -> tuple[float, float]:
+    """Line recall and precision from explicit sets of (file, line) pairs."""
+    gt_lines = {
+        (gt.file_path, line)
+        for gt in ground_truth
+        for line in range(gt.start_line, gt.end_line + 1)
+    }
+    got_lines = {
+        (c.file_path, line) for c in retrieved[:k] for line in range(c.start_line, c.end_line + 1)
+    }
+    shared = len(gt_lines & got_lines)
+    return (
+        shared / len(gt_lines) if gt_lines else 1.0,
+        shared / len(got_lines) if got_lines else 0.0,
+    )
+
+
+def _span(rng: random.Random) -> tuple[str, int, int]:
+    start = rng.randint(1, 200)
+    return rng.choice(FILES), start, start + rng.randint(0, 40)
+
+
+def _case(seed: int) -> tuple[list[CodeChunk], list[GroundTruthChunk]]:
+    rng = random.Random(seed)
+    ground_truth = [GroundTruthChunk(*_span(rng)) for _ in range(rng.randint(0, 8))]
+    retrieved = [CodeChunk(*_span(rng)) for _ in range(rng.randint(0, 25))]
+    # Duplicates and exact hits exercise tie-breaking on the lowest ground-truth index.
+    if ground_truth and rng.random() < 0.5:
+        gt = rng.choice(ground_truth)
+        retrieved.insert(
+            rng.randint(0, len(retrieved)), CodeChunk(gt.file_path, gt.start_line, gt.end_line)
+        )
+    return retrieved, ground_truth
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_metrics_match_reference_implementation(seed: int) -> None:
+    retrieved, ground_truth = _case(seed)
+    for k in (1, 5, 10, 30):
+        for threshold in (0.1, 0.5, 1.0):
+            metrics = compute_metrics(retrieved, ground_truth, k, threshold)
+            expected = _reference_metrics(retrieved, ground_truth, k, threshold)
+            assert {key: metrics[key] for key in expected} == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_sweep_matches_compute_metrics(seed: int) -> None:
+    retrieved, ground_truth = _case(seed)
+    ks, thresholds = [1, 3, 10], [0.2, 0.5, 0.9]
+    grid = sweep_metrics(retrieved, ground_truth, ks, thresholds)
+    for k in ks:
+        for threshold in thresholds:
+            expected = compute_metrics(retrieved, ground_truth, k, threshold)
+            assert grid[(k, threshold)] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_line_coverage_matches_line_sets(seed: int) -> None:
+    retrieved, ground_truth = _case(seed)
+    for k in (1, 5, 30):
+        recall, precision = _reference_lines(retrieved, ground_truth, k)
+        assert line_recall_at_k(retrieved, ground_truth, k) == pytest.approx(recall)
+        assert line_precision_at_k(retrieved, ground_truth, k) == pytest.approx(precision)
+
+
+def test_line_coverage_counts_overlapping_chunks_once() -> None:
+    ground_truth = [GroundTruthChunk("a.py", 10, 19)]
+    retrieved = [
+        CodeChunk("a.py", 5, 14),
+        CodeChunk("a.py", 12, 16),  # overlaps the first chunk and extends it by two lines
+        CodeChunk("b.py", 10, 19),  # right lines, wrong file
+    ]
+
+    # Ground-truth lines 10-16 are covered: 7 of 10.
+    assert line_recall_at_k(retrieved, ground_truth, k=3) == pytest.approx(0.7)
+    # Distinct retrieved lines: a.py 5-16 (12) + b.py 10-19 (10); 7 of them are relevant.
+    assert line_precision_at_k(retrieved, ground_truth, k=3) == pytest.approx(7 / 22)
+    assert line_recall_at_k(retrieved, ground_truth, k=1) == pytest.approx(0.5)
+
+
+def test_line_coverage_edge_cases() -> None:
+    chunk = CodeChunk("a.py", 1, 3)
+    assert line_recall_at_k([chunk], [], k=5) == 1.0
+    assert line_precision_at_k([], [GroundTruthChunk("a.py", 1, 3)], k=5) == 0.0
+
+
+def test_compute_metrics_merges_line_intervals_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    line_coverage = core._line_coverage
+
+    def counting(*args):
+        calls.append(args)
+        return line_coverage(*args)
+
+    monkeypatch.setattr(core, "_line_coverage", counting)
+    compute_metrics([CodeChunk("a.py", 1, 3)], [GroundTruthChunk("a.py", 2, 5)], k=5)
+
+    assert len(calls) == 1
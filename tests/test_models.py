@@ -0,0 +1,19 @@
+import pickle
+
+import pytest
+
+from rag_eval.models import GroundTruthChunk, Query, QueryResult
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        GroundTruthChunk("pkg/alpha.py", 1, 2),
+        Query("q1", "alpha", [GroundTruthChunk("pkg/alpha.py", 1, 2)]),
+        QueryResult(Query("q1", "alpha"), [], {"recall@k": 1.0}),
+    ],
+    ids=lambda record: type(record).__name__,
+)
+def test_per_query_records_are_slotted_and_picklable(record: object) -> None:
+    assert not hasattr(record, "__dict__")
+    assert pickle.loads(pickle.dumps(record)) == record
@@ -0,0 +1,91 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from helpers import StubRAG, git, write_dataset
+
+from rag_eval.metrics import compute_metrics
+from rag_eval.models import CodeChunk, GroundTruthChunk
+from rag_eval.runner import BenchmarkRunner, PhaseProfiler
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _score_repeatedly(seconds: float) -> None:
+    retrieved = [CodeChunk("a.py", 1, 10)]
+    ground_truth = [GroundTruthChunk("a.py", 1, 10)]
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        compute_metrics(retrieved, ground_truth, 1, 0.5)
+
+
+def _function_names(profiler: PhaseProfiler, phase: str) -> set[str]:
+    return {code.co_name for stack in profiler.samples[phase] for code in stack}
+
+
+def test_samples_are_filed_under_the_running_phase(tmp_path: Path) -> None:
+    parked = threading.Event()
+    idle = threading.Thread(target=parked.wait)
+    idle.start()
+    try:
+        with PhaseProfiler(interval=0.002) as profiler:
+            _spin(0.05)  # outside any phase: discarded
+            with profiler.phase("ingest"):
+                _spin(0.1)
+            with profiler.phase("query"):
+                _score_repeatedly(0.1)
+    finally:
+        parked.set()
+        idle.join()
+
+    assert set(profiler.samples) == {"ingest", "query", "compute_metrics"}
+    assert "_spin" in _function_names(profiler, "ingest")
+    assert "_score_repeatedly" not in _function_names(profiler, "ingest")
+    # Scoring inside the query phase is split out; the thread parked on an event is dropped.
+    assert "compute_metrics" in _function_names(profiler, "compute_metrics")
+    assert "wait" not in {stack[-1].co_name for s in profiler.samples.values() for stack in s}
+
+    paths = profiler.write(tmp_path / "profile", top=5)
+    assert sorted(p.name for p in paths) == [
+        "compute_metrics.collapsed",
+        "ingest.collapsed",
+        "query.collapsed",
+        "summary.txt",
+    ]
+    collapsed = (tmp_path / "profile" / "ingest.collapsed").read_text().splitlines()
+    stack, count = collapsed[0].rsplit(" ", 1)
+    assert stack.split(";")[-1].startswith("_spin (tests/test_profiling.py:")
+    assert int(count) > 0
+    summary = (tmp_path / "profile" / "summary.txt").read_text()
+    assert "== ingest:" in summary
+    assert "_spin (tests/test_profiling.py:" in summary
+
+
+def test_runner_phases_reach_the_profiler(git_repo: Path, tmp_path: Path) -> None:
+    class SlowRAG(StubRAG):
+        def ingest(self, repo_path: str) -> None:
+            _spin(0.05)
+
+    dataset = write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), ["a"]
+    )
+    with PhaseProfiler(interval=0.002) as profiler:
+        BenchmarkRunner(SlowRAG(), cache_dir=tmp_path / "cache", profiler=profiler).run(dataset)
+
+    assert "_spin" in _function_names(profiler, "ingest")
+
+
+def test_summary_without_samples() -> None:
+    assert PhaseProfiler().summary() == "No samples collected.\n"
+
+
+def test_profiler_rejects_bad_interval_and_double_start() -> None:
+    with pytest.raises(ValueError, match="interval"):
+        PhaseProfiler(interval=0)
+    with PhaseProfiler() as profiler, pytest.raises(RuntimeError, match="already started"):
+        profiler.start()
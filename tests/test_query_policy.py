@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rag_eval.runner.query_policy import PolicyCaller, QueryPolicy
+
+
+class Flaky:
+    """Raises on the first `failures` calls, then returns "ok"."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError(f"attempt {self.calls}")
+        return "ok"
+
+
+@pytest.mark.parametrize("timeout_s", [None, 5.0])
+def test_retry_succeeds_after_failures(timeout_s: float | None) -> None:
+    caller = PolicyCaller(QueryPolicy(timeout_s=timeout_s, retries=2, backoff_s=0.001))
+
+    outcome = caller.call(Flaky(failures=2))
+
+    assert (outcome.status, outcome.value, outcome.error, outcome.attempts) == ("ok", "ok", None, 3)
+
+
+def test_retries_exhausted_reports_last_error() -> None:
+    fn = Flaky(failures=10)
+    caller = PolicyCaller(QueryPolicy(retries=2, backoff_s=0.001))
+
+    outcome = caller.call(fn)
+
+    assert outcome.status == "error"
+    assert outcome.error == "ConnectionError: attempt 3"
+    assert outcome.attempts == fn.calls == 3
+
+
+def test_hanging_call_times_out_at_the_deadline() -> None:
+    release = threading.Event()
+    caller = PolicyCaller(QueryPolicy(timeout_s=0.2, retries=3))
+
+    started = time.perf_counter()
+    outcome = caller.call(release.wait)
+    elapsed = time.perf_counter() - started
+    release.set()
+
+    assert outcome.status == "timeout"
+    assert outcome.value is None
+    assert 0.2 <= elapsed < 1.0
+
+
+def test_slow_call_is_hedged_and_the_duplicate_wins() -> None:
+    caller = PolicyCaller(QueryPolicy(hedge_percentile=50, hedge_min_samples=3))
+    for _ in range(3):
+        assert caller.call(lambda: "fast").status == "ok"
+
+    release = threading.Event()
+    calls = 0
+
+    def first_call_hangs() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            release.wait()
+            return "slow"
+        return "hedge"
+
+    outcome = caller.call(first_call_hangs)
+    release.set()
+
+    assert (outcome.status, outcome.value, outcome.hedged) == ("ok", "hedge", True)
+
+
+def test_no_hedging_before_enough_samples() -> None:
+    caller = PolicyCaller(QueryPolicy(hedge_percentile=50, hedge_min_samples=3))
+    caller.call(lambda: "fast")
+
+    outcome = caller.call(lambda: time.sleep(0.05) or "slow")
+
+    assert (outcome.value, outcome.hedged) == ("slow", False)
+
+
+def test_async_timeout_cancels_the_call() -> None:
+    cancelled = asyncio.Event()
+
+    async def hang() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def run():
+        outcome = await PolicyCaller(QueryPolicy(timeout_s=0.1)).acall(hang)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        return outcome
+
+    outcome = asyncio.run(run())
+
+    assert outcome.status == "timeout"
+    assert cancelled.is_set()
+
+
+def test_async_retry_succeeds() -> None:
+    fn = Flaky(failures=1)
+
+    async def flaky() -> str:
+        return fn()
+
+    outcome = asyncio.run(PolicyCaller(QueryPolicy(retries=1, backoff_s=0.001)).acall(flaky))
+
+    assert (outcome.status, outcome.attempts) == ("ok", 2)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"timeout_s": 0},
+        {"retries": -1},
+        {"backoff_s": -1},
+        {"hedge_percentile": 100},
+        {"hedge_min_samples": 0},
+    ],
+)
+def test_policy_rejects_invalid_settings(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        QueryPolicy(**kwargs)
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pytest
+from helpers import StubRAG, git, write_dataset
+from typer.testing import CliRunner
+
+from rag_eval.cli import app
+from rag_eval.models import CodeChunk
+from rag_eval.runner import BenchmarkRunner, RetrievalCache
+
+
+class MissFirstRAG(StubRAG):
+    """Ranks a wrong chunk above the expected one."""
+
+    def query(self, query: str, top_k: int = 10) -> list[CodeChunk]:
+        hit = super().query(query, top_k)[0]
+        miss = CodeChunk("pkg/beta.py", 1, 2, content="miss", score=2.0)
+        return [miss, hit, miss][:top_k]
+
+
+@pytest.fixture
+def cache_dir(git_repo: Path, tmp_path: Path) -> Path:
+    dataset = write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), ["a", "b"]
+    )
+    cache_dir = tmp_path / "cache"
+    cache = RetrievalCache(cache_dir / "retrievals")
+    BenchmarkRunner(MissFirstRAG(), cache_dir=cache_dir, retrieval_cache=cache).run(dataset, 3)
+    return cache_dir
+
+
+def _invoke(cache_dir: Path, *args: str):
+    dataset = cache_dir.parent / "dataset.jsonl"
+    command = ["rescore", "--dataset", str(dataset), "--cache-dir", str(cache_dir), *args]
+    return CliRunner().invoke(app, command)
+
+
+def _rescore(cache_dir: Path, *args: str) -> dict:
+    output = cache_dir.parent / "report.json"
+    result = _invoke(cache_dir, "--top-k", "3", "--output", str(output), *args)
+    assert result.exit_code == 0, result.output
+    return json.loads(output.read_text())
+
+
+@pytest.mark.parametrize("score_k, recall", [(1, 0.0), (2, 1.0), (3, 1.0)])
+def test_rescore_truncates_cached_retrievals_to_score_k(
+    cache_dir: Path, score_k: int, recall: float
+) -> None:
+    payload = _rescore(cache_dir, "--score-k", str(score_k), "--content", "none")
+
+    assert payload["aggregate_metrics"]["recall@k"] == recall
+    assert all(len(query["retrieved"]) == score_k for query in payload["queries"])
+
+
+def test_rescore_sweep_reads_past_score_k(cache_dir: Path) -> None:
+    payload = _rescore(cache_dir, "--score-k", "1", "--k", "1,2", "--content", "none")
+
+    points = {point["k"]: point["metrics"] for point in payload["sweep"]["points"]}
+    assert points[1]["recall@k"] == 0.0
+    assert points[2]["recall@k"] == 1.0
+
+
+def test_rescore_rejects_k_beyond_cached_top_k(cache_dir: Path) -> None:
+    result = _invoke(cache_dir, "--top-k", "3", "--score-k", "5")
+
+    assert result.exit_code != 0
+    assert "cannot exceed" in result.output
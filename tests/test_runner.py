@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+import pytest
+from helpers import StubRAG, git, write_dataset
+
+from rag_eval.models import CodeChunk
+from rag_eval.reporting import render_json, render_markdown
+from rag_eval.runner import BenchmarkRunner, RetrievalCache, benchmark_runner
+
+
+def test_code_chunk_accepts_path_file_path() -> None:
+    chunk = CodeChunk(Path("pkg/alpha.py"), 1, 2)
+    assert chunk.file_path == "pkg/alpha.py"
+
+
+def test_compact_run_caches_adapter_content(git_repo: Path, tmp_path: Path) -> None:
+    dataset = write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), ["a", "b"]
+    )
+    cache = RetrievalCache(tmp_path / "retrievals")
+    runner = BenchmarkRunner(
+        StubRAG(), cache_dir=tmp_path / "cache", retrieval_cache=cache, compact=True
+    )
+
+    report = runner.run(dataset)
+
+    assert report.aggregate_metrics["recall@k"] == 1.0
+    (cached,) = cache.find(report.dataset.repo, 5).values()
+    assert {text: [c.content for c in chunks] for text, chunks in cached.items()} == {
+        "a": ["from the adapter"],
+        "b": ["from the adapter"],
+    }
+
+
+class CountingRAG(StubRAG):
+    """Records how much it indexed in a public attribute, as real adapters often do."""
+
+    def __init__(self, model: str = "stub") -> None:
+        super().__init__()
+        self.model = model
+
+    def ingest(self, repo_path: str) -> None:
+        self.chunks_indexed = 2
+
+
+def test_retrieval_cache_hits_after_ingest_changes_adapter_state(
+    git_repo: Path, tmp_path: Path
+) -> None:
+    dataset = write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), ["a", "b"]
+    )
+    cache = RetrievalCache(tmp_path / "retrievals")
+    adapter = CountingRAG()
+    runner = BenchmarkRunner(adapter, cache_dir=tmp_path / "cache", retrieval_cache=cache)
+    assert runner.run(dataset).index_source == "ingest"
+
+    fingerprint = adapter.fingerprint()
+    assert "chunks_indexed" not in fingerprint
+    assert CountingRAG(model="other").fingerprint() != fingerprint
+    for rag in (adapter, CountingRAG()):
+        rag.queries.clear()
+        report = BenchmarkRunner(rag, cache_dir=tmp_path / "cache", retrieval_cache=cache).run(
+            dataset
+        )
+        assert report.index_source == "skipped"
+        assert rag.queries == []
+
+
+def test_cached_compact_run_never_opens_the_repo(
+    git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dataset = write_dataset(
+        tmp_path / "dataset.jsonl", git_repo, git(git_repo, "rev-parse", "HEAD"), ["a", "b"]
+    )
+    cache = RetrievalCache(tmp_path / "retrievals")
+    BenchmarkRunner(StubRAG(), cache_dir=tmp_path / "cache", retrieval_cache=cache).run(dataset)
+
+    prepared = []
+    real_prepare_repo = benchmark_runner.prepare_repo
+
+    def prepare_repo(*args, **kwargs):
+        prepared.append(args)
+        return real_prepare_repo(*args, **kwargs)
+
+    monkeypatch.setattr(benchmark_runner, "prepare_repo", prepare_repo)
+    runner = BenchmarkRunner(
+        StubRAG(), cache_dir=tmp_path / "cache", retrieval_cache=cache, compact=True
+    )
+    report = runner.run(dataset, sweep_ks=[1, 5])
+    render_markdown(report)
+    render_json(report, content="none")
+
+    assert report.index_source == "skipped"
+    assert report.sweep.metrics[(1, 0.5)]["recall@k"] == 1.0
+    assert prepared == []
+
+    # Content is only re-read, from the checkout, when a reporter writes it.
+    payload = json.loads(render_json(report))
+    assert payload["queries"][0]["retrieved"][0]["content"] == "def alpha():\n    return 'alpha'"
+    assert len(prepared) == 1
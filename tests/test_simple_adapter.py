@@ -0,0 +1,89 @@
+import math
+from pathlib import Path
+
+import pytest
+
+from adapters.simple_adapter import SimpleGrepRAG, tokenize
+
+
+@pytest.mark.parametrize(
+    "text, tokens",
+    [
+        ("parseConfig", ["parseconfig", "parse", "config"]),
+        ("parse_config_file", ["parse_config_file", "parse", "config", "file"]),
+        ("HTTPServer v2", ["httpserver", "http", "server", "v2", "v", "2"]),
+        ("x = load(42)", ["x", "load", "42"]),
+    ],
+)
+def test_tokenize_splits_identifiers(text: str, tokens: list[str]) -> None:
+    assert tokenize(text) == tokens
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    root = tmp_path / "corpus"
+    root.mkdir()
+    (root / "a.txt").write_text("alpha beta\n")
+    (root / "b.txt").write_text("alpha alpha\ngamma gamma\n")
+    (root / "c.txt").write_text("delta\n")
+    return root
+
+
+def _bm25(tf: int, df: int, length: int, k1: float = 1.2, b: float = 0.75) -> float:
+    # Three one-window documents of 2, 4 and 1 tokens.
+    total, avg_length = 3, 7 / 3
+    idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+    return idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+
+
+def test_query_ranks_by_bm25(corpus: Path) -> None:
+    rag = SimpleGrepRAG(window=4, stride=4)
+    rag.ingest(str(corpus))
+
+    chunks = rag.query("alpha", top_k=10)
+    assert [(c.file_path, c.start_line, c.end_line) for c in chunks] == [
+        ("b.txt", 1, 2),
+        ("a.txt", 1, 1),
+    ]
+    assert chunks[0].score == pytest.approx(_bm25(tf=2, df=2, length=4))
+    assert chunks[1].score == pytest.approx(_bm25(tf=1, df=2, length=2))
+    assert chunks[0].content == "alpha alpha\ngamma gamma"
+
+    # A rare term outweighs a repeated common one.
+    assert [c.file_path for c in rag.query("alpha delta", top_k=1)] == ["c.txt"]
+    assert rag.query("missing", top_k=10) == []
+
+
+def test_query_keeps_one_window_per_overlapping_cluster(tmp_path: Path) -> None:
+    (tmp_path / "long.txt").write_text("".join(f"line{i} needle\n" for i in range(8)))
+    rag = SimpleGrepRAG(window=4, stride=2)
+    rag.ingest(str(tmp_path))
+
+    # Windows 1-4, 3-6 and 5-8 score alike; 3-6 overlaps the first one taken.
+    spans = [(c.start_line, c.end_line) for c in rag.query("needle", top_k=10)]
+    assert spans == [(1, 4), (5, 8)]
+
+
+def test_save_and_load_index_round_trip(corpus: Path, tmp_path: Path) -> None:
+    rag = SimpleGrepRAG(window=4, stride=4)
+    rag.ingest(str(corpus))
+    index_dir = tmp_path / "index"
+    index_dir.mkdir()
+    rag.save_index(str(index_dir))
+
+    loaded = SimpleGrepRAG(window=4, stride=4)
+    loaded.load_index(str(index_dir))
+
+    for text in ("alpha", "gamma beta", "alpha delta"):
+        assert loaded.query(text, top_k=10) == rag.query(text, top_k=10)
+
+
+def test_query_before_ingest_raises() -> None:
+    with pytest.raises(RuntimeError, match="ingest"):
+        SimpleGrepRAG().query("alpha")
+
+
+@pytest.mark.parametrize("window, stride", [(0, 1), (4, 0), (4, 5)])
+def test_rejects_invalid_windows(window: int, stride: int) -> None:
+    with pytest.raises(ValueError, match="window"):
+        SimpleGrepRAG(window=window, stride=stride)
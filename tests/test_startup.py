@@ -0,0 +1,65 @@
+"""Help output and `datasets list` must not import what only real work needs."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import rag_eval
+
+SRC = Path(rag_eval.__file__).resolve().parents[1]
+
+# `datasets list` only globs a directory, so it is held to the same rule as --help.
+HEAVY_MODULES = ("git", "yaml", "asyncio", "sqlite3", "multiprocessing", "rag_eval.runner")
+
+
+def _imported_modules(argv: list[str], cwd: Path) -> set[str]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(SRC), os.environ.get("PYTHONPATH", "")]),
+    }
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "rag_eval", *argv],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | <indent>module".
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--help"],
+        ["run", "--help"],
+        ["rescore", "--help"],
+        ["loadtest", "--help"],
+        ["matrix", "--help"],
+        ["history", "--help"],
+        ["compare", "--help"],
+        ["datasets", "--help"],
+        ["datasets", "list"],
+        ["datasets", "validate", "--help"],
+    ],
+    ids=" ".join,
+)
+def test_startup_skips_heavy_imports(argv: list[str], tmp_path: Path) -> None:
+    (tmp_path / "datasets").mkdir()
+    modules = _imported_modules(argv, cwd=tmp_path)
+
+    heavy = sorted(
+        module
+        for module in modules
+        if any(module == name or module.startswith(f"{name}.") for name in HEAVY_MODULES)
+    )
+    assert heavy == []
+    assert "rag_eval.cli" in modules
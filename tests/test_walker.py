@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from rag_eval import walker
+from rag_eval.walker import DEFAULT_MAX_BYTES, walk_repo
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG\0" + b"x" * 20_000)
+    (tmp_path / "late_nul.txt").write_bytes(b"a" * 9000 + b"\0")
+    (tmp_path / "latin1.txt").write_bytes("caf\xe9".encode("latin-1"))
+    (tmp_path / "bundle.js").write_text("x" * (DEFAULT_MAX_BYTES + 1))
+    return tmp_path
+
+
+def test_walk_repo_skips_binary_invalid_and_oversized_files(tree: Path) -> None:
+    assert [f.path for f in walk_repo(tree)] == ["late_nul.txt", "src/app.py"]
+    assert [f.path for f in walk_repo(tree, max_bytes=None)] == [
+        "bundle.js",
+        "late_nul.txt",
+        "src/app.py",
+    ]
+    assert [f.path for f in walk_repo(tree, paths=["src/app.py", "gone.py"])] == ["src/app.py"]
+
+
+def test_binary_files_are_rejected_after_one_sniff(
+    tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reads = []
+    real_open = Path.open
+
+    def recording_open(self: Path, *args, **kwargs):
+        handle = real_open(self, *args, **kwargs)
+        real_read = handle.read
+
+        def read(size: int = -1) -> bytes:
+            data = real_read(size)
+            reads.append((self.name, len(data)))
+            return data
+
+        handle.read = read
+        return handle
+
+    monkeypatch.setattr(Path, "open", recording_open)
+
+    assert walker._read_text(tree / "logo.png", max_bytes=None) is None
+    assert reads == [("logo.png", 8000)]
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from rag_eval.runner import AdapterWorkerPool
+from rag_eval.runner.worker_pool import WorkerCrashed
+
+
+def test_crashed_worker_is_restarted_with_the_current_index(tmp_path: Path) -> None:
+    with AdapterWorkerPool("pool_adapters:RecordingAdapter", workers=2) as pool:
+        pool.ingest(str(tmp_path))
+
+        with pytest.raises(WorkerCrashed):
+            pool.query("crash")
+
+        # Both workers, including the restarted one, answer from the same index.
+        answers = {pool.query("where", top_k=1)[0].content for _ in range(4)}
+        assert answers == {str(tmp_path)}
+
+
+def test_workers_get_private_data_dirs(tmp_path: Path) -> None:
+    shared = str(tmp_path / "data")
+    with AdapterWorkerPool(
+        "pool_adapters:DiskAdapter", options={"data_dir": shared}, workers=2
+    ) as pool:
+        data_dirs = {pool.query("where", top_k=1)[0].content for _ in range(4)}
+        fingerprint = pool.fingerprint()
+
+    assert data_dirs == {str(Path(shared) / "worker-0"), str(Path(shared) / "worker-1")}
+    assert repr(shared) in fingerprint